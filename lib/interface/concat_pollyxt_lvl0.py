@@ -328,9 +328,8 @@ def get_pollyxt_files():
 
 def get_pollyxt_logbook_files():
     '''
-        This function locates multiple pollyxt logbook-zip files from one day measurements,
-        unzipps the files to output_path
-        and  merge them to one file
+        This function locates multiple pollyxt logbook-zip files from one day measurements
+        and streams their members into one merged file in output_path
     '''
     input_path = get_input_path(timestamp,device,raw_folder) 
     path_exist = Path(input_path)
@@ -357,54 +356,28 @@ def get_pollyxt_logbook_files():
             print('no laserlogbook-files found!')
             sys.exit()
 
-        polly_laserlog_files_list = []
-        to_unzip_list = []
-        for zip_file in polly_laserlog_zip_files_list:
-            unzipped_logtxt = Path(zip_file).name
-            unzipped_logtxt = Path(unzipped_logtxt).stem
-            unzipped_logtxt = Path(output_path,unzipped_logtxt)
-            polly_laserlog_files_list.append(unzipped_logtxt)
-            path = Path(unzipped_logtxt)
-
-            to_unzip_list.append(zip_file)
-
-        
-        ## unzipping
-        if len(to_unzip_list) > 0:
-            for zip_file in to_unzip_list:
-                with ZipFile(zip_file, 'r') as zip_ref:
-                    print("unzipping "+zip_file)
-                    zip_ref.extractall(output_path)
-    
         ## sort lists
-        polly_laserlog_files_list.sort()
+        polly_laserlog_zip_files_list.sort()
 
-        print("\n"+str(len(polly_laserlog_files_list))+" laserlogfiles found:\n")
-        print(polly_laserlog_files_list)
+        print("\n"+str(len(polly_laserlog_zip_files_list))+" laserlogfiles found:\n")
+        print(polly_laserlog_zip_files_list)
         print("\n")
 
-        ## concat the txt files
-        result_file = Path(output_path,"result.txt")
-        with open(result_file, "wb") as outfile:
-            for logf in polly_laserlog_files_list:
-                with open(logf, "rb") as infile:
-                    outfile.write(infile.read())
-                ## delete every single logbook-file from unzipped-folder
-                os.remove(logf)
-
-        laserlog_filename = polly_laserlog_files_list[0]
-        laserlog_filename = Path(laserlog_filename).name
+        laserlog_filename = Path(polly_laserlog_zip_files_list[0]).stem
         laserlog_filename_left = re.split(r'_[0-9][0-9]_[0-9][0-9]_[0-9][0-9]\.nc',laserlog_filename)[0]
         laserlog_filename = f'{laserlog_filename_left}_00_00_01.nc.laserlogbook.txt'
         destination_file = Path(output_path,laserlog_filename)
-        
-        # Open the source file in binary mode and read its content
-        with open(result_file, 'rb') as source:
-            # Open the destination file in binary mode and write the content
-            with open(destination_file, 'wb') as destination:
-                destination.write(source.read())
 
-        os.remove(result_file)
+        ## stream the zip-members into the merged file, without extracting them
+        with open(destination_file, 'wb') as destination:
+            for zip_file in polly_laserlog_zip_files_list:
+                with ZipFile(zip_file, 'r') as zip_ref:
+                    print("unzipping "+zip_file)
+                    for member_name in sorted(zip_ref.namelist()):
+                        if member_name.endswith('/'):
+                            continue
+                        with zip_ref.open(member_name) as member:
+                            shutil.copyfileobj(member, destination, 1024*1024)
     else:
         print("\nNo laserlogbook was found in {}. Correct path?\n".format(input_path))
     
@@ -5177,6 +5177,10 @@ if PicassoConfig.flagEnableDataVisualization
         %pythonPath = '/lacroshome/cloudnetpy/cloudnetpy-env/bin/python3';
         pythonScript = fullfile(PicassoDir, 'lib', 'visualization', 'pypolly_display_all.py');
         measurement_date = [datestr(PollyDataInfo.dataTime, 'yyyy'), datestr(PollyDataInfo.dataTime, 'mm'), datestr(PollyDataInfo.dataTime, 'dd')];
+        if isfield(PicassoConfig, 'flagUsePyRenderServer') && PicassoConfig.flagUsePyRenderServer
+            %% send the job to a running pypolly_render_server.py (plots locally, if none is running)
+            pythonScript = sprintf('%s render --fallback', fullfile(PicassoDir, 'lib', 'visualization', 'pypolly_render_server.py'));
+        end
         pypolly_command = sprintf('%s %s --date %s --device %s --picasso_config_file %s --polly_config_file %s --outdir %s --retrieval all --donefilelist true', pythonPath, pythonScript, measurement_date, pollyType, PicassoConfigFile, PollyConfig.pollyConfigFile, PicassoConfig.pic_folder);
         disp(pypolly_command);
 %        [status, output] = system(pypolly_command);
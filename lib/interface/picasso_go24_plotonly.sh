@@ -9,10 +9,11 @@ display_help() {
   echo "Plotting of already processed polly level1 data."
   echo "   -s, --startdate	specify startdate YYYYMMDD"
   echo "   -e, --enddate        specify enddate YYYYMMDD"
-  echo "   -d, --device         specify device, e.g. pollyxt_lacros"
+  echo "   -d, --device         specify device(s), e.g. pollyxt_lacros or \"pollyxt_lacros arielle\""
   echo "   -c, --config_file    specify Picasso configuration file, e.g.: ~/Pollynet_Processing_Chain/config/pollynet_processing_chain_config_rsd2_andi.json"
   echo "   --flag_donefilelist   set flag for writing metainfo of plotted files into donefilelist, specified in picasso-config"
   echo "   -r, --retrieval    specify retrieval to be plotted [choices: 'all', 'attbsc', 'voldepol', 'cloudinfo', 'target_class', 'wvmr_rh', 'quasi_results', 'profiles', 'overlap']; default is set to 'all'"
+  echo "   -j, --jobs           number of processes for plotting; default is 1"
   echo "   -h, --help           show help message"
   echo
   exit 1
@@ -22,6 +23,7 @@ display_help() {
 PICASSO_CONFIG_FILE=""
 RETRIEVAL="all"
 flagDONEFILELIST="false"
+JOBS=1
 PICASSO_DIR_interface="$( cd "$(dirname "$0")" ; pwd -P )"
 PICASSO_DIR="$(dirname "$(dirname "$PICASSO_DIR_interface")")"
 #PICASSO_DIR="$(dirname "$(dirname "$( cd "$(dirname "$0")" ; pwd -P )")")"
@@ -73,6 +75,13 @@ while :; do
     shift 2
     ;;
 
+  -j | --jobs)
+    if [ $# -ne 0 ]; then
+      JOBS="$2"
+    fi
+    shift 2
+    ;;
+
   -h | --help)
     display_help # Call your function
     exit 0
@@ -101,74 +110,17 @@ done
 # getting "pic_folder" from config_file
 #PIC_FOLDER=`cat ${PICASSO_CONFIG_FILE} | jq -r ."pic_folder"`
 
-# getting "results_folder" from config_file
-POLLY_LEVEL1_BASEFOLDER=`cat ${PICASSO_CONFIG_FILE} | jq -r ."results_folder"`
-
 # getting "python_folder" from config_file
 PY_FOLDER=`cat ${PICASSO_CONFIG_FILE} | jq -r ."pyBinDir"`
 echo $PY_FOLDER
 echo $RETRIEVAL
 
 
-create_date_ls() {
-## create DATE_LS
-    dates=()
-    for (( date=STARTDATE; date <= ENDDATE; )); do
-        dates+=( "$date" )
-        date="$(date --date="$date +1 days" +'%Y%m%d')"
-    done
-    
-    for i in ${dates[@]}; do
-    	YYYY=${i:0:4}
-    	MM=${i:4:2}
-    	DD=${i:6:2}
-    	YYYYMMDD=$YYYY$MM$DD
-    	DATE_LS+=( "$YYYYMMDD" )
-    done
-}
-
 main() {
 
-	create_date_ls
-	
-	for DEVICE in ${DEVICE_LS[@]}; do
-	    echo $DEVICE
-	    for DATE in ${DATE_LS[@]}; do
-	        echo $DATE
-            ## check number of available level1-files
-            ## 24h-file vs. multiple individual processed files
-            PATTERN="*[0-9][0-9]_att_bsc*.nc"
-            YYYY=${DATE:0:4}
-            MM=${DATE:4:2}
-            DD=${DATE:6:2}
-            POLLY_LEVEL1_FOLDER="$POLLY_LEVEL1_BASEFOLDER/$DEVICE/$YYYY/$MM/$DD"
-            file_count=$(find "$POLLY_LEVEL1_FOLDER" -type f -name "$PATTERN" | wc -l)
-            if [ "$file_count" -eq 0 ]; then
-                echo "No matching file exists in $POLLY_LEVEL1_FOLDER."
-                echo "Continuing..."
-            elif [ "$file_count" -eq 1 ]; then
-                echo "One matching file exists in $POLLY_LEVEL1_FOLDER."
-                "$PY_FOLDER"python "$PICASSO_DIR"/lib/visualization/pypolly_display_all.py --date $DATE --device $DEVICE --picasso_config $PICASSO_CONFIG_FILE  --retrieval $RETRIEVAL --donefilelist $flagDONEFILELIST
-            elif [ "$file_count" -gt 1 ]; then
-                echo "More than one matching file exists in $POLLY_LEVEL1_FOLDER."
-                "$PY_FOLDER"python "$PICASSO_DIR"/lib/visualization/pypolly_display_all.py --date $DATE --device $DEVICE --picasso_config $PICASSO_CONFIG_FILE  --retrieval $RETRIEVAL --donefilelist $flagDONEFILELIST
-            fi
-
-#            if [[ "$flagWriteIntoTodoList" == "true" ]];then
-#            	check_todo_list_consistency
-#	            write_job_into_todo_list $DEVICE $DATE ## writing job to todo_list
-#            fi
-#		    ## OPTION 1: process every single task???
-#            if [[ "$flagProc" == "true" ]];then
-#		        process_merged ## process actual merged file with picasso - written in todo_list
-#            fi
-#            if [[ "$flagDeleteMergedFiles" == "true" ]];then
-#		        delete_level0_merged_file $DEVICE $DATE ## delete level0 24h-file
-#                delete_laserlogbookfile $DEVICE $DATE ## delete laserlogbook-file
-#		        delete_entry_from_todo_list $DEVICE $DATE ## delete entry from todo_list file
-#            fi
-	    done
-	done
+    ## all devices and dates are plotted by one python process,
+    ## days without level1-files are skipped by pypolly_display_all.py
+    "$PY_FOLDER"python "$PICASSO_DIR"/lib/visualization/pypolly_display_all.py --start-date $STARTDATE --end-date $ENDDATE --device ${DEVICE_LS[@]} --picasso_config $PICASSO_CONFIG_FILE  --retrieval $RETRIEVAL --donefilelist $flagDONEFILELIST --jobs $JOBS
 }
 
 ## execute main function
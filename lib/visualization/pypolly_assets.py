@@ -0,0 +1,172 @@
+import os
+import matplotlib
+import matplotlib.image
+from matplotlib import font_manager
+from matplotlib.colors import ListedColormap
+import python_colormap
+
+## named colormaps of python_colormap
+COLORMAPS = {'chiljet': python_colormap.chiljet_colormap,
+             'eleni': python_colormap.eleni_colormap,
+             'calipso': python_colormap.calipso_colormap_gray_inv,
+             'labview': python_colormap.labivew_colormap,
+             'target_classification': python_colormap.target_classification_colormap,
+             'signal_status': python_colormap.signal_status_colormap}
+
+## the CC BY SA license of the watermark
+LICENSE_IMAGE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'img', 'by-sa.png')
+
+_LICENSE_IMAGE = None
+_COLORMAPS = {}
+_FONTS = {}
+
+
+def get_license_image():
+    """
+    Description
+    -----------
+    The license image of the watermark, read once per process. The array is
+    shared by all figures and therefore read-only.
+
+    Usage
+    -----
+    newax_license.imshow(get_license_image(), alpha=0.8, aspect='equal')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    global _LICENSE_IMAGE
+    if _LICENSE_IMAGE is None:
+        im_license = matplotlib.image.imread(LICENSE_IMAGE_FILE)
+        im_license.setflags(write=False)
+        _LICENSE_IMAGE = im_license
+    return _LICENSE_IMAGE
+
+
+def get_colormap(name, bad=None):
+    """
+    Description
+    -----------
+    Named colormap of python_colormap (see COLORMAPS) with the color of
+    bad values, built once per process. The colormap is shared by all
+    figures, so it must not be changed, e.g. by set_bad; use the bad
+    argument instead.
+
+    Parameters
+    ----------
+    name: str
+        key of COLORMAPS, e.g. colormap_basic of the polly config.
+    bad: str
+        color of nan- and masked values, None keeps the one of the colormap.
+
+    Usage
+    -----
+    cmap = get_colormap(colormap_basic, bad='white')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    key = (name, bad)
+    if key not in _COLORMAPS:
+        if name not in COLORMAPS:
+            raise RuntimeWarning('Unknown colormap: {0}'.format(name))
+        cmap = COLORMAPS[name]()
+        _COLORMAPS[key] = cmap if bad is None else cmap.with_extremes(bad=bad)
+    return _COLORMAPS[key]
+
+
+def get_listed_colormap(colors, bad=None):
+    """
+    Description
+    -----------
+    ListedColormap of colors with the color of bad values, built once per
+    process for every list of colors, e.g. the legend keys of the target
+    classification in the nc-file. Shared like get_colormap.
+
+    Parameters
+    ----------
+    colors: list
+        colors of the colormap, as rgb-lists or names.
+    bad: str
+        color of nan- and masked values.
+
+    Usage
+    -----
+    cmap = get_listed_colormap(TC_color_matrix, bad='white')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    key = (tuple(color if isinstance(color, str) else tuple(float(c) for c in color) for color in colors), bad)
+    if key not in _COLORMAPS:
+        cmap = ListedColormap(colors)
+        _COLORMAPS[key] = cmap if bad is None else cmap.with_extremes(bad=bad)
+    return _COLORMAPS[key]
+
+
+def use_font(fontname):
+    """
+    Description
+    -----------
+    Make fontname the sans-serif font of the following figures. The font
+    file is looked up once per process and the rcParams are only changed,
+    if the font changes.
+
+    Parameters
+    ----------
+    fontname: str
+        fontname of the picasso config.
+
+    Returns
+    -------
+    fontfile: str
+        the font file used by matplotlib.
+
+    Usage
+    -----
+    use_font(config_dict['fontname'])
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if matplotlib.rcParams['font.sans-serif'] != [fontname] or matplotlib.rcParams['font.family'] != ['sans-serif']:
+        matplotlib.rcParams['font.sans-serif'] = fontname
+        matplotlib.rcParams['font.family'] = "sans-serif"
+    if fontname not in _FONTS:
+        _FONTS[fontname] = font_manager.findfont(font_manager.FontProperties(family=['sans-serif']))
+    return _FONTS[fontname]
+
+
+def preload(fontname=None):
+    """
+    Description
+    -----------
+    Load all static assets: the license image, every named colormap (with
+    the bad colors of the quicklooks) and the font, e.g. in the worker
+    processes of the render server before the first job.
+
+    Parameters
+    ----------
+    fontname: str
+        fontname of the picasso config, None skips the font.
+
+    Usage
+    -----
+    preload(config_dict['fontname'])
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    get_license_image()
+    for name in COLORMAPS:
+        get_colormap(name)
+        get_colormap(name, bad='white')
+        get_colormap(name, bad='black')
+    if fontname is not None:
+        use_font(fontname)
@@ -0,0 +1,350 @@
+import sys
+import time
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+## entry points of the visualization, which are started once per processed file
+STARTUP_MODULES = ('pypolly_display_all', 'pypolly_readout', 'pypolly_job_graph')
+
+## modules, which must not be executed by importing an entry point
+HEAVY_MODULES = ('matplotlib', 'pandas', 'scipy', 'netCDF4', 'sqlite3',
+                 'python_colormap', 'pypolly_display_3d_plots', 'pypolly_display_profiles')
+
+## import time budget [s] of an entry point on top of the bare interpreter start
+STARTUP_BUDGET = 0.5
+
+_LOADED_HEAVY_MODULES = '''
+import sys, json, importlib
+importlib.import_module({module!r})
+## modules of readout.lazy_import are in sys.modules, but not yet executed
+loaded = [name for name in {heavy!r}
+          if name in sys.modules and type(sys.modules[name]).__name__ != '_LazyModule']
+print(json.dumps(loaded))
+'''
+
+
+def _run_python(args):
+    ## wall time [s] of a fresh interpreter running args in this folder, and its stdout
+    t0 = time.perf_counter()
+    result = subprocess.run([sys.executable] + list(args), cwd=Path(__file__).parent,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - t0
+    if result.returncode != 0:
+        raise RuntimeError(f'python {" ".join(args)} failed:\n{result.stderr}')
+    return elapsed, result.stdout
+
+
+def _best_of(args, repeat):
+    return min(_run_python(args)[0] for _ in range(repeat))
+
+
+def benchmark_startup(budget=STARTUP_BUDGET, repeat=5):
+    """
+    Description
+    -----------
+    Measure the import time of the entry points of the visualization in
+    fresh interpreters (best of repeat runs, minus the start of a bare
+    interpreter) and check, that no heavy dependency is executed on import.
+
+    Parameters
+    ----------
+    budget: float
+        allowed import time [s] per entry point.
+    repeat: int
+        number of runs per measurement.
+
+    Returns
+    -------
+    report: dict
+        {'baseline_s', 'budget_s', 'entries': [{'name', 'import_s', 'heavy_modules', 'ok'}], 'ok'}
+
+    Usage
+    -----
+    report = benchmark_startup(budget=0.5)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    baseline = _best_of(['-c', 'pass'], repeat)
+    entries = []
+    for module in STARTUP_MODULES:
+        import_s = _best_of(['-c', f'import {module}'], repeat) - baseline
+        heavy = json.loads(_run_python(['-c', _LOADED_HEAVY_MODULES.format(module=module, heavy=HEAVY_MODULES)])[1].splitlines()[-1])
+        entries.append({'name': f'import {module}', 'import_s': import_s, 'heavy_modules': heavy,
+                        'ok': import_s <= budget and not heavy})
+    help_s = _best_of(['pypolly_display_all.py', '--help'], repeat) - baseline
+    entries.append({'name': 'pypolly_display_all.py --help', 'import_s': help_s, 'heavy_modules': [],
+                    'ok': help_s <= budget})
+    return {'baseline_s': baseline, 'budget_s': budget, 'entries': entries,
+            'ok': all(entry['ok'] for entry in entries)}
+
+
+def print_startup_report(report):
+    print(f'interpreter start: {report["baseline_s"]:.3f} s, budget per entry point: {report["budget_s"]:.3f} s')
+    for entry in report['entries']:
+        status = 'ok' if entry['ok'] else 'FAILED'
+        line = f'{entry["name"]:<40} {entry["import_s"]:7.3f} s  {status}'
+        if entry['heavy_modules']:
+            line = f'{line}  (imports {", ".join(entry["heavy_modules"])})'
+        print(line)
+
+
+def benchmark_assets(colormap='chiljet', fontname='DejaVu Sans', repeat=20):
+    """
+    Description
+    -----------
+    Time per figure for the static assets of a quicklook: reading the
+    license image, building the colormap with its bad color and setting
+    the font, as every plot function did before, and with the shared
+    assets of pypolly_assets.
+
+    Parameters
+    ----------
+    colormap: str
+        name of the colormap, see pypolly_assets.COLORMAPS.
+    fontname: str
+        the font.
+    repeat: int
+        number of figures.
+
+    Returns
+    -------
+    report: dict
+        {'per_figure_s': {'reload': ..., 'shared': ...}, 'saving_s', 'repeat'}
+
+    Usage
+    -----
+    report = benchmark_assets(colormap='chiljet', repeat=20)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    import matplotlib
+    import matplotlib.image
+    from matplotlib import font_manager
+    import python_colormap
+    import pypolly_assets as assets
+
+    def reload_assets():
+        matplotlib.image.imread(assets.LICENSE_IMAGE_FILE)
+        cmap = python_colormap.load_colormap(name=colormap)
+        cmap.set_bad(color='white')
+        matplotlib.rcParams['font.sans-serif'] = fontname
+        matplotlib.rcParams['font.family'] = "sans-serif"
+        font_manager.findfont(font_manager.FontProperties(family=['sans-serif']))
+
+    def shared_assets():
+        assets.get_license_image()
+        assets.get_colormap(colormap, bad='white')
+        assets.use_font(fontname)
+
+    per_figure = {}
+    for name, load in (('reload', reload_assets), ('shared', shared_assets)):
+        ## the first call builds the caches of matplotlib and pypolly_assets
+        load()
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            load()
+        per_figure[name] = (time.perf_counter() - t0) / repeat
+    return {'per_figure_s': per_figure, 'saving_s': per_figure['reload'] - per_figure['shared'], 'repeat': repeat}
+
+
+def print_assets_report(report):
+    per_figure = report['per_figure_s']
+    print(f'static assets per figure ({report["repeat"]} figures):')
+    print(f'{"reloaded per figure":<40} {per_figure["reload"] * 1e3:9.3f} ms')
+    print(f'{"shared (pypolly_assets)":<40} {per_figure["shared"] * 1e3:9.3f} ms')
+    print(f'{"saving per figure":<40} {report["saving_s"] * 1e3:9.3f} ms')
+
+
+## imgFormat and image options (see pypolly_readout.image_options) compared by benchmark_encode
+ENCODE_CHOICES = (('png', {}),
+                  ('png', {'pngCompressLevel': 1}),
+                  ('png', {'pngCompressLevel': 3}),
+                  ('png', {'pngCompressLevel': 9}),
+                  ('png', {'pngIndexed': True}),
+                  ('png', {'pngIndexed': True, 'pngCompressLevel': 1}),
+                  ('webp', {'webpLossless': True}),
+                  ('webp', {'webpLossless': False}),
+                  ('jpg', {}))
+
+
+def _encode(rgba, imgFormat, options, buf, colors):
+    ## encode rgba as fig.savefig via pypolly_readout.save_figure would do it, False if an
+    ## indexed png-file falls back to RGBA
+    from PIL import Image
+    import pypolly_readout as readout
+    pil_kwargs = readout.get_pil_kwargs(imgFormat, options)
+    if imgFormat == 'png' and options.get('pngIndexed'):
+        return readout.write_indexed_png(rgba, buf, colors, **pil_kwargs)
+    if imgFormat == 'jpg':
+        Image.fromarray(rgba, 'RGBA').convert('RGB').save(buf, format='jpeg', **pil_kwargs)
+    else:
+        Image.fromarray(rgba, 'RGBA').save(buf, format=imgFormat, **pil_kwargs)
+    return True
+
+
+def benchmark_encode(images, colormap='labview', repeat=1):
+    """
+    Description
+    -----------
+    Encode time and file size of the quicklooks for every imgFormat and
+    image option of ENCODE_CHOICES. The images, e.g. the png-files of the
+    quicklooks of some level1 days, are decoded and encoded again, so only
+    the encoder is timed, not the drawing of the figures. The indexed
+    png-files are written as by save_figure, with the colors of colormap
+    kept; images with too many of them are saved as RGBA (fallbacks), as
+    always with the default colormaps labview and chiljet.
+
+    Parameters
+    ----------
+    images: list
+        png-files or folders, which are searched for png-files.
+    colormap: str
+        the colormap of the images (see pypolly_assets.get_colormap), e.g.
+        colormap_basic of the polly config or target_classification.
+    repeat: int
+        encodings per image and choice, the fastest one counts.
+
+    Returns
+    -------
+    report: dict
+        {'images', 'pixels', 'choices': [{'imgFormat', 'options', 'encode_s', 'bytes', 'max_error', 'fallbacks'}]},
+        encode_s and bytes summed over the images, max_error the largest
+        difference of a color value to the original image (0 is lossless),
+        fallbacks the number of images saved as RGBA instead of indexed.
+
+    Usage
+    -----
+    report = benchmark_encode(['/data/pic/arielle/2024/05/06'], colormap='labview')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    import io
+    import numpy as np
+    from PIL import Image
+    import pypolly_assets as assets
+    import pypolly_figure_templates as figure_templates
+
+    ## the colormaps of the quicklooks have the bad color white, see pypolly_display_3d_plots
+    colors = figure_templates.colormap_lut(assets.get_colormap(colormap, bad='white'))
+
+    files = []
+    for image in images:
+        image = Path(image)
+        files.extend(sorted(image.rglob('*.png')) if image.is_dir() else [image])
+    if not files:
+        raise ValueError(f'no png-files in {" ".join(map(str, images))}')
+
+    choices = [{'imgFormat': imgFormat, 'options': options, 'encode_s': 0.0, 'bytes': 0, 'max_error': 0, 'fallbacks': 0}
+               for imgFormat, options in ENCODE_CHOICES]
+    pixels = 0
+    for file in files:
+        with Image.open(file) as im:
+            rgba = np.asarray(im.convert('RGBA'))
+        pixels += rgba.shape[0] * rgba.shape[1]
+        for choice in choices:
+            best = None
+            for _ in range(repeat):
+                buf = io.BytesIO()
+                t0 = time.perf_counter()
+                encoded = _encode(rgba, choice['imgFormat'], choice['options'], buf, colors)
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            choice['encode_s'] += best
+            choice['fallbacks'] += not encoded
+            choice['bytes'] += buf.tell()
+            buf.seek(0)
+            with Image.open(buf) as im:
+                decoded = np.asarray(im.convert('RGBA'))
+            ## jpeg has no alpha, the quicklooks are opaque
+            error = np.abs(decoded[..., :3].astype(np.int16) - rgba[..., :3]).max()
+            choice['max_error'] = max(choice['max_error'], int(error))
+    return {'images': len(files), 'pixels': pixels, 'choices': choices}
+
+
+def print_encode_report(report):
+    print(f'encoding of {report["images"]} images ({report["pixels"] / report["images"] / 1e6:.2f} Mpixel per image):')
+    reference = report['choices'][0]
+    print(f'{"imgFormat and options":<48} {"ms/image":>9} {"kB/image":>9} {"size":>6} {"max error":>9} {"fallbacks":>9}')
+    for choice in report['choices']:
+        options = ', '.join(f'{key}={value}' for key, value in choice['options'].items()) or 'default'
+        print(f'{choice["imgFormat"] + " " + options:<48} '
+              f'{choice["encode_s"] / report["images"] * 1e3:9.1f} '
+              f'{choice["bytes"] / report["images"] / 1e3:9.1f} '
+              f'{choice["bytes"] / reference["bytes"]:6.2f} '
+              f'{choice["max_error"]:9d} '
+              f'{choice["fallbacks"]:9d}')
+
+
+def get_arg_parser():
+    my_parser = argparse.ArgumentParser(description='Benchmarks of the python visualization of PollyNET.')
+    subparsers = my_parser.add_subparsers(dest='benchmark', required=True)
+
+    startup_parser = subparsers.add_parser('startup', help='import time of the entry points and heavy dependencies loaded on import.')
+    startup_parser.add_argument('--budget', dest='budget',
+                                type=float,
+                                default=STARTUP_BUDGET,
+                                help=f'allowed import time [s] per entry point. Default is {STARTUP_BUDGET}.')
+    startup_parser.add_argument('--repeat', dest='repeat',
+                                type=int,
+                                default=5,
+                                help='runs per measurement, the fastest one counts. Default is 5.')
+
+    assets_parser = subparsers.add_parser('assets', help='time per figure for the license image, colormap and font, reloaded and shared.')
+    assets_parser.add_argument('--colormap', dest='colormap',
+                               type=str,
+                               default='chiljet',
+                               help='the colormap. Default is chiljet.')
+    assets_parser.add_argument('--fontname', dest='fontname',
+                               type=str,
+                               default='DejaVu Sans',
+                               help='the font. Default is DejaVu Sans.')
+    assets_parser.add_argument('--repeat', dest='repeat',
+                               type=int,
+                               default=20,
+                               help='number of figures. Default is 20.')
+
+    encode_parser = subparsers.add_parser('encode', help='encode time and file size of quicklooks for every imgFormat and image option.')
+    encode_parser.add_argument('images', metavar='images',
+                               type=str,
+                               nargs='+',
+                               help='png-files of quicklooks or folders with them, e.g. the quicklooks of some level1 days.')
+    encode_parser.add_argument('--colormap', dest='colormap',
+                               type=str,
+                               default='labview',
+                               help='the colormap of the quicklooks, whose colors the indexed png-files keep. Default is labview.')
+    encode_parser.add_argument('--repeat', dest='repeat',
+                               type=int,
+                               default=1,
+                               help='encodings per image and choice, the fastest one counts. Default is 1.')
+    return my_parser
+
+
+def main(argv=None):
+    args = get_arg_parser().parse_args(argv)
+
+    if args.benchmark == 'startup':
+        report = benchmark_startup(budget=args.budget, repeat=args.repeat)
+        print_startup_report(report)
+        return 0 if report['ok'] else 1
+
+    if args.benchmark == 'assets':
+        report = benchmark_assets(colormap=args.colormap, fontname=args.fontname, repeat=args.repeat)
+        print_assets_report(report)
+        return 0
+
+    if args.benchmark == 'encode':
+        report = benchmark_encode(args.images, colormap=args.colormap, repeat=args.repeat)
+        print_encode_report(report)
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
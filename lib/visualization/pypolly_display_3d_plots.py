@@ -8,12 +8,12 @@ import os
 import re
 import sys
 import time
-import scipy.io as spio
 import numpy as np
 from datetime import datetime, timedelta, timezone
 import matplotlib
-import argparse
 import pypolly_readout as readout
+import pypolly_figure_templates as figure_templates
+import pypolly_assets as assets
 #import statistics
 #from statistics import mode
 
@@ -30,7 +30,7 @@ plt.switch_backend('Agg')
 
 
 
-def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength, param,donefilelist_dict):
+def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength, param,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -42,6 +42,8 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
         dict wich stores the att-bsc data.
     wavelength: int
         the selected wavelength channel: e.g.: 355/532/1064 nm
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -82,6 +84,8 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
 
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
 #    LCUsed = np.array([nc_dict[f'attenuated_backscatter_{wavelength}nm___Lidar_calibration_constant_used']])
     LCUsed = nc_dict[f'attenuated_backscatter_{wavelength}nm___Lidar_calibration_constant_used']
 
@@ -96,8 +100,7 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
         dataFilename = re.split(r'_OC_att_bsc',nc_dict['PollyDataFile'])[0]
 
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     if param == 'FR':
         plotfile = f'{dataFilename}_ATT_BETA_{wavelength}.{imgFormat}'
@@ -115,26 +118,22 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     saveFilename = os.path.join(saveFolder,plotfile)
     saveFilename_SNR = os.path.join(saveFolder,plotfile_SNR)
 
-    ## fill time gaps in att_bsc matrix
-    ATT_BETA, quality_mask_ATT = readout.fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask)
-    
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
+    ## fill time gaps in att_bsc (and snr) matrix
+    if param == 'FR' or param == 'NR':
+        ATT_BETA, SNR, quality_mask_ATT = time_grid.regrid([ATT_BETA, SNR, quality_mask], fill_values=[None, None, -1])
+    else:
+        ATT_BETA, quality_mask_ATT = time_grid.regrid([ATT_BETA, quality_mask], fill_values=[None, -1])
     
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
 
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     ATT_BETA = np.ma.masked_where(quality_mask_ATT < 0, ATT_BETA)
@@ -143,117 +142,44 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     ATT_BETA = ATT_BETA[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    ATT_BETA = time_grid.trim(ATT_BETA)
 
     ## transpose and flip for correct plotting
     ATT_BETA= np.ma.transpose(ATT_BETA)  ## matrix has to be transposed for usage with pcolormesh!
     ATT_BETA= np.flip(ATT_BETA,0)
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
 #    cmap = copy.copy(plt.cm.turbo)
 #    colormap_basic = "turbo"
 #    import copy
 #    cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            ATT_BETA * 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Attenuated Backscatter at {wave} nm'.format(wave = wavelength) +
-        ' {param} of {instrument} at {location}'.format(
-            param=param,
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-#    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=10)
-    cbar.ax.set_title('      $\mathrm{Mm^{-1}\,sr^{-1}}$\n', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
     if isinstance(LCUsed,float):
         pass
     else:
         LCUsed = np.nan
-    fig.text(
-        0.05, 0.02,
-        '{0}\nLC: {1:.2e}'.format(
-            nc_dict['m_date'],
-            LCUsed), fontsize=12)
-
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
+            ATT_BETA * 1e6,
+            extent,
+            title='Attenuated Backscatter at {wave} nm'.format(wave = wavelength) +
+                  ' {param} of {instrument} at {location}'.format(
+                      param=param,
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      $\mathrm{Mm^{-1}\,sr^{-1}}$\n',
+            info_text='{0}\nLC: {1:.2e}'.format(nc_dict['m_date'], LCUsed),
+            version_text='Version: {version}\nCalibration: {method}'.format(version=version, method=flagLC),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     
 
@@ -283,18 +209,15 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
 
     ## plotting SNR
     if param == 'FR' or param == 'NR':
-        ## fill time gaps in snr matrix
-        SNR, quality_mask_SNR = readout.fill_time_gaps_of_matrix(time, SNR, quality_mask)
-
         ## mask matrix
-        SNR = np.ma.masked_where(quality_mask_SNR < 0, SNR)
+        SNR = np.ma.masked_where(quality_mask_ATT < 0, SNR)
 
 
         ## slice matrix to max_height
         SNR = SNR[:,0:len(max_height)]
 
         ## trimm matrix to last available timestamp if neccessary
-        SNR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+        SNR = time_grid.trim(SNR)
 	
         zLim = [np.nanmin(SNR), np.nanmax(SNR)]
     
@@ -302,97 +225,26 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
         SNR = np.ma.transpose(SNR)  ## matrix has to be transposed for usage with pcolormesh!
         SNR = np.flip(SNR,0)
         print(f"plotting {plotfile_SNR} ... ")
+        readout.profile_switch('draw')
         # display attenuate backscatter
-        fig = plt.figure(figsize=[12, 6])
-        ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-        pcmesh = ax.imshow(
+        template = figure_templates.get_time_height_template(
+                'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+        template.render(
                 SNR,
-                cmap=cmap,
-                vmin=zLim[0],
-                vmax=zLim[1],
-                interpolation='none',
-                aspect='auto',
-                extent=extent,
-                )
-        # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-        ax.xaxis_date()
-    
-        ax.set_xlabel('Time [UTC]', fontsize=15)
-        ax.set_ylabel('Height [km]', fontsize=15)
-    
-        ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-        if config_dict['flagPlotLastProfilesOnly'] == True:
-            ax.xaxis.set_major_locator(HourLocator(interval=2))
-        else:
-            ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-        ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-    #    
-        ax.tick_params(
-            axis='both', which='major', labelsize=15, right=True,
-            top=True, width=2, length=5)
-        ax.tick_params(
-            axis='both', which='minor', width=1.5, length=3.5,
-            right=True, top=True)
-    
-        ax.set_title(
-            'SNR at {wave} nm'.format(wave = wavelength) +
-            ' {param} of {instrument} at {location}'.format(
-                param=param,
-                instrument=pollyVersion,
-                location=location),
-            fontsize=15)
-    
-        cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-        cbar = fig.colorbar(
-            pcmesh,
-            cax=cb_ax,
-            ticks=np.linspace(zLim[0], zLim[1], 5),
-            orientation='vertical')
-        cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-        cbar.ax.set_title('      SNR\n', fontsize=10)
-    
-        # add watermark
-        if flagWatermarkOn:
-        #    rootDir = os.getcwd()
-            rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            im_license = matplotlib.image.imread(
-                os.path.join(rootDir, 'img', 'by-sa.png'))
-    
-            newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-            newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-            newax_license.axis('off')
-    
-            fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                     fontweight='bold', fontsize=12, color='red',
-                     ha='left', va='bottom', alpha=0.8, zorder=10)
-    
-            fig.text(
-                0.84, 0.003,
-                u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                    datetime.now().strftime('%Y'), partnerLabel),
-                fontweight='bold', fontsize=7, color='black', ha='left',
-                va='bottom', alpha=1, zorder=10)
-
-        fig.text(
-           0.05, 0.02,
-           '{0}\nLC: {1:.2e}'.format(
-   #            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-               nc_dict['m_date'],
-               LCUsed), fontsize=12)
-        fig.text(
-            0.2, 0.02,
-            'Version: {version}\nCalibration: {method}'.format(
-                version=version,
-                method=flagLC),
-            fontsize=12)
-    
-        fig.savefig(saveFilename_SNR,dpi=figDPI)
-    
-        plt.close()
+                extent,
+                title='SNR at {wave} nm'.format(wave = wavelength) +
+                      ' {param} of {instrument} at {location}'.format(
+                          param=param,
+                          instrument=pollyVersion,
+                          location=location),
+                cbar_title='      SNR\n',
+                info_text='{0}\nLC: {1:.2e}'.format(nc_dict['m_date'], LCUsed),
+                version_text='Version: {version}\nCalibration: {method}'.format(version=version, method=flagLC),
+                partnerLabel=partnerLabel,
+                saveFilename=saveFilename_SNR,
+                dpi=figDPI,
+                decimation=config_dict.get('quicklookDecimation') or None)
 
         ## write2donefilelist
         readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -419,7 +271,7 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
 
 
 
-def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly_conf_dict, saveFolder, wavelength,donefilelist_dict):
+def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly_conf_dict, saveFolder, wavelength,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -431,6 +283,8 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
         dict wich stores the att-bsc data.
     wavelength: int
         the selected wavelength channel: e.g.: 355/532/1064 nm
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -461,6 +315,8 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
 
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
     LCUsed = np.array([nc_dict[f'attenuated_backscatter_{wavelength}nm___Lidar_calibration_constant_used']])
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
@@ -469,8 +325,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
     dataFilenameFolder = re.split(r'_att_bsc',nc_dict['PollyDataFileFolder'])[0]
 
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     plotfile = f'{dataFilename}_CLOUDINFO.{imgFormat}'
     saveFilename = os.path.join(saveFolder,plotfile)
@@ -494,25 +349,18 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
         pass
 
     ## fill time gaps in att_bsc matrix
-    ATT_BETA, quality_mask = readout.fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask)
+    ATT_BETA, quality_mask = time_grid.regrid([ATT_BETA, quality_mask], fill_values=[None, -1])
     
 
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
-
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
-
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     ATT_BETA = np.ma.masked_where(quality_mask < 0, ATT_BETA)
@@ -521,19 +369,18 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
     ATT_BETA = ATT_BETA[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    ATT_BETA = time_grid.trim(ATT_BETA)
 
     ## transpose and flip for correct plotting
     ATT_BETA= np.ma.transpose(ATT_BETA)  ## matrix has to be transposed for usage with pcolormesh!
     ATT_BETA= np.flip(ATT_BETA,0)
     
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
-    ## set color of nan-values
-    cmap.set_bad(color='white')
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
     fig = plt.figure(figsize=[12, 6])
     ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
@@ -611,11 +458,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
 
     # add watermark
     if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -649,7 +492,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
             method=flagLC),
         fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, palette=figure_templates.colormap_lut(cmap), dpi=figDPI)
 
     plt.close()
 
@@ -677,7 +520,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
                                     )
     
 
-def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,donefilelist_dict):
+def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -689,6 +532,8 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
         dict wich stores the att-bsc data.
     wavelength: int
         the selected wavelength channel: e.g.: 355/532/1064 nm
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -721,31 +566,25 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
         eta = '' 
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     dataFilename = re.split(r'_vol_depol',nc_dict['PollyDataFile'])[0]
 
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
 #    saveFolder = args.outdir
     plotfile = f'{dataFilename}_VDR_{wavelength}.{imgFormat}'
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    VDR, quality_mask = readout.fill_time_gaps_of_matrix(time, VDR, quality_mask)
+    VDR, quality_mask = time_grid.regrid([VDR, quality_mask], fill_values=[None, -1])
 
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
-
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
-
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
@@ -753,7 +592,7 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     VDR = np.ma.masked_where(quality_mask < 0, VDR)
@@ -762,116 +601,38 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
     VDR = VDR[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    VDR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=VDR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    VDR = time_grid.trim(VDR)
 
     ## transpose and flip for correct plotting
     VDR= np.ma.transpose(VDR)  ## matrix has to be transposed for usage with pcolormesh!
     VDR= np.flip(VDR,0)
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
     #colormap_basic = "turbo"
     #import copy
     #cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            VDR,# * 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-  
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Volume Depolarization Ratio at {wave} nm'.format(wave = wavelength) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      \n', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}\n$\eta$: {1}'.format(
-            nc_dict['m_date'],eta),
-            fontsize=12)
-#    fig.text(
-#        0.05, 0.02,
-#        '{0}\nLC: {1:.2e}'.format(
-##            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-#            nc_dict['m_date'],
-#            LCUsed[0]), fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
+            VDR,
+            extent,
+            title='Volume Depolarization Ratio at {wave} nm'.format(wave = wavelength) +
+                  ' of {instrument} at {location}'.format(
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      \n',
+            info_text='{0}\n$\eta$: {1}'.format(nc_dict['m_date'], eta),
+            version_text='Version: {version}\nCalibration: {method}'.format(version=version, method=flagLC),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -897,7 +658,7 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
                                     )
 
 
-def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_dict):
+def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -907,6 +668,8 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     ----------
     nc_dict: dict
         dict wich stores the WV data.
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -936,14 +699,15 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     quality_mask = nc_dict['QM_WVMR']
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
 
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     dataFilename = re.split(r'_WVMR_RH',nc_dict['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     plotfile = f'{dataFilename}_WVMR.{imgFormat}'
     plotfile_SNR387 = f'{dataFilename}_WVMR_SNR_387.{imgFormat}'
@@ -952,25 +716,18 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     saveFilename_SNR387 = os.path.join(saveFolder,plotfile_SNR387)
     saveFilename_SNR407 = os.path.join(saveFolder,plotfile_SNR407)
 
-    ## fill time gaps in att_bsc matrix
-    WVMR, quality_mask = readout.fill_time_gaps_of_matrix(time, WVMR, quality_mask)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
+    ## fill time gaps in wvmr and snr matrices
+    WVMR, SNR387, SNR407, quality_mask = time_grid.regrid([WVMR, SNR387, SNR407, quality_mask], fill_values=[None, None, None, -1])
 
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
-
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     WVMR = np.ma.masked_where(quality_mask< 0, WVMR)
@@ -979,107 +736,37 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     WVMR = WVMR[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    WVMR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=WVMR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    WVMR = time_grid.trim(WVMR)
 
     ## transpose and flip for correct plotting
     WVMR= np.ma.transpose(WVMR)  ## matrix has to be transposed for usage with pcolormesh!
     WVMR= np.flip(WVMR,0)
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
     #colormap_basic = "turbo"
     #import copy
     #cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             WVMR,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Water vapour mixing ratio of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      [$\mathrm{g\, kg^{-1}}$]\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title='Water vapour mixing ratio of {instrument} at {location}'.format(
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      [$\mathrm{g\, kg^{-1}}$]\n',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1105,10 +792,6 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
                                     )
 
     ## plotting SNR
-    ## fill time gaps in snr matrix
-    SNR387, quality_mask_SNR387 = readout.fill_time_gaps_of_matrix(time, SNR387, quality_mask)
-    SNR407, quality_mask_SNR407 = readout.fill_time_gaps_of_matrix(time, SNR407, quality_mask)
-    
 
 #    ## mask matrix
     SNR387 = np.ma.masked_where(SNR387 < 0, SNR387)
@@ -1120,8 +803,8 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     SNR407 = SNR407[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    SNR387 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR387,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
-    SNR407 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR407,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    SNR387 = time_grid.trim(SNR387)
+    SNR407 = time_grid.trim(SNR407)
     
     zLim = [np.nanmin(SNR387), np.nanmax(SNR387)]
 
@@ -1131,95 +814,25 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     SNR407 = np.ma.transpose(SNR407)  ## matrix has to be transposed for usage with pcolormesh!
     SNR407 = np.flip(SNR407,0)
     print(f"plotting {plotfile_SNR387} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             SNR387,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'SNR at {wave} nm'.format(wave = 387) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      SNR387\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-    #    rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename_SNR387,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title='SNR at {wave} nm'.format(wave = 387) +
+                  ' of {instrument} at {location}'.format(
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      SNR387\n',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename_SNR387,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1246,95 +859,25 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
 
     print(f"plotting {plotfile_SNR407} ... ")
     zLim = [np.nanmin(SNR407), np.nanmax(SNR407)]
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             SNR407,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'SNR at {wave} nm'.format(wave = 407) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      SNR407\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-    #    rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename_SNR407,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title='SNR at {wave} nm'.format(wave = 407) +
+                  ' of {instrument} at {location}'.format(
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      SNR407\n',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename_SNR407,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1359,7 +902,7 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
                                     product_stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S')
                                     )
 
-def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_dict):
+def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -1369,6 +912,8 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
     ----------
     nc_dict: dict
         dict wich stores the WV data.
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -1395,147 +940,70 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
     quality_mask = nc_dict['QM_RH']
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
 
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     dataFilename = re.split(r'_WVMR_RH',nc_dict['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     plotfile = f'{dataFilename}_RH.{imgFormat}'
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    RH, quality_mask = readout.fill_time_gaps_of_matrix(time, RH, quality_mask)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
-
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    RH, quality_mask = time_grid.regrid([RH, quality_mask], fill_values=[None, -1])
 
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
-    max_height = [ h/1000 for h in height if h < y_max ]
-
-    ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
-
-    ## mask matrix
-    RH = np.ma.masked_where(quality_mask< 0, RH)
-    
-    ## slice matrix to max_height
-    RH = RH[:,0:len(max_height)]
-
-    ## trimm matrix to last available timestamp if neccessary
-    RH = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RH,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
-
-    ## transpose and flip for correct plotting
-    RH = np.ma.transpose(RH)  ## matrix has to be transposed for usage with pcolormesh!
-    RH = np.flip(RH,0)
-
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
-    #colormap_basic = "turbo"
-    #import copy
-    #cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='white')
-
-    print(f"plotting {plotfile} ... ")
-    # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            RH,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Relative humidity of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      [$\mathrm{\%}$]\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+    max_height = [ h/1000 for h in height if h < y_max ]
 
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
+    ## set plot-region for imshow
+    extent = time_grid.extent(max_height)
 
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
+    ## mask matrix
+    RH = np.ma.masked_where(quality_mask< 0, RH)
+    
+    ## slice matrix to max_height
+    RH = RH[:,0:len(max_height)]
 
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
+    ## trimm matrix to last available timestamp if neccessary
+    RH = time_grid.trim(RH)
 
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
+    ## transpose and flip for correct plotting
+    RH = np.ma.transpose(RH)  ## matrix has to be transposed for usage with pcolormesh!
+    RH = np.flip(RH,0)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
+    #colormap_basic = "turbo"
+    #import copy
+    #cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
 
-    plt.close()
+    print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
+    # display attenuate backscatter
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
+            RH,
+            extent,
+            title='Relative humidity of {instrument} at {location}'.format(
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='      [$\mathrm{\%}$]\n',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1561,7 +1029,7 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
                                     )
 
 
-def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_version, donefilelist_dict):
+def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_version, donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -1571,6 +1039,8 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     ----------
     nc_dict_QR: dict
         dict wich stores the QR data.
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -1596,6 +1066,8 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     quality_mask = np.where(matrix > 0, 0, 0)
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
     cRange = nc_dict['target_classification___plot_range'] ## equals zLim and the number of classes in the target classification
     TC_def = nc_dict['target_classification___definition']
     classes = re.split(r'\\n',TC_def)
@@ -1619,11 +1091,10 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
 
 #    cmap = matplotlib.colors.ListedColormap(['#DAFFFF','#6CFFEC','#209FF3','#BF9AFF','#E5E5E5', '#464AB9','#FFA500',
 #                              '#C7FA3A', '#CEBC89','#E64A23','#B43757'])
-    cmap = matplotlib.colors.ListedColormap(TC_color_matrix)
+    cmap = assets.get_listed_colormap(TC_color_matrix, bad='white')
 
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
 #    saveFolder = args.outdir
     if c_version == "V1":
@@ -1635,24 +1106,17 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    matrix, quality_mask = readout.fill_time_gaps_of_matrix(time, matrix, quality_mask)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
-
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    matrix, quality_mask = time_grid.regrid([matrix, quality_mask], fill_values=[None, -1])
 
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     matrix = np.ma.masked_where(quality_mask < 0, matrix)
@@ -1661,111 +1125,38 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     matrix = matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    matrix = time_grid.trim(matrix)
     ## transpose and flip for correct plotting
     matrix = np.ma.transpose(matrix)  ## matrix has to be transposed for usage with pcolormesh!
     matrix = np.flip(matrix,0)
 
     # define the colormap
 #    cmap = load_colormap(name=colormap_basic)
-    ## set color of nan-values
+    ## the color of nan-values is set in the colormap of the classes
     #cmap.set_bad(color='black')
-    cmap.set_bad(color='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-#    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    ax = fig.add_axes([0.09, 0.15, 0.67, 0.75])
-
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'target_class', [cRange[0]-0.5, cRange[1]+0.5], cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            cbar_ticks=np.arange(cRange[0], cRange[1]+1, 1), cbar_ticklabels=classes_list,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             matrix,
-            cmap=cmap,
-            vmin=cRange[0]-0.5,
-            vmax=cRange[1]+0.5,
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=12, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Target classifications ({V}) of {instrument} at {location}'.format(
-            V=c_version,
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    #cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cb_ax = fig.add_axes([0.77, 0.15, 0.01, 0.75])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.arange(cRange[0], cRange[1]+1, 1),
-        orientation='vertical')
-    cbar.ax.set_yticklabels(classes_list)
-    cbar.ax.tick_params(direction='out', labelsize=9, pad=5)
-#    cbar.ax.set_title('      \n', fontsize=10)
-    # create legend of classes
-#    plt.legend([matplotlib.patches.Patch(color=cmap(j)) for j in range(int(cRange[1])+1)], [cl for cl in classes_list])
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()  
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title='Target classifications ({V}) of {instrument} at {location}'.format(
+                      V=c_version,
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title=None,
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            ## the classes are categorical
+            decimation='nearest' if config_dict.get('quicklookDecimation') else None)
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1791,7 +1182,7 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
                                     )
 
 
-def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_version,donefilelist_dict):
+def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_version,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -1801,6 +1192,8 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     ----------
     nc_dict: dict
         dict wich stores the QR data.
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -1849,14 +1242,15 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
 
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     dataFilename = re.split(r'_quasi_results',nc_dict['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     if q_param == "angexp":
         prodtype = "Quasi_ANGEXP_532_1064"
@@ -1895,24 +1289,17 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     print(plotfile)
 
     ## fill time gaps in att_bsc matrix
-    matrix, quality_mask = readout.fill_time_gaps_of_matrix(time, matrix, quality_mask)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
+    matrix, quality_mask = time_grid.regrid([matrix, quality_mask], fill_values=[None, -1])
 
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
-
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
     ## mask matrix
     matrix = np.ma.masked_where(quality_mask < 0, matrix)
@@ -1921,103 +1308,35 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     matrix = matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    matrix = time_grid.trim(matrix)
 
     ## transpose and flip for correct plotting
     matrix = np.ma.transpose(matrix)  ## matrix has to be transposed for usage with pcolormesh!
     matrix = np.flip(matrix,0)
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='white')
     #colormap_basic = "turbo"
     #import copy
     #cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='white')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             matrix,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(quasi_title, fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      \n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd() 
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title=quasi_title,
+            cbar_title='      \n',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     ## write2donefilelist
     if q_version == "V1":
@@ -2098,13 +1417,14 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
     version = nc_dict['PicassoVersion']
     dataFilename = re.split(r'_overlap',nc_dict['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     saveFolder = outdir
     plotfile = f'{dataFilename}_overlap.{imgFormat}'
     saveFilename = os.path.join(saveFolder,plotfile)
 
 
+    readout.profile_switch('draw')
     # display WVMR-profile
     fig = plt.figure(figsize=[5, 8])
     ax = fig.add_axes([0.21, 0.15, 0.74, 0.75])
@@ -2156,11 +1476,7 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-#        rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -2195,7 +1511,7 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
             version=version),
         fontsize=12)
     print(f"plotting {plotfile} ... ")
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
 
     plt.close()
 
@@ -2223,7 +1539,7 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
                                     )
 
 
-def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength, param,donefilelist_dict):
+def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength, param,donefilelist_dict,time_grid=None):
     """
     Description
     -----------
@@ -2235,6 +1551,8 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
         dict wich stores the RCS data.
     wavelength: int
         the selected wavelength channel: e.g.: 355/532/1064 nm
+    time_grid: readout.TimeGrid, optional
+        the time grid of the nc-file, if already computed for another plot.
 
     Usage
     -----
@@ -2269,6 +1587,8 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
 
     height = nc_dict['height']
     time = nc_dict['time']
+    if time_grid is None:
+        time_grid = readout.TimeGrid(time, nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
 
     pollyVersion = nc_dict['PollyVersion']
     location = nc_dict['location']
@@ -2276,8 +1596,7 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     dataFilename = re.split(r'_RCS',nc_dict['PollyDataFile'])[0]
 
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     plotfile = f'{dataFilename}_RCS_{param}_{wavelength}.{imgFormat}'
     prod_type = f'RCS_{param}_{wavelength}'
@@ -2285,26 +1604,19 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-#    RCS_matrix, quality_mask_ATT = readout.fill_time_gaps_of_matrix(time, RCS_matrix, quality_mask)
-    RCS_matrix = readout.fill_time_gaps_of_single_matrix(time, RCS_matrix)
-    
-
-    ## get date and convert to datetime object
-    date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
-    date_00 = date_00.timestamp()
+#    RCS_matrix, quality_mask_ATT = time_grid.regrid([RCS_matrix, quality_mask], fill_values=[None, -1])
+    RCS_matrix, = time_grid.regrid([RCS_matrix])
     
-    ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
 
-    ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
-    x_lims = date2num(x_lims)
+    ## x-lim to 24h or only to last available timestamp
+    x_lims = time_grid.x_lims
 
     ## set max_height
     y_max = yLim[1]
     max_height = [ h/1000 for h in height if h < y_max ]
 
     ## set plot-region for imshow
-    extent = [ x_lims[0], x_lims[-1], max_height[0], max_height[-1] ]
+    extent = time_grid.extent(max_height)
 
 #    ## mask matrix
     RCS_matrix = np.ma.masked_where(RCS_matrix <= 0, RCS_matrix)
@@ -2313,110 +1625,40 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     RCS_matrix = RCS_matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    RCS_matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RCS_matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    RCS_matrix = time_grid.trim(RCS_matrix)
 
     ## transpose and flip for correct plotting
     RCS_matrix= np.ma.transpose(RCS_matrix)  ## matrix has to be transposed for usage with pcolormesh!
     RCS_matrix= np.flip(RCS_matrix,0)
 
-    # define the colormap
-    cmap = load_colormap(name=colormap_basic)
+    # define the colormap, including the color of nan-values
+    cmap = assets.get_colormap(colormap_basic, bad='black')
 #    cmap = copy.copy(plt.cm.turbo)
 #    colormap_basic = "turbo"
 #    import copy
 #    cmap =copy.copy(plt.cm.get_cmap(colormap_basic))
-    ## set color of nan-values
-    cmap.set_bad(color='black')
 
     print(f"plotting {plotfile} ... ")
+    readout.profile_switch('draw')
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
+    template = figure_templates.get_time_height_template(
+            'standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn,
+            fast_raster=config_dict.get('flagFastRaster', False))
+    template.render(
             RCS_matrix / 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Range Corrected Signal at {wave} nm'.format(wave = wavelength) +
-        ' {param} of {instrument} at {location}'.format(
-            param=param,
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-#    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=10)
-    cbar.ax.set_title('a.u.', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(nc_dict['m_date']), fontsize=12)
-
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+            extent,
+            title='Range Corrected Signal at {wave} nm'.format(wave = wavelength) +
+                  ' {param} of {instrument} at {location}'.format(
+                      param=param,
+                      instrument=pollyVersion,
+                      location=location),
+            cbar_title='a.u.',
+            info_text='{0}'.format(nc_dict['m_date']),
+            version_text='Version: {version}'.format(version=version),
+            partnerLabel=partnerLabel,
+            saveFilename=saveFilename,
+            dpi=figDPI,
+            decimation=config_dict.get('quicklookDecimation') or None)
 
     
 
@@ -1,79 +1,96 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap, LogNorm
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
-from matplotlib.dates import DateFormatter, \
-                             DayLocator, HourLocator, MinuteLocator, date2num
-#import matplotlib.dates as dates
+## heavy dependencies are only imported when they are used: matplotlib with the
+## first figure (lazy plotting modules), pandas, netCDF4 and sqlite3 in readout
 import os
 import re
 import sys
 import time
-import scipy.io as spio
 import numpy as np
 import json
+import csv
+import hashlib
 from datetime import datetime, timedelta
-import matplotlib
-import pandas as pd
 import argparse
 import statistics
 from pathlib import Path
 from statistics import mode
 import pypolly_readout as readout
-import pypolly_display_3d_plots as display_3d
 import pypolly_profile_translator as p_translator
-import pypolly_display_profiles as display_profiles
+import pypolly_job_graph as job_graph
+display_3d = readout.lazy_import('pypolly_display_3d_plots')
+display_profiles = readout.lazy_import('pypolly_display_profiles')
 
-# load colormap
 dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 print(dirname)
 sys.path.append(dirname)
-try:
-    from python_colormap import *
-except Exception as e:
-    raise ImportError('python_colormap module is necessary.')
 
 import logging
 logging.basicConfig(level=logging.WARNING)
 
-# generating figure without X server
-plt.switch_backend('Agg')
-
-my_parser = argparse.ArgumentParser(description='Plotting all diagrams from level1-nc-file.')
-
-## Add the arguments
-my_parser.add_argument('--date', dest='timestamp', metavar='timestamp',
-                       type=str,
-                       help='the date of measurement (level1 nc-file): YYYYMMDD.')
-my_parser.add_argument('--device', dest='device', metavar='device',
-                       type=str,
-                       help='the polly device (level1 nc-file).')
-my_parser.add_argument('--base_dir', dest='base_dir',
-                       type=str,
-                       default='/data/level0/polly',
-                       help='the directory of level0 polly data and logbook-files.')
-my_parser.add_argument('--picasso_config_file', dest='picasso_config_file', metavar='picasso_config_file',
-                       type=str,
-                       help='the json-type picasso config-file')
-my_parser.add_argument('--polly_config_file', dest='polly_config_file', metavar='polly_config_file',
-                       type=str,
-                       help='the json-type polly-config-file for the specific device at specific time, originally grepped from the xlsx-file. if this parameter is set, no grep from xlsx file will be performed.')
-my_parser.add_argument('--outdir', dest='outdir', metavar='outputdir',
-                       default="read_from_picasso_config",
-                       type=str,
-                       help='the output folder to put the png files to.')
-my_parser.add_argument('--retrieval', dest='retrieval', metavar='retrieval parameter',
-                       default=['all'],
-                       choices=['all','attbsc','voldepol','cloudinfo','target_class','wvmr_rh','quasi_results','profiles','overlap','LC','HKD','longterm_cali','profile_summary','poliphon','RCS'],
-                       nargs='+',
-                       type=str,
-                       help='the retrievals to be plotted; default: "all".')
-my_parser.add_argument('--donefilelist', dest='donefilelist',
-                       type=str,
-                       default = 'false',
-                       help='write list of plotted filenames into donefilelist, specified in the picasso-config. Default is False.')
-
-# init parser
-args = my_parser.parse_args()
+
+def get_arg_parser():
+    ## command line of pypolly_display_all.py, built on demand and not on import
+    my_parser = argparse.ArgumentParser(prog='pypolly_display_all.py', description='Plotting all diagrams from level1-nc-file.')
+
+    ## Add the arguments
+    my_parser.add_argument('--date', dest='timestamp', metavar='timestamp',
+                           type=str,
+                           help='the date of measurement (level1 nc-file): YYYYMMDD.')
+    my_parser.add_argument('--start-date', dest='start_date', metavar='start_date',
+                           type=str,
+                           help='first date of measurement to plot: YYYYMMDD. used instead of --date to plot several days in one run.')
+    my_parser.add_argument('--end-date', dest='end_date', metavar='end_date',
+                           type=str,
+                           help='last date of measurement to plot: YYYYMMDD. default is --start-date.')
+    my_parser.add_argument('--device', dest='device', metavar='device',
+                           type=str,
+                           nargs='+',
+                           help='the polly device(s) (level1 nc-file).')
+    my_parser.add_argument('--base_dir', dest='base_dir',
+                           type=str,
+                           default='/data/level0/polly',
+                           help='the directory of level0 polly data and logbook-files.')
+    my_parser.add_argument('--picasso_config_file', dest='picasso_config_file', metavar='picasso_config_file',
+                           type=str,
+                           help='the json-type picasso config-file')
+    my_parser.add_argument('--polly_config_file', dest='polly_config_file', metavar='polly_config_file',
+                           type=str,
+                           help='the json-type polly-config-file for the specific device at specific time, originally grepped from the xlsx-file. if this parameter is set, no grep from xlsx file will be performed.')
+    my_parser.add_argument('--outdir', dest='outdir', metavar='outputdir',
+                           default="read_from_picasso_config",
+                           type=str,
+                           help='the output folder to put the png files to.')
+    my_parser.add_argument('--retrieval', dest='retrieval', metavar='retrieval parameter',
+                           default=['all'],
+                           choices=['all','attbsc','voldepol','cloudinfo','target_class','wvmr_rh','quasi_results','profiles','overlap','LC','HKD','longterm_cali','profile_summary','poliphon','RCS'],
+                           nargs='+',
+                           type=str,
+                           help='the retrievals to be plotted; default: "all".')
+    my_parser.add_argument('--donefilelist', dest='donefilelist',
+                           type=str,
+                           default = 'false',
+                           help='write list of plotted filenames into donefilelist, specified in the picasso-config. Default is False.')
+    my_parser.add_argument('--cache_size', dest='cache_size',
+                           type=float,
+                           default=1024,
+                           help='memory budget [MB] for caching the content of level1 nc-files, which are used by several retrievals. 0 disables the cache. Default is 1024.')
+    my_parser.add_argument('--jobs', dest='jobs',
+                           type=int,
+                           default=1,
+                           help='number of processes to plot the figures in parallel; every process has its own nc-file cache of --cache_size. Default is 1.')
+    my_parser.add_argument('--max_datasets', dest='max_datasets',
+                           type=int,
+                           default=None,
+                           help='memory-bounded mode: every process holds at most this many level1 nc-files at a time; the figures of a file are plotted before the next file is loaded. Default is no limit.')
+    my_parser.add_argument('--force', dest='force',
+                           action='store_true',
+                           help='plot all figures, also the ones, which are up to date with their level1-files, configs and code.')
+    my_parser.add_argument('--profile', dest='profile',
+                           action='store_true',
+                           help='record the time per stage (file discovery, reading, gap filling, drawing, saving) and the size of every plotted image; written as plot_profile.json/.csv next to the images.')
+    my_parser.add_argument('--dry-run', dest='dry_run',
+                           action='store_true',
+                           help='only print the plan (files to load, derived quantities and figures), nothing is plotted.')
+    return my_parser
 
 
 #def read_excel_config_file(excel_file, timestamp, device):
@@ -115,45 +132,550 @@ args = my_parser.parse_args()
 #    return config_json
 
 
-def main():
+## nc-file cache of the process, see PlotContext.nc_cache
+_NC_CACHE = None
+
+
+class PlotContext:
+    """
+    Description
+    -----------
+    Everything the jobs of one device and date need. The context is sent
+    to the worker processes with --jobs; the nc-file cache is shared by all
+    contexts of a process and is not pickled.
+
+    Parameters
+    ----------
+    date: str
+        the date, YYYYMMDD.
+    device: str
+        polly device.
+    location: str
+        location of the device.
+    base_dir: str
+        the directory of level0 polly data and logbook-files.
+    inputfolder: str
+        the results folder with the level1 nc-files.
+    outputfolder: Path
+        the folder for the figures.
+    config_dict: FrozenConfig
+        picasso config.
+    polly_conf_dict: FrozenConfig
+        merged polly config.
+    cache_size: float
+        memory budget [MB] of the nc-file cache.
+    profile: bool
+        record the timings of the figure jobs, see readout.start_profile.
+
+    Usage
+    -----
+    ctx = PlotContext(date,device,location,base_dir,inputfolder,outputfolder,config_dict,polly_conf_dict,cache_size)
+    nc_dict = ctx.read_nc_file(data_file)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, date, device, location, base_dir, inputfolder, outputfolder, config_dict, polly_conf_dict, cache_size=1024, profile=False):
+        self.date = date
+        self.device = device
+        self.location = location
+        self.base_dir = base_dir
+        self.inputfolder = inputfolder
+        self.outputfolder = outputfolder
+        self.config_dict = config_dict
+        self.polly_conf_dict = polly_conf_dict
+        self.cache_size = cache_size
+        self.profile = profile
+
+    @property
+    def nc_cache(self):
+        ## level1 nc-files are read only once per process and shared by all jobs
+        global _NC_CACHE
+        if _NC_CACHE is None:
+            _NC_CACHE = readout.NcCache(max_size_mb=self.cache_size)
+        return _NC_CACHE
+
+    def get_nc_filename(self, param):
+        ## no files, if the folder of the day does not exist
+        return readout.get_nc_filename(self.date, self.device, self.inputfolder, param=param) or []
+
+    def read_nc_file(self, data_file, **kwargs):
+        return readout.read_nc_file(data_file,self.date,self.device,self.location,cache=self.nc_cache,**kwargs)
+
+    def calibration_db(self):
+        return Path(self.config_dict['results_folder']).joinpath(self.device,self.polly_conf_dict['calibrationDB'])
+
+    def logbook_file(self):
+        return Path(self.config_dict['results_folder']).joinpath(self.device,self.polly_conf_dict['logbookFile'])
+
+
+## RCS channels, which are plotted if not empty
+RCS_PARAMS = ['RCS_FR_355nm', 'RCS_FR_cross_355nm', 'RCS_NR_355nm', 'RCS_RR_355nm', 'RCS_FR_387nm', 'RCS_NR_387nm', 'RCS_FR_407nm', 'RCS_NR_407nm', 'RCS_FR_532nm', 'RCS_FR_cross_532nm','RCS_FR_parallel_532nm', 'RCS_NR_532nm', 'RCS_NR_cross_532nm', 'RCS_RR_532nm', 'RCS_FR_607nm', 'RCS_NR_607nm', 'RCS_FR_1064nm', 'RCS_FR_cross_1064nm', 'RCS_RR_1064nm']
+
+## quasi retrieval parameters
+Q_PARAMS = ["angexp", "bsc_532", "bsc_1064", "par_depol_532"]
+
+#### load and derive jobs
+
+def load_nc_file(ctx, data_file, height_max=None):
+    return ctx.read_nc_file(data_file, height_max=height_max)
+
+
+def release_nc_file(ctx, nc_dict):
+    ## all figures of the file are done: free its arrays, also in the nc-file cache
+    nc_dict.release()
+
+
+def derive_time_grid(ctx, nc_dict):
+    ## the time grid (gap filling/trimming) is shared by all figures of one nc-file
+    return readout.TimeGrid(nc_dict['time'], nc_dict['m_date'], ctx.config_dict['flagPlotLastProfilesOnly'])
+
+
+def derive_ANGEXP(ctx, nc_dict_profile):
+    return readout.calc_ANGEXP(nc_dict_profile)
+
+
+def query_LC_of_day(ctx):
+    ## only the calibrations of the day are plotted
+    db_path = ctx.calibration_db()
+    mdate = datetime.strptime(ctx.date, '%Y%m%d')
+    LC_sql = readout.query_LC_from_sql_db(db_path=str(db_path),wavelengths=['355','532','1064'],method='Method',telescope='far',
+                                          start_time=mdate,end_time=mdate+timedelta(days=1))
+    return {f'LC{wavelength}': df for wavelength, df in LC_sql.items()}
+
+
+def query_longterm_cali(ctx):
+    db_path = ctx.calibration_db()
+    logbookFile_path = ctx.logbook_file()
+    print(logbookFile_path)
+    logbookFile_df = readout.read_from_logbookFile(logbookFile_path=str(logbookFile_path))
+    ## same 6 months window as in pollyDisplay_longtermcalibration
+    mdate = datetime.strptime(ctx.date, '%Y%m%d')
+    six_months_ago = mdate - timedelta(days=6*30)
+    LC_sql = readout.query_LC_from_sql_db(db_path=str(db_path),wavelengths=['355','532','1064'],method='Klett',telescope='far',
+                                          start_time=six_months_ago,end_time=mdate)
+    ETA_sql = readout.query_depol_from_sql_db(db_path=str(db_path),wavelengths=['355','532','1064'],
+                                              start_time=six_months_ago,end_time=mdate)
+    LC = {f'LC{wavelength}': df for wavelength, df in LC_sql.items()}
+    ETA = {f'ETA{wavelength}': df for wavelength, df in ETA_sql.items()}
+    return logbookFile_df, LC, ETA
 
-    ## measure computing time
-    t0 = time.process_time()
 
-    write2donefile = args.donefilelist
-    if write2donefile.lower() == "true":
-        write2donefile = True
-    elif write2donefile.lower() == "false":
-        write2donefile = False
+def read_laserlogbook(ctx, laserlogbook_zip_files):
+    return readout.read_pollyxt_logbook_zip_files(laserlogbook_zip_files,cache_folder=readout.get_cache_folder(ctx.config_dict))
 
-    picasso_config_file = args.picasso_config_file
-    config_dict = readout.read_config(picasso_config_file)
+
+#### figure jobs
+
+def render_figure(ctx, *inputs, plot=None, **kwargs):
+    ## figure job: returns the donefile entries of the plotted figures, the peak RSS and, if profiling, the timings
+    donefilelist_dict = {}
+    readout.reset_peak_rss()
+    if ctx.profile:
+        readout.start_profile('prepare')
+    try:
+        with readout.image_options(ctx.config_dict):
+            plot(ctx, donefilelist_dict, *inputs, **kwargs)
+    finally:
+        profile = readout.stop_profile()
+    return {'donefile': donefilelist_dict, 'profile': profile, 'peak_rss_mb': readout.get_peak_rss_mb()}
+
+
+def plot_RCS(ctx, donefilelist_dict, nc_dict, time_grid, p):
+    if p not in nc_dict or np.all(nc_dict[p].mask): ## do not plot empty/non-existing channels
+        return
+    p1 = re.split(r'RCS_',p)[1]
+    param = re.split(r'_[1-9].*nm',p1)[0]
+    wavelength = re.split(f'{param}_',p1)[-1]
+    wavelength = re.split(r'nm',wavelength)[0]
+    print(f'plotting {p}')
+    display_3d.pollyDisplayRCS(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder, wavelength=wavelength,param=param,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_cloudinfo(ctx, donefilelist_dict, nc_dict, time_grid, nc_dict_cloudinfo):
+    print('plotting ATT_BETA_1064nm + cloudinfo:')
+    display_3d.pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder, wavelength=1064,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_attbsc(ctx, donefilelist_dict, nc_dict, time_grid, wavelength, param):
+    if param == 'FR':
+        print(f'plotting ATT_BETA_{wavelength}nm:')
+    else:
+        print(f'plotting ATT_BETA_{param}_{wavelength}nm:')
+    display_3d.pollyDisplayAttnBsc(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder, wavelength=wavelength, param=param,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_voldepol(ctx, donefilelist_dict, nc_dict, time_grid, wavelength):
+    print(f'plotting VDR_{wavelength}nm:')
+    display_3d.pollyDisplayVDR(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder, wavelength=wavelength,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_wvmr_rh(ctx, donefilelist_dict, nc_dict, time_grid, param):
+    print(f'plotting {param}:')
+    display = display_3d.pollyDisplayWVMR if param == 'WVMR' else display_3d.pollyDisplayRH
+    display(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_target_class(ctx, donefilelist_dict, nc_dict, time_grid, c_version):
+    print(f'plotting Target classification {c_version}:')
+    display_3d.pollyDisplayTargetClass(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder,c_version=c_version,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_quasi_results(ctx, donefilelist_dict, nc_dict, time_grid, q_param, q_version):
+    display_3d.pollyDisplayQR(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder,q_param=q_param, q_version=q_version,donefilelist_dict=donefilelist_dict,time_grid=time_grid)
+
+
+def plot_profiles(ctx, donefilelist_dict, nc_dict_profile, kind):
+    ## plotting profiles, using profile_translator
+    translator = {'FR': p_translator.profile_translator_function,
+                  'NR': p_translator.NR_profile_translator_function,
+                  'OC': p_translator.OC_profile_translator_function,
+                  'POLIPHON': p_translator.POLIPHON_profile_translator_function}[kind]()
+    starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
+    endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
+    print(f"{'profile' if kind == 'FR' else kind + '-profile'}: {starttime} - {endtime}")
+    for profilename in translator.keys():
+        print(f"{profilename}")
+        display_profiles.pollyDisplay_profile(nc_dict_profile,translator,profilename,ctx.config_dict,ctx.polly_conf_dict,ctx.outputfolder,donefilelist_dict=donefilelist_dict)
+
+
+def plot_overlap(ctx, donefilelist_dict, nc_dict):
+    print('plotting overlap:')
+    display_3d.pollyDisplay_Overlap(nc_dict, ctx.config_dict, ctx.polly_conf_dict, ctx.outputfolder,donefilelist_dict=donefilelist_dict)
+
+
+def plot_LC(ctx, donefilelist_dict, nc_dict, LC):
+    ## plotting Lidar constants from db-file
+    calib_profile_translator = p_translator.calib_profile_translator_function()
+    print('plotting LidarCalibrationConstants:')
+    for profilename in calib_profile_translator.keys():
+        display_profiles.pollyDisplay_calibration_constants(nc_dict,LC[profilename],calib_profile_translator,profilename,ctx.config_dict,ctx.polly_conf_dict,ctx.outputfolder,donefilelist_dict=donefilelist_dict)
+
+
+def plot_longterm_cali(ctx, donefilelist_dict, nc_dict, longterm_cali):
+    logbookFile_df, LC, ETA = longterm_cali
+    calib_profile_translator = p_translator.calib_profile_translator_function()
+    print('plotting LongTermCalibration:')
+    display_profiles.pollyDisplay_longtermcalibration(nc_dict,logbookFile_df,LC,ETA,calib_profile_translator,'longterm_LC',ctx.config_dict,ctx.polly_conf_dict,ctx.outputfolder,donefilelist_dict=donefilelist_dict)
+
+
+def plot_HKD(ctx, donefilelist_dict, nc_dict, laserlogbook_df):
+    display_profiles.pollyDisplay_HKD(laserlogbook_df,nc_dict,ctx.config_dict,ctx.polly_conf_dict,ctx.outputfolder,donefilelist_dict=donefilelist_dict)
+
+
+def plot_profile_summary(ctx, donefilelist_dict, nc_dict_profile, *optional_profiles, has_NR=False, has_QC=False):
+    config_dict = ctx.config_dict
+    polly_conf_dict = ctx.polly_conf_dict
+    outputfolder = ctx.outputfolder
+    optional_profiles = list(optional_profiles)
+    nc_dict_profile_NR = optional_profiles.pop(0) if has_NR else {}
+    nc_dict_profile_QC = optional_profiles.pop(0) if has_QC else {}
+
+    starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
+    endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
+    print(f"profile: {starttime} - {endtime}")
+    print(f"QC-profiles")
+    display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='high_range',donefilelist_dict=donefilelist_dict)
+    display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='low_range',donefilelist_dict=donefilelist_dict)
+    print(f"Raman-profiles")
+    display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='high_range',donefilelist_dict=donefilelist_dict)
+    display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='low_range',donefilelist_dict=donefilelist_dict)
+    print(f"Klett-profiles")
+    display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='high_range',donefilelist_dict=donefilelist_dict)
+    display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='low_range',donefilelist_dict=donefilelist_dict)
+    print("Meteorological profiles")
+    display_profiles.pollyDisplay_profile_summary_meteo(nc_dict_profile=nc_dict_profile,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='high_range',donefilelist_dict=donefilelist_dict)
+
+
+#### plan
+
+def build_plot_plan(ctx, retrieval, plan=None, release_datasets=False):
+    """
+    Description
+    -----------
+    Build the job graph of the requested retrievals: the level1 nc-files
+    are discovered here, every file is loaded by one load job, derived
+    quantities (time grid, Angstroem exponents) are calculated once per
+    file and fanned out to all figure jobs using them. Figure jobs are
+    added in the order, in which they are written to the donefile.
+    All jobs carry ctx, so the plans of several devices and dates can be
+    collected in one job graph.
+
+    Parameters
+    ----------
+    ctx: PlotContext
+        device, date, configs and folders.
+    retrieval: list
+        the retrievals to be plotted, see --retrieval.
+    plan: JobGraph, optional
+        add the jobs to this plan instead of a new one.
+    release_datasets: bool
+        free every loaded nc-file, also in the nc-file cache, as soon as
+        its figures are done (memory-bounded mode, --max_datasets).
+        Otherwise the cache keeps the files within its budget.
+
+    Usage
+    -----
+    plan = build_plot_plan(ctx, ['all'])
+    print(plan.describe())
+    donefile_entries = plan.run(jobs=8)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    polly_conf_dict = ctx.polly_conf_dict
+    if plan is None:
+        plan = job_graph.JobGraph()
+    unit = f'{ctx.device} {ctx.date}'
+
+    def requested(name):
+        return ('all' in retrieval) or (name in retrieval)
+
+    def nc(data_file, height_max=None):
+        ## one load job per file, sliced to the highest height needed by any consumer
+        key = ('load', data_file)
+        if key in plan:
+            job = plan[key]
+            if job.kwargs['height_max'] is not None:
+                job.kwargs['height_max'] = None if height_max is None else max(job.kwargs['height_max'], height_max)
+        else:
+            plan.add(key, load_nc_file, kind='load', ctx=ctx, inputs=[data_file], release=release_nc_file if release_datasets else None,
+                     data_file=data_file, height_max=height_max)
+        job = plan[key]
+        job.label = Path(data_file).name if job.kwargs['height_max'] is None else f"{Path(data_file).name} (height < {job.kwargs['height_max']} m)"
+        return key
+
+    def time_grid(data_file, height_max=None):
+        load = nc(data_file, height_max)
+        return plan.add(('time_grid', data_file), derive_time_grid, deps=[load], kind='derive', ctx=ctx, label=f'time grid of {Path(data_file).name}')
+
+    def angexp(data_file):
+        load = nc(data_file)
+        return plan.add(('angexp', data_file), derive_ANGEXP, deps=[load], kind='derive', ctx=ctx, label=f'Angstroem exponents of {Path(data_file).name}')
+
+    def figure(group, label, plot, deps, **kwargs):
+        key = ('figure', len(plan), group, label)
+        return plan.add(key, render_figure, deps=deps, kind='figure', ctx=ctx, label=f'{unit} {group}: {label}', group=group, plot=plot, **kwargs)
+
+    def figure_3d(group, label, plot, data_file, height_max, extra_deps=(), **kwargs):
+        deps = [nc(data_file, height_max), time_grid(data_file, height_max), *extra_deps]
+        return figure(group, label, plot, deps, **kwargs)
+
+    if requested('RCS'):
+        height_max = max(polly_conf_dict['yLim_FR_RCS'][1],polly_conf_dict['yLim_NR_RCS'][1])
+        for data_file in ctx.get_nc_filename('RCS'):
+            for p in RCS_PARAMS:
+                figure_3d('RCS', p, plot_RCS, data_file, height_max, p=p)
+    if requested('cloudinfo'):
+        height_max = max(polly_conf_dict['yLim_att_beta'][1],polly_conf_dict['yLim_cloudinfo'][1])
+        nc_files = ctx.get_nc_filename('att_bsc')
+        cloud_files = ctx.get_nc_filename('cloudinfo')
+        for data_file, cloud_file in zip(nc_files, cloud_files):
+            figure_3d('cloudinfo', 'ATT_BETA_1064nm + cloudinfo', plot_cloudinfo, data_file, height_max, extra_deps=[nc(cloud_file)])
+    if requested('attbsc'):
+        for file_type, param, wavelengths, height_max in [
+                ('att_bsc', 'FR', [355, 532, 1064], max(polly_conf_dict['yLim_att_beta'][1],polly_conf_dict['yLim_cloudinfo'][1])),
+                ('NR_att_bsc', 'NR', [355, 532], polly_conf_dict['yLim_att_beta_NR'][1]),
+                ('OC_att_bsc', 'OC', [355, 532, 1064], polly_conf_dict['yLim_OC_att_beta'][1])]:
+            for data_file in ctx.get_nc_filename(file_type):
+                for wavelength in wavelengths:
+                    figure_3d('attbsc', f'ATT_BETA_{param}_{wavelength}nm', plot_attbsc, data_file, height_max, wavelength=wavelength, param=param)
+    if requested('voldepol'):
+        for data_file in ctx.get_nc_filename('vol_depol'):
+            for wavelength in [355, 532]:
+                figure_3d('voldepol', f'VDR_{wavelength}nm', plot_voldepol, data_file, polly_conf_dict['yLim_att_beta'][1], wavelength=wavelength)
+    if requested('wvmr_rh'):
+        for data_file in ctx.get_nc_filename('WVMR_RH'):
+            for param in ['WVMR', 'RH']:
+                figure_3d('wvmr_rh', param, plot_wvmr_rh, data_file, polly_conf_dict['yLim_WV_RH'][1], param=param)
+    if requested('target_class'):
+        for file_type, c_version in [('target_classification', 'V1'), ('target_classification_V2', 'V2')]:
+            for data_file in ctx.get_nc_filename(file_type):
+                figure_3d('target_class', f'Target classification {c_version}', plot_target_class, data_file, polly_conf_dict['yLim_att_beta'][1], c_version=c_version)
+    if requested('quasi_results'):
+        for file_type, q_version in [('quasi_results', 'V1'), ('quasi_results_V2', 'V2')]:
+            for data_file in ctx.get_nc_filename(file_type):
+                for q_param in Q_PARAMS:
+                    figure_3d('quasi_results', f'{q_param} {q_version}', plot_quasi_results, data_file, polly_conf_dict['yLim_Quasi_Params'][1], q_param=q_param, q_version=q_version)
+    if 'profiles' in retrieval:
+        print(f'plotting profiles to {ctx.outputfolder}')
+        for file_type, kind in [('profiles', 'FR'), ('NR_profiles', 'NR'), ('OC_profiles', 'OC'), ('POLIPHON_1', 'POLIPHON')]:
+            for profile in ctx.get_nc_filename(file_type):
+                ## no Angstroem exponents for POLIPHON
+                profile_job = nc(profile) if kind == 'POLIPHON' else angexp(profile)
+                figure('profiles', f'{kind} {Path(profile).name}', plot_profiles, [profile_job], kind=kind)
+    if requested('poliphon'):
+        for profile in ctx.get_nc_filename('POLIPHON_1'):
+            figure('poliphon', Path(profile).name, plot_profiles, [nc(profile)], kind='POLIPHON')
+    if requested('overlap'):
+        for data_file in ctx.get_nc_filename('overlap'):
+            figure('overlap', 'overlap', plot_overlap, [nc(data_file)])
+    if requested('LC'):
+        for data_file in ctx.get_nc_filename('overlap'):
+            LC = plan.add(('LC', ctx.device, ctx.date), query_LC_of_day, kind='load', ctx=ctx, inputs=[ctx.calibration_db()], label=f'{unit} lidar constants of the day from calibration DB')
+            figure('LC', 'LidarCalibrationConstants', plot_LC, [nc(data_file), LC])
+    if requested('longterm_cali'):
+        for data_file in ctx.get_nc_filename('overlap'):
+            longterm = plan.add(('longterm_cali', ctx.device, ctx.date), query_longterm_cali, kind='load', ctx=ctx, inputs=[ctx.calibration_db(), ctx.logbook_file()], label=f'{unit} 6 months of calibrations from calibration DB and logbook')
+            figure('longterm_cali', 'LongTermCalibration', plot_longterm_cali, [nc(data_file), longterm])
+    if requested('HKD'):
+        for data_file in ctx.get_nc_filename('overlap'):
+            laserlogbook_zip_files = readout.get_pollyxt_logbook_zip_files(ctx.date,ctx.device,ctx.base_dir)
+            laserlogbook = plan.add(('laserlogbook', ctx.device, ctx.date), read_laserlogbook, kind='load', ctx=ctx, inputs=laserlogbook_zip_files,
+                                    label=f'{unit} laserlogbook of the day', laserlogbook_zip_files=laserlogbook_zip_files)
+            figure('HKD', 'housekeeping data', plot_HKD, [nc(data_file), laserlogbook])
+    if requested('profile_summary'):
+        nc_profiles = ctx.get_nc_filename('profiles')
+        nc_profiles_NR = ctx.get_nc_filename('NR_profiles')
+        nc_profiles_QC = ctx.get_nc_filename('profiles_QC')
+        print(f'plotting profile summary to {ctx.outputfolder}')
+        for n_prof in range(len(nc_profiles)):
+            deps = [angexp(nc_profiles[n_prof])]
+            if len(nc_profiles_NR) > 0:
+                deps.append(nc(nc_profiles_NR[n_prof]))
+            if len(nc_profiles_QC) > 0:
+                deps.append(angexp(nc_profiles_QC[n_prof]))
+            figure('profile_summary', Path(nc_profiles[n_prof]).name, plot_profile_summary, deps,
+                   has_NR=len(nc_profiles_NR) > 0, has_QC=len(nc_profiles_QC) > 0)
+    return plan
+
+
+#### up-to-date check
+
+## picasso config values used by the plot functions
+PLOT_CONFIG_KEYS = ('figDPI', 'flagPlotLastProfilesOnly', 'flagWatermarkOn', 'fontname', 'flagFastRaster',
+                    'quicklookDecimation') + readout.IMAGE_OPTION_KEYS
+
+_PLOT_CODE_VERSION = None
+
+
+def plot_code_version():
+    ## hash of the sources of all modules involved in plotting
+    global _PLOT_CODE_VERSION
+    if _PLOT_CODE_VERSION is None:
+        ## by file, the lazy plotting modules are not executed for this
+        modules = ['pypolly_display_all', 'pypolly_readout', 'pypolly_display_3d_plots', 'pypolly_figure_templates', 'pypolly_assets', 'pypolly_display_profiles', 'pypolly_profile_translator', 'python_colormap']
+        sha1 = hashlib.sha1()
+        for module in modules:
+            sha1.update(Path(__file__).with_name(f'{module}.py').read_bytes())
+        _PLOT_CODE_VERSION = sha1.hexdigest()
+    return _PLOT_CODE_VERSION
+
+
+def figure_id(plan, key):
+    ## stable name of a figure job, independent of the other jobs of the plan
+    job = plan[key]
+    return '|'.join([job.label] + [Path(file).name for file in plan.input_files(key)])
+
+
+def figure_signature(plan, key, donefile=None):
+    """
+    Description
+    -----------
+    Signature of everything a figure job depends on: path, mtime and size of
+    the files read by the job and the jobs it depends on (level1-files,
+    calibration DB, logbooks), the merged polly config, the plot-related
+    values of the picasso config, the job arguments and the plotting code.
+    The donefile is part of it, so a figure plotted without writing it to
+    the (same) donefile is plotted again, when the donefile is written.
+
+    Parameters
+    ----------
+    plan: JobGraph
+        plan of build_plot_plan.
+    key: tuple
+        key of the figure job.
+    donefile: tuple, optional
+        (donefile, donefile_format) of readout.get_donefile, the figure is
+        written to, None for --donefilelist false.
+
+    Usage
+    -----
+    signature = figure_signature(plan, key, donefile=readout.get_donefile(config_dict))
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    job = plan[key]
+    ctx = job.ctx
+    inputs = []
+    for file in plan.input_files(key):
+        try:
+            stat = os.stat(file)
+            inputs.append([file, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            inputs.append([file, None, None])
+    kwargs = {name: (value.__name__ if callable(value) else value) for name, value in job.kwargs.items()}
+    signature = {
+        'inputs': inputs,
+        'polly_config': ctx.polly_conf_dict.to_dict(),
+        'picasso_config': {name: ctx.config_dict.get(name) for name in PLOT_CONFIG_KEYS},
+        'location': ctx.location,
+        'kwargs': kwargs,
+        'code': plot_code_version(),
+        'donefile': donefile,
+    }
+    return hashlib.sha1(json.dumps(signature, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_dates(start_date, end_date=None):
+    """list of the dates YYYYMMDD from start_date to end_date (inclusive)."""
+    start = datetime.strptime(start_date, '%Y%m%d')
+    end = datetime.strptime(end_date, '%Y%m%d') if end_date else start
+    return [(start + timedelta(days=n)).strftime('%Y%m%d') for n in range((end - start).days + 1)]
+
+
+def has_level1_files(inputfolder, device, date):
+    ## same check as in picasso_go24_plotonly.sh: at least one att_bsc-file of the day
+    level1_folder = Path(inputfolder,device,date[0:4],date[4:6],date[6:8])
+    return any(level1_folder.glob('*[0-9][0-9]_att_bsc*.nc'))
+
+
+def make_plot_context(config_dict, device, date, args):
+    """
+    Description
+    -----------
+    Look up location and local polly config of device at date and set up
+    the PlotContext. The xlsx-file and the configs are only parsed once per
+    process, so this is cheap for every further device and date.
+
+    Parameters
+    ----------
+    config_dict: FrozenConfig
+        picasso config.
+    device: str
+        polly device.
+    date: str
+        the date, YYYYMMDD.
+    args: argparse.Namespace
+        parsed command line, see get_arg_parser.
+
+    Usage
+    -----
+    ctx = make_plot_context(config_dict, 'arielle', '20240506', args)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
     excel_config_file = config_dict['pollynet_config_link_file']
     polly_config_folder = config_dict['polly_config_folder']
+    location = ''
+    if not args.polly_config_file or Path(excel_config_file).is_file():
+        ## location and, if not given, the local polly config from the pollynet_config_link_file
+        polly_local_config_file, _, location = readout.read_excel_config_file(excel_config_file, timestamp=date, device=device, cache_folder=readout.get_cache_folder(config_dict))
     if args.polly_config_file:
         polly_local_config_file = args.polly_config_file
-    else:
-        polly_local_config_file, device, location = readout.read_excel_config_file(excel_config_file, timestamp=args.timestamp, device=args.device)
 
     polly_local_config = Path(polly_config_folder,polly_local_config_file)
     print(polly_local_config_file,device,location)
 
-
-    pollyglobal = config_dict['polly_global_config']
-    
-    
-    globalconf_dict = readout.read_global_conf(pollyglobal)
-    localconf_dict = readout.read_local_conf(polly_local_config)
-    polly_conf_dict = globalconf_dict.copy()
-
-    ## use local polly config settings, instead of global ones:
-    for key in globalconf_dict:
-        if key in localconf_dict:
-            polly_conf_dict[key] = localconf_dict[key]
-
-
-    date = args.timestamp
-    device = args.device
+    ## merged global and local polly config, resolved once per content
+    polly_conf_dict = readout.resolve_polly_config(config_dict['polly_global_config'], polly_local_config)
 
     inputfolder = config_dict['results_folder']
     outputfolder = args.outdir
@@ -165,370 +687,265 @@ def main():
     else:
         outputfolder = Path(args.outdir,device,YYYY,MM,DD)
 
-    #creating a new directory if not existing
-    Path(outputfolder).mkdir(parents=True, exist_ok=True)
-
-    donefilelist_dict = {}
+    return PlotContext(date,device,location,args.base_dir,inputfolder,outputfolder,config_dict,polly_conf_dict,cache_size=args.cache_size,profile=args.profile)
+
+
+def write_profile_report(ctx, plan, results, discovery_s, jobs=1):
+    """
+    Description
+    -----------
+    Write the timings of the figure jobs of ctx as plot_profile.json (with
+    every image) and plot_profile.csv (one row per figure job) into the
+    output folder. The first row is the file discovery while planning.
+
+    Parameters
+    ----------
+    ctx: PlotContext
+        device and date.
+    plan: JobGraph
+        the executed plan.
+    results: dict
+        results of plan.run, {key: {'donefile': ..., 'profile': ...}}.
+    discovery_s: float
+        time [s] for planning, i.e. the search of the level1-files.
+    jobs: int
+        number of processes of the run.
+
+    Usage
+    -----
+    write_profile_report(ctx, plan, results, discovery_s, jobs=args.jobs)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    stage_columns = [f'{stage}_s' for stage in readout.PROFILE_STAGES]
+    plan_row = {'retrieval': 'plan', 'figure': 'file discovery', 'images': '', 'image_bytes': 0,
+                'wall_s': discovery_s, 'cpu_s': None, 'peak_rss_mb': None}
+    plan_row.update({column: None for column in stage_columns})
+    plan_row['discovery_s'] = discovery_s
+    rows = [plan_row]
+    figures = []
+    for key, result in results.items():
+        job = plan[key]
+        if job.ctx is not ctx or result['profile'] is None:
+            continue
+        profile = result['profile']
+        row = {'retrieval': job.group, 'figure': job.label,
+               'images': ';'.join(Path(image).name for image in profile['images']),
+               'image_bytes': sum(image['bytes'] for image in profile['images'].values()),
+               'wall_s': profile['wall_s'], 'cpu_s': profile['cpu_s'], 'peak_rss_mb': result['peak_rss_mb']}
+        for stage, column in zip(readout.PROFILE_STAGES, stage_columns):
+            row[column] = profile['stages'].get(stage, 0.0)
+        rows.append(row)
+        figures.append({'retrieval': job.group, 'figure': job.label, 'wall_s': profile['wall_s'], 'cpu_s': profile['cpu_s'],
+                        'peak_rss_mb': result['peak_rss_mb'], 'stages': profile['stages'], 'images': {Path(image).name: values for image, values in profile['images'].items()}})
+
+    report = {'device': ctx.device, 'date': ctx.date, 'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+              'jobs': jobs, 'discovery_s': discovery_s, 'figures': figures}
+    with open(Path(ctx.outputfolder, 'plot_profile.json'), 'w') as f:
+        json.dump(report, f, indent=1)
+    with open(Path(ctx.outputfolder, 'plot_profile.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['retrieval', 'figure', 'images', 'image_bytes', 'wall_s', 'cpu_s', 'peak_rss_mb'] + stage_columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    ## summary of the stages
+    totals = {stage: sum(row[f'{stage}_s'] or 0.0 for row in rows) for stage in readout.PROFILE_STAGES}
+    print(f'profile of {ctx.device} {ctx.date}: ' + ', '.join(f'{stage} {seconds:.1f} s' for stage, seconds in totals.items()))
+
+
+def parse_args(argv=None):
+    """
+    Description
+    -----------
+    Parse and check the command line of pypolly_display_all.py. Exits with
+    the usage message (SystemExit), if it is invalid.
+
+    Parameters
+    ----------
+    argv: list
+        arguments, sys.argv[1:] if None.
+
+    Returns
+    -------
+    args: argparse.Namespace
+    dates: list
+        the dates to plot, YYYYMMDD.
+
+    Usage
+    -----
+    args, dates = parse_args(['--date', '20240506', '--device', 'arielle'])
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    my_parser = get_arg_parser()
+    args = my_parser.parse_args(argv)
+
+    if not args.device or not (args.timestamp or args.start_date):
+        my_parser.error('--device and --date or --start-date are required.')
+    try:
+        dates = get_dates(args.start_date or args.timestamp, args.end_date)
+    except ValueError as e:
+        my_parser.error(f'invalid date: {e}')
+    return args, dates
+
+
+def plot_quicklooks(args, dates):
+    """
+    Description
+    -----------
+    Plot the quicklooks of all devices and dates, write the donefile and
+    the manifests. Used by main and by the workers of the render server.
+
+    Parameters
+    ----------
+    args: argparse.Namespace
+        parsed command line, see parse_args.
+    dates: list
+        the dates to plot, YYYYMMDD.
+
+    Returns
+    -------
+    summary: dict
+        'figures': number of figures of the plan,
+        'up_to_date': number of figures, which were not plotted again,
+        'failed': labels of the figures, which failed,
+        'donefile': the donefile entries of the plotted images,
+        'peak_rss_mb': {retrieval: peak RSS [MB] of the process while plotting it}.
+
+    Usage
+    -----
+    summary = plot_quicklooks(*parse_args(argv))
+
+    History
+    -------
+    2026-10-18. First edition
+    """
 
+    ## measure computing time
+    t0 = time.process_time()
+    t0_wall = time.perf_counter()
 
-    print('retrievals to plot: '+ str(args.retrieval))
-
-    if ('all' in args.retrieval) or ('RCS' in args.retrieval):
-    ## plotting RCS plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='RCS')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                param_ls = ['RCS_FR_355nm', 'RCS_FR_cross_355nm', 'RCS_NR_355nm', 'RCS_RR_355nm', 'RCS_FR_387nm', 'RCS_NR_387nm', 'RCS_FR_407nm', 'RCS_NR_407nm', 'RCS_FR_532nm', 'RCS_FR_cross_532nm','RCS_FR_parallel_532nm', 'RCS_NR_532nm', 'RCS_NR_cross_532nm', 'RCS_RR_532nm', 'RCS_FR_607nm', 'RCS_NR_607nm', 'RCS_FR_1064nm', 'RCS_FR_cross_1064nm', 'RCS_RR_1064nm']
-                for p in param_ls:
-                    p1 = re.split(r'RCS_',p)[1]
-                    param = re.split(r'_[1-9].*nm',p1)[0]
-                    wavelength = re.split(f'{param}_',p1)[-1]
-                    wavelength = re.split(r'nm',wavelength)[0]
-
-                    if np.all(nc_dict[p].mask): ## do not plot empty/non-existing channels
-                        continue
-                    else:
-                        print(f'plotting {p}')
-                        display_3d.pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=wavelength,param=param,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('cloudinfo' in args.retrieval):
-        ## plotting ATT_BETA_FR plots + cloudinfo
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='att_bsc')
-            #cloud_file = f'{dataFilenameFolder}_cloudinfo.nc'
-            cloud_files = readout.get_nc_filename(date, device, inputfolder, param='cloudinfo')
-            for n in range(len(nc_files)):
-                nc_dict = readout.read_nc_file(nc_files[n],date,device,location)
-                nc_dict_cloudinfo = readout.read_nc_file(cloud_files[n],date,device,location)
-                print('plotting ATT_BETA_1064nm + cloudinfo:')
-                display_3d.pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly_conf_dict, outputfolder, wavelength=1064,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-
-    if ('all' in args.retrieval) or ('attbsc' in args.retrieval):
-        ## plotting ATT_BETA_FR plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='FR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='FR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_1064nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=1064, param='FR',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-        ## plotting ATT_BETA_NR plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='NR_att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_NR_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='NR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_NR_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='NR',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    
-        ## plotting ATT_BETA_OC plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='OC_att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_OC_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='OC',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_OC_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='OC',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_OC_1064nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=1064, param='OC',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('voldepol' in args.retrieval):
-    ## plotting VolDepol plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='vol_depol')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting VDR_355nm:')
-                display_3d.pollyDisplayVDR(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355,donefilelist_dict=donefilelist_dict)
-                print('plotting VDR_532nm:')
-                display_3d.pollyDisplayVDR(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    
-    if ('all' in args.retrieval) or ('wvmr_rh' in args.retrieval):
-    ## plotting WVMR_RH plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='WVMR_RH')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting WVMR:')
-                display_3d.pollyDisplayWVMR(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-                print('plotting RH:')
-                display_3d.pollyDisplayRH(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('target_class' in args.retrieval):
-    ## plotting Target classification V1 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='target_classification')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting Target classification V1:')
-                display_3d.pollyDisplayTargetClass(nc_dict, config_dict, polly_conf_dict, outputfolder,c_version='V1',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-           logging.exception("An error occurred") 
-    ## plotting Target classification V2 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='target_classification_V2')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting Target classification V2:')
-                display_3d.pollyDisplayTargetClass(nc_dict, config_dict, polly_conf_dict, outputfolder,c_version='V2',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-           logging.exception("An error occurred") 
-    if ('all' in args.retrieval) or ('quasi_results' in args.retrieval):
-    ## plotting Quasi results V1
-        try:
-            q_params_ls = ["angexp", "bsc_532", "bsc_1064", "par_depol_532"] 
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='quasi_results')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                for qp in q_params_ls:
-                    display_3d.pollyDisplayQR(nc_dict, config_dict, polly_conf_dict, outputfolder,q_param=qp, q_version='V1',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred") 
-    ## plotting Quasi results V2
-        try: 
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='quasi_results_V2')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                for qp in q_params_ls:
-                    display_3d.pollyDisplayQR(nc_dict, config_dict, polly_conf_dict, outputfolder, q_param=qp, q_version='V2',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred") 
-    
-    if ('profiles' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        profile_translator = p_translator.profile_translator_function()
-        NR_profile_translator = p_translator.NR_profile_translator_function()
-        OC_profile_translator = p_translator.OC_profile_translator_function()
-        POLIPHON_profile_translator = p_translator.POLIPHON_profile_translator_function()
+    write2donefile = args.donefilelist
+    if write2donefile.lower() == "true":
+        write2donefile = True
+    elif write2donefile.lower() == "false":
+        write2donefile = False
 
-        try:
-            nc_profiles = readout.get_nc_filename(date, device, inputfolder, param='profiles')
-            nc_profiles_NR = readout.get_nc_filename(date, device, inputfolder, param='NR_profiles')
-            nc_profiles_OC = readout.get_nc_filename(date, device, inputfolder, param='OC_profiles')
-            nc_profiles_POLIPHON = readout.get_nc_filename(date, device, inputfolder, param='POLIPHON_1')
-            print(f'plotting profiles to {outputfolder}')
-            for profile in nc_profiles:
-                nc_dict_profile = readout.read_nc_file(profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-                print(f"profile: {starttime} - {endtime}")
-                nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-                for profilename in profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile,profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for NR_profile in nc_profiles_NR:
-                nc_dict_profile_NR = readout.read_nc_file(NR_profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_NR['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_NR['end_time'])).strftime('%H:%M')
-                print(f"NR-profile: {starttime} - {endtime}")
-                nc_dict_profile_NR = readout.calc_ANGEXP(nc_dict_profile_NR)
-                for profilename in NR_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_NR,NR_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for OC_profile in nc_profiles_OC:
-                nc_dict_profile_OC = readout.read_nc_file(OC_profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_OC['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_OC['end_time'])).strftime('%H:%M')
-                print(f"OC-profile: {starttime} - {endtime}")
-                nc_dict_profile_OC = readout.calc_ANGEXP(nc_dict_profile_OC)
-                for profilename in OC_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_OC,OC_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for POLIPHON in nc_profiles_POLIPHON:
-                nc_dict_profile_POLI = readout.read_nc_file(POLIPHON,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['end_time'])).strftime('%H:%M')
-                print(f"POLIPHON-profile: {starttime} - {endtime}")
-                for profilename in POLIPHON_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_POLI,POLIPHON_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('poliphon' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        POLIPHON_profile_translator = p_translator.POLIPHON_profile_translator_function()
+    picasso_config_file = args.picasso_config_file
+    config_dict = readout.resolve_picasso_config(picasso_config_file)
 
-        try:
-            nc_profiles_POLIPHON = readout.get_nc_filename(date, device, inputfolder, param='POLIPHON_1')
-            print(f'plotting profiles to {outputfolder}')
-            for POLIPHON in nc_profiles_POLIPHON:
-                nc_dict_profile_POLI = readout.read_nc_file(POLIPHON,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['end_time'])).strftime('%H:%M')
-                print(f"POLIPHON-profile: {starttime} - {endtime}")
-                for profilename in POLIPHON_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_POLI,POLIPHON_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    ## add plotted files to donefile
-    if write2donefile == True:
-        print('Write image files to donefile...')
-        readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
-    else:
-        pass
-    
-    if ('all' in args.retrieval) or ('overlap' in args.retrieval):
-        ## plotting overlap 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting overlap:')
-                display_3d.pollyDisplay_Overlap(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('LC' in args.retrieval):
-        ## plotting Lidar constants from db-file
-        try:
-            base_dir = Path(config_dict['results_folder'])
-            db_path = base_dir.joinpath(device,polly_conf_dict['calibrationDB'])
-            LC = {}
-            LC['LC355'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='355',method='Method',telescope='far')
-            LC['LC532'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='532',method='Method',telescope='far')
-            LC['LC1064'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='1064',method='Method',telescope='far')
-        except Exception as e:
-            logging.exception("An error occurred")
-
-        calib_profile_translator = p_translator.calib_profile_translator_function()
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting LidarCalibrationConstants:')
-                for profilename in calib_profile_translator.keys():
-                    display_profiles.pollyDisplay_calibration_constants(nc_dict,LC[profilename],calib_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    if ('all' in args.retrieval) or ('longterm_cali' in args.retrieval):
-        ## plotting Lidar constants from db-file
-        try:
-            base_dir = Path(config_dict['results_folder'])
-            db_path = base_dir.joinpath(device,polly_conf_dict['calibrationDB'])
-            logbookFile_path = base_dir.joinpath(device,polly_conf_dict['logbookFile'])
-            print(logbookFile_path)
-            logbookFile_df = readout.read_from_logbookFile(logbookFile_path=str(logbookFile_path))
-            LC = {}
-            ETA={}
-            LC['LC355'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='355',method='Klett',telescope='far')
-            LC['LC532'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='532',method='Klett',telescope='far')
-            LC['LC1064'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='1064',method='Klett',telescope='far')
-            ETA['ETA355'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='355')
-            ETA['ETA532'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='532')
-            ETA['ETA1064'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='1064')
-        except Exception as e:
-            logging.exception("An error occurred")
-        calib_profile_translator = p_translator.calib_profile_translator_function()
-        profilename='longterm_LC'
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting LongTermCalibration:')
-                display_profiles.pollyDisplay_longtermcalibration(nc_dict,logbookFile_df,LC,ETA,calib_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('HKD' in args.retrieval):
-         try:
-             laserlogbook = readout.get_pollyxt_logbook_files(date,device,args.base_dir,outputfolder)
-             print(laserlogbook)
-             laserlogbook_df = readout.read_pollyxt_logbook_file(laserlogbook)
-             nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-             for data_file in nc_files:
-                 nc_dict = readout.read_nc_file(data_file,date,device,location)
-                 display_profiles.pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-         except Exception as e:
-             logging.exception("An error occurred")
-    if ('all' in args.retrieval) or ('profile_summary' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        #profile_translator = p_translator.profile_translator_function()
+    print('retrievals to plot: '+ str(args.retrieval))
 
-        try:
-            nc_profiles = readout.get_nc_filename(date, device, inputfolder, param='profiles')
-            nc_profiles_NR = readout.get_nc_filename(date, device, inputfolder, param='NR_profiles')
-            nc_profiles_QC = readout.get_nc_filename(date, device, inputfolder, param='profiles_QC')
-            print(f'plotting profile summary to {outputfolder}')
-            #for prof in nc_profiles:
-            #    nc_dict_profile = readout.read_nc_file(prof)
-            #    starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-            #    endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-            #    print(f"profile: {starttime} - {endtime}")
-            #    nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-            #    display_profiles.pollyDisplay_profile_summary(nc_dict_profile,profile,config_dict,polly_conf_dict,outputfolder,donefilelist_dict)
-            for n_prof in range(len(nc_profiles)):
-                nc_dict_profile = readout.read_nc_file(nc_profiles[n_prof],date,device,location)
-                if len(nc_profiles_NR) > 0:
-                    nc_dict_profile_NR = readout.read_nc_file(nc_profiles_NR[n_prof],date,device,location)
-                else:
-                    nc_dict_profile_NR = {}
-                if len(nc_profiles_QC) > 0:
-                    nc_dict_profile_QC = readout.read_nc_file(nc_profiles_QC[n_prof],date,device,location)
-                    nc_dict_profile_QC = readout.calc_ANGEXP(nc_dict_profile_QC)
-                else:
-                    nc_dict_profile_QC = {}
-
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-                print(f"profile: {starttime} - {endtime}")
-                nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-                print(f"QC-profiles")
-                display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='low_range',donefilelist_dict=donefilelist_dict)
-                print(f"Raman-profiles")
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='low_range',donefilelist_dict=donefilelist_dict)
-                print(f"Klett-profiles")
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='low_range',donefilelist_dict=donefilelist_dict)
-                print("Meteorological profiles")
-                display_profiles.pollyDisplay_profile_summary_meteo(nc_dict_profile=nc_dict_profile,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='high_range',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-
-    ## add plotted files to donefile
-    if write2donefile == True:
-        print('Write image files to donefile...')
-        readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
-    else:
-        pass
+    ## the jobs of all devices and dates are collected in one plan and share the worker processes
+    plan = job_graph.JobGraph()
+    contexts = []
+    discovery_s = {}
+    skipped = []
+    for device in args.device:
+        for date in dates:
+            ## in batch mode, days without level1-files are skipped; a single date is plotted
+            ## from the files its retrievals need, like before the batch mode
+            if args.start_date and not has_level1_files(config_dict['results_folder'], device, date):
+                print(f'No level1-files of {device} at {date} found. Continuing...')
+                continue
+            ## a day which cannot be planned (e.g. no or a broken polly config) is skipped, the others are plotted
+            try:
+                ctx = make_plot_context(config_dict, device, date, args)
+                t_plan = time.perf_counter()
+                day_plan = build_plot_plan(ctx, args.retrieval, release_datasets=bool(args.max_datasets))
+            except Exception:
+                logging.exception(f'Planning the figures of {device} at {date} failed. Continuing...')
+                skipped.append(f'{device} {date}')
+                continue
+            plan.update(day_plan)
+            discovery_s[id(ctx)] = time.perf_counter() - t_plan
+            contexts.append(ctx)
+
+    ## figures are only plotted, if anything they depend on changed since the last run
+    manifests = {}
+    signatures = {}
+    for ctx in contexts:
+        manifest_file = readout.get_plot_manifest_file(ctx.outputfolder, readout.get_cache_folder(config_dict))
+        manifests[id(ctx)] = readout.PlotManifest(manifest_file)
+    figures = plan.sinks()
+    summary = {'figures': len(figures), 'up_to_date': 0, 'failed': list(skipped), 'donefile': [], 'peak_rss_mb': {}}
+    donefile = readout.get_donefile(config_dict) if write2donefile == True else None
+    for key in figures:
+        signatures[key] = figure_signature(plan, key, donefile=donefile)
+    if not args.force:
+        outdated = [key for key in figures if not manifests[id(plan[key].ctx)].is_up_to_date(figure_id(plan, key), signatures[key])]
+        if len(outdated) < len(figures):
+            print(f'{len(figures) - len(outdated)} of {len(figures)} figures are up to date and not plotted again (use --force to plot them).')
+            summary['up_to_date'] = len(figures) - len(outdated)
+            plan = plan.subgraph(outdated)
+
+    if args.dry_run:
+        print(plan.describe())
+        return summary
 
+    #creating a new directory if not existing
+    for ctx in contexts:
+        Path(ctx.outputfolder).mkdir(parents=True, exist_ok=True)
+
+    results = plan.run(jobs=args.jobs, max_datasets=args.max_datasets)
+    donefile_entries = {key: result['donefile'] for key, result in results.items()}
+    summary['failed'] += [plan[key].label for key in plan.sinks() if key not in results]
+
+    ## peak RSS of the worker process while plotting the figures of a retrieval, to size the workers
+    peak_rss_mb = {}
+    for key, result in results.items():
+        group = plan[key].group
+        peak_rss_mb[group] = max(peak_rss_mb.get(group, 0), result['peak_rss_mb'])
+    summary['peak_rss_mb'] = peak_rss_mb
+    if peak_rss_mb:
+        print('peak RSS per retrieval: ' + ', '.join(f'{group} {mb:.0f} MB' for group, mb in peak_rss_mb.items()))
+
+    for ctx in contexts:
+        ## merge the donefile entries of device and date in plan order
+        donefilelist_dict = {}
+        for key, entries in donefile_entries.items():
+            if plan[key].ctx is ctx:
+                donefilelist_dict.update(entries)
+        summary['donefile'].extend(donefilelist_dict.values())
+
+        ## add plotted files to donefile, every entry once
+        if write2donefile == True and donefilelist_dict:
+            print('Write image files to donefile...')
+            readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
+        else:
+            pass
+
+    ## remember the plotted figures after they are in the donefile; failed figures are tried again next time
+    for key, entries in donefile_entries.items():
+        manifests[id(plan[key].ctx)].record(figure_id(plan, key), signatures[key], entries.keys())
+    for manifest in manifests.values():
+        manifest.save()
+
+    if args.profile:
+        for ctx in contexts:
+            write_profile_report(ctx, plan, results, discovery_s[id(ctx)], jobs=args.jobs)
+
+
+    readout.close_calibration_db_connections()
+    if args.jobs <= 1 and _NC_CACHE is not None:
+        print(_NC_CACHE.report())
 
     ## measure computing time
     elapsed_time = time.process_time() - t0
     print(elapsed_time)
+    print(f'wall time: {time.perf_counter() - t0_wall:.1f} s')
     print('finished plotting!')
+    return summary
+
+
+def main(argv=None):
+    args, dates = parse_args(argv)
+    plot_quicklooks(args, dates)
+
+
 if __name__ == '__main__':
     main()
-
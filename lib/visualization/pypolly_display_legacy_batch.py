@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import importlib
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+logging.basicConfig(level=logging.WARNING)
+
+## legacy scripts, whose display function is not named like the script
+LEGACY_FUNCTIONS = {'pollyDisplayPolCali': 'pollyxt_display_depolcali'}
+
+
+def read_manifest(manifest_file):
+    """
+    Description
+    -----------
+    Read the manifest of a batch of legacy pollyDisplay*.py figures. The
+    manifest is either a text file with one figure per line, written by
+    MATLAB with fprintf(fid, '%s\\t%s\\t%s\\n', script, tmpFile, saveFolder),
+    or a json-file with a list of {"script", "tmpFile", "saveFolder"}.
+    Empty lines and lines starting with # are ignored.
+
+    Parameters
+    ----------
+    manifest_file: str
+        the manifest.
+
+    Returns
+    -------
+    entries: list
+        [{'script', 'tmpFile', 'saveFolder'}, ...], script without .py
+
+    Usage
+    -----
+    entries = read_manifest(manifest_file)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if str(manifest_file).endswith('.json'):
+        with open(manifest_file, 'r') as f:
+            rows = [(entry['script'], entry['tmpFile'], entry['saveFolder']) for entry in json.load(f)]
+    else:
+        rows = []
+        with open(manifest_file, 'r') as f:
+            for n, line in enumerate(f, 1):
+                line = line.rstrip('\r\n')
+                if not line.strip() or line.lstrip().startswith('#'):
+                    continue
+                fields = line.split('\t')
+                if len(fields) != 3:
+                    raise ValueError(f'{manifest_file}:{n}: expected script, tmpFile and saveFolder separated by tabs')
+                rows.append(fields)
+    return [{'script': Path(script.strip()).stem, 'tmpFile': tmpFile, 'saveFolder': saveFolder}
+            for script, tmpFile, saveFolder in rows]
+
+
+def get_display_function(script):
+    ## display function of a legacy script; every module is imported once per process
+    module = importlib.import_module(script)
+    return getattr(module, LEGACY_FUNCTIONS.get(script, script))
+
+
+@contextlib.contextmanager
+def _record_saved_images(images):
+    ## the legacy scripts only print their errors, so success is judged by the images they save
+    from matplotlib.figure import Figure
+    savefig = Figure.savefig
+
+    def recording_savefig(fig, fname, *args, **kwargs):
+        images.append(str(fname))
+        return savefig(fig, fname, *args, **kwargs)
+
+    Figure.savefig = recording_savefig
+    try:
+        yield images
+    finally:
+        Figure.savefig = savefig
+
+
+def render_legacy_figure(entry):
+    """
+    Description
+    -----------
+    Render one entry of the manifest in this process, as the legacy script
+    would do with "python script.py tmpFile saveFolder". The rcParams
+    changed by the script are restored and its open figures closed, so the
+    next figure is not affected.
+
+    Parameters
+    ----------
+    entry: dict
+        {'script', 'tmpFile', 'saveFolder'}, see read_manifest.
+
+    Returns
+    -------
+    result: dict
+        entry with 'status' ('ok', 'no_image' or 'failed'), 'images',
+        'error' and 'elapsed_s'.
+
+    Usage
+    -----
+    result = render_legacy_figure({'script': 'pollyDisplayOL', 'tmpFile': tmpFile, 'saveFolder': saveFolder})
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    import matplotlib
+    import matplotlib.pyplot as plt
+    t0 = time.perf_counter()
+    result = dict(entry, status='failed', images=[], error='')
+    try:
+        display = get_display_function(entry['script'])
+        with matplotlib.rc_context(), _record_saved_images(result['images']):
+            display(entry['tmpFile'], entry['saveFolder'])
+        result['status'] = 'ok' if result['images'] else 'no_image'
+    except Exception as e:
+        logging.exception("An error occurred")
+        result['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        plt.close('all')
+    result['elapsed_s'] = time.perf_counter() - t0
+    return result
+
+
+def render_legacy_batch(entries, jobs=1, delete_tmpfiles=False):
+    """
+    Description
+    -----------
+    Render all entries of a manifest, in this process or, with jobs > 1, in
+    a pool of processes. The legacy display functions and their
+    dependencies (scipy, matplotlib, colormaps) are imported once per
+    process instead of once per figure.
+
+    Parameters
+    ----------
+    entries: list
+        see read_manifest.
+    jobs: int
+        number of processes.
+    delete_tmpfiles: bool
+        delete the tmpFiles afterwards, as the MATLAB wrappers do after every call.
+
+    Returns
+    -------
+    results: list
+        one result per entry in the order of entries, see render_legacy_figure.
+
+    Usage
+    -----
+    results = render_legacy_batch(read_manifest(manifest_file), jobs=4)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if jobs <= 1 or len(entries) <= 1:
+        results = [render_legacy_figure(entry) for entry in entries]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(entries))) as executor:
+            results = list(executor.map(render_legacy_figure, entries))
+
+    if delete_tmpfiles:
+        for entry in entries:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry['tmpFile'])
+    return results
+
+
+def get_arg_parser():
+    my_parser = argparse.ArgumentParser(description='Render a batch of legacy pollyDisplay*.py figures in one python process.')
+    my_parser.add_argument('manifest', metavar='manifest',
+                           type=str,
+                           help='the manifest: lines of script<TAB>tmpFile<TAB>saveFolder, or a json-file with a list of {"script", "tmpFile", "saveFolder"}.')
+    my_parser.add_argument('--jobs', dest='jobs',
+                           type=int,
+                           default=1,
+                           help='number of processes to render the figures. Default is 1.')
+    my_parser.add_argument('--report', dest='report',
+                           type=str,
+                           help='json-file to write the result of every figure to.')
+    my_parser.add_argument('--delete_tmpfiles', dest='delete_tmpfiles',
+                           action='store_true',
+                           help='delete the tmpFiles after rendering.')
+    return my_parser
+
+
+def main(argv=None):
+    args = get_arg_parser().parse_args(argv)
+
+    entries = read_manifest(args.manifest)
+    results = render_legacy_batch(entries, jobs=args.jobs, delete_tmpfiles=args.delete_tmpfiles)
+
+    ## one line per figure: status, script, tmpFile and the images or the error
+    for result in results:
+        details = ';'.join(result['images']) if result['images'] else result['error']
+        print(f'{result["status"]}\t{result["script"]}\t{result["tmpFile"]}\t{details}')
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(results, f, indent=1)
+
+    n_failed = sum(result['status'] != 'ok' for result in results)
+    print(f'{len(results) - n_failed} of {len(results)} figures rendered.')
+    return 0 if n_failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,7 +8,6 @@ import os
 import re
 import sys
 import time
-import scipy.io as spio
 import numpy as np
 from datetime import datetime, timedelta, timezone
 import matplotlib
@@ -16,11 +15,10 @@ from matplotlib.patches import Patch
 import matplotlib.colors as colors
 import json
 from pathlib import Path
-import argparse
 #import pypolly_readout_profiles as readout_profiles
 import pypolly_readout as readout
+import pypolly_assets as assets
 import statistics
-import pandas as pd
 from statistics import mode
 
 # load colormap
@@ -98,13 +96,13 @@ def pollyDisplay_profile(nc_dict_profile,profile_translator,profilename,config_d
     else:
         dataFilename = re.split(r'_profiles',nc_dict_profile['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     saveFolder = outdir
     plotfile = f"{dataFilename}_{profile_translator[profilename]['plot_filename']}.{imgFormat}"
     saveFilename = os.path.join(saveFolder,plotfile)
 
+    readout.profile_switch('draw')
     # display WVMR-profile
     fig = plt.figure(figsize=[6, 9])
     ax = fig.add_axes([0.21, 0.15, 0.74, 0.75])
@@ -162,11 +160,7 @@ def pollyDisplay_profile(nc_dict_profile,profile_translator,profilename,config_d
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -285,7 +279,7 @@ refH1064: {refHBase1064:.1f}-{refHTop1064:.1f} km',
             r'LR$_{532}$: '+f'{fixed_LR_ls[1]:.2f}\n'+\
             r'LR$_{1064}$: '+f'{fixed_LR_ls[2]:.2f}',fontsize=11, backgroundcolor=[0.94, 0.95, 0.96, 0.8], alpha=1)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
 
     plt.close()
 
@@ -332,6 +326,7 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
     -------
     2022-09-01. First edition by Andi
     """
+    import pandas as pd
 
     ## read from config file
     figDPI = config_dict['figDPI']
@@ -364,14 +359,14 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     saveFolder = outdir
     dataFilename = re.split(r'_overlap',nc_dict['PollyDataFile'])[0]
     plotfile = f"{dataFilename}_{profile_calib_translator[profilename]['plot_filename']}.{imgFormat}"
     saveFilename = os.path.join(saveFolder,plotfile)
 
+    readout.profile_switch('draw')
     fig = plt.figure(figsize=[12, 6])
     ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
 
@@ -421,10 +416,7 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -444,7 +436,7 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
         fig.text(
             0.2, 0.02,
             f'{nc_dict["m_date"]}\nVersion: {version}',fontsize=12)
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
 
     plt.close()
 
@@ -522,8 +514,7 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     saveFolder = outdir
 #    dataFilename = re.split(r'_overlap',nc_dict['PollyDataFile'])[0]
@@ -559,6 +550,7 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
     }
 
     #fig = plt.figure(figsize=[12, 6])
+    readout.profile_switch('draw')
     fig, ax = plt.subplots(nrows=6, ncols=1, figsize=(12, 18))
     #ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
     for n,w in enumerate(LC_sql_dataframe.keys()):
@@ -622,10 +614,7 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -646,7 +635,7 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
             0.2, 0.02,
             f'Version: {version}',fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
 
     plt.close()
 
@@ -713,8 +702,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
     location = nc_dict['location']
     version = nc_dict['PicassoVersion']
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
     saveFolder = outdir
     dataFilename = re.split(r'_overlap',nc_dict['PollyDataFile'])[0]
@@ -729,6 +717,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
     laserlogbook_df['Temp1064'] = laserlogbook_df['Temp1064'].mask(laserlogbook_df['Temp1064'] < -120, np.nan)
 
     nrows = 5
+    readout.profile_switch('draw')
     fig, ax = plt.subplots(nrows=nrows, ncols=1, figsize=(12, 18))
 
     for r in range(0,nrows):
@@ -761,7 +750,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
     laserlogbook_df['shutter'] = laserlogbook_df['shutter'].astype(int)
     states_params = ['rain','roof','shutter']
     state_colormap = ['navajowhite', 'coral', 'skyblue', 'm', 'mediumaquamarine']
-    cmap = colors.ListedColormap(state_colormap)
+    cmap = assets.get_listed_colormap(state_colormap)
     matrix = laserlogbook_df[states_params].values
 
     pcmesh = ax[4].pcolormesh(
@@ -794,10 +783,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -817,7 +803,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
         fig.text(
             0.2, 0.02,
             f'{nc_dict["m_date"]}\nVersion: {version}',fontsize=12)
-    fig.savefig(saveFilename,dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
 
     plt.close()
 
@@ -891,8 +877,7 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
     version = nc_dict_profile['PicassoVersion']
     dataFilename = re.split(r'_profiles',nc_dict_profile['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
 
     if ymax == 'high_range':
@@ -1106,6 +1091,7 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
         ax[col].set_ylim(ylim[0],ylim[1]/1000)
         ax[col].legend(loc='upper right',fontsize=14)
     
+    readout.profile_switch('draw')
     fig, ax = plt.subplots(1,cols, figsize=(25, 17))
 
 
@@ -1209,11 +1195,7 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1231,7 +1213,7 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
             va='bottom', alpha=1, zorder=10)
 
     
-    fig.savefig(saveFilename, dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
     
     plt.close()
 
@@ -1304,8 +1286,7 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
     version = nc_dict_profile['PicassoVersion']
     dataFilename = re.split(r'_profiles',nc_dict_profile['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
 
     if ymax == 'high_range':
@@ -1439,6 +1420,7 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
         ax[col].legend(loc='upper right',fontsize=14)
 
 
+    readout.profile_switch('draw')
     fig, ax = plt.subplots(1,cols, figsize=(25, 17))
 
     axes_fontsize = 18
@@ -1537,11 +1519,7 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.08, 0.04], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1559,7 +1537,7 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
             va='bottom', alpha=1, zorder=10)
 
     
-    fig.savefig(saveFilename, dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
     
     plt.close()
 
@@ -1631,8 +1609,7 @@ def pollyDisplay_profile_summary_meteo(nc_dict_profile,config_dict,polly_conf_di
     version = nc_dict_profile['PicassoVersion']
     dataFilename = re.split(r'_profiles',nc_dict_profile['PollyDataFile'])[0]
     # set the default font
-    matplotlib.rcParams['font.sans-serif'] = fontname
-    matplotlib.rcParams['font.family'] = "sans-serif"
+    assets.use_font(fontname)
 
 
     if ymax == 'high_range':
@@ -1718,6 +1695,7 @@ def pollyDisplay_profile_summary_meteo(nc_dict_profile,config_dict,polly_conf_di
         ax[col].set_ylim(ylim[0],ylim[1]/1000)
         ax[col].legend(loc='upper right',fontsize=16)
     
+    readout.profile_switch('draw')
     fig, ax = plt.subplots(1,cols, figsize=(25, 17))
 
     axes_fontsize = 20
@@ -1760,11 +1738,7 @@ def pollyDisplay_profile_summary_meteo(nc_dict_profile,config_dict,polly_conf_di
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = assets.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1782,7 +1756,7 @@ def pollyDisplay_profile_summary_meteo(nc_dict_profile,config_dict,polly_conf_di
             va='bottom', alpha=1, zorder=10)
 
     
-    fig.savefig(saveFilename, dpi=figDPI)
+    readout.save_figure(fig, saveFilename, dpi=figDPI)
     
     plt.close()
 
@@ -0,0 +1,526 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.dates import DateFormatter, HourLocator
+from matplotlib.colors import Normalize
+from matplotlib.image import AxesImage
+from matplotlib.transforms import Affine2D, Bbox, IdentityTransform, TransformedBbox
+import matplotlib
+import pypolly_readout as readout
+import pypolly_assets as assets
+try:
+    ## private helper of AxesImage, which LutImage uses to sample the pixels exactly like AxesImage;
+    ## without it (other matplotlib versions), the images are drawn by AxesImage
+    from matplotlib.image import _resample
+except ImportError:
+    _resample = None
+
+## axes positions and tick styles of the time-height quicklooks
+LAYOUTS = {
+    'standard': {'ax': [0.11, 0.15, 0.79, 0.75], 'cb_ax': [0.92, 0.25, 0.02, 0.55],
+                 'labelsize': 15, 'cb_direction': 'in', 'cb_labelsize': 15},
+    'target_class': {'ax': [0.09, 0.15, 0.67, 0.75], 'cb_ax': [0.77, 0.15, 0.01, 0.75],
+                     'labelsize': 12, 'cb_direction': 'out', 'cb_labelsize': 9},
+}
+
+## number of figure templates kept per process
+TEMPLATE_CACHE_SIZE = 16
+
+_TEMPLATES = OrderedDict()
+
+
+def _colormap_key(cmap):
+    ## colormaps are created anew for every plot, so they are compared by their colors
+    colors = getattr(cmap, 'colors', None)
+    if colors is not None:
+        colors = tuple(map(tuple, np.asarray(colors, dtype=float).tolist()))
+    return (cmap.name, cmap.N, colors, tuple(cmap.get_bad()))
+
+
+#### direct LUT raster
+
+def _sample_indices(image, n, matrix, axis, size):
+    ## source indices of size output pixels along axis (1 for columns, 0 for rows) as sampled
+    ## by agg, -1 outside of the data: an index probe is resampled like the data by AxesImage
+    affine = np.eye(3)
+    affine[axis] = matrix[axis]
+    affine[axis, 1 - axis] = 0
+    shape = (1, n) if axis == 0 else (n, 1)
+    probe = np.arange(1, n + 1, dtype=float).reshape(shape)
+    out_shape = (1, size) if axis == 0 else (size, 1)
+    return _resample(image, probe, out_shape, Affine2D(affine)).ravel().astype(np.int64) - 1
+
+
+def colormap_lut(cmap):
+    """
+    Description
+    -----------
+    Lookup table of cmap as uint8 RGBA: the cmap.N colors (256 for most
+    colormaps), followed by the under, over and bad colors.
+
+    Usage
+    -----
+    lut = colormap_lut(cmap)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    return np.concatenate([cmap(np.arange(cmap.N), bytes=True),
+                           cmap(np.array([-1, cmap.N]), bytes=True),
+                           cmap(np.ma.masked_all(1), bytes=True)])
+
+
+def lut_colorize(data, norm, lut):
+    """
+    Description
+    -----------
+    Map data to uint8 RGBA with the lookup table of colormap_lut, exactly
+    as ScalarMappable.to_rgba(data, bytes=True): scaled by norm (linear or
+    LogNorm), values below 0 or above 1 get the under or over color,
+    masked and nan-values the bad color.
+
+    Parameters
+    ----------
+    data: array or masked array
+        the values.
+    norm: matplotlib.colors.Normalize
+        the scaling of the values, e.g. Normalize(vmin, vmax) or LogNorm(vmin, vmax).
+    lut: (N+3, 4) uint8 array
+        see colormap_lut.
+
+    Returns
+    -------
+    rgba: (..., 4) uint8 array
+
+    Usage
+    -----
+    rgba = lut_colorize(matrix, Normalize(zLim[0], zLim[1]), colormap_lut(cmap))
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    N = len(lut) - 3
+    scaled = norm(data)
+    xa = np.ma.getdata(scaled).astype(float) * N
+    xa[xa == N] = N - 1
+    mask_under = xa < 0
+    mask_over = xa >= N
+    mask_bad = np.ma.getmaskarray(scaled) | np.isnan(xa)
+    with np.errstate(invalid='ignore'):
+        index = xa.astype(int)
+    index[mask_under] = N
+    index[mask_over] = N + 1
+    index[mask_bad] = N + 2
+    return lut.take(index, axis=0, mode='clip')
+
+
+class LutImage(AxesImage):
+    """
+    Description
+    -----------
+    AxesImage with interpolation 'none' for the Agg backend, which first
+    picks the data values of the screen pixels and then colors only these
+    with a lookup table, instead of colormapping and resampling the full
+    time-height matrix. The rows and columns of the screen pixels are
+    sampled by matplotlib's own resampling of index vectors, so the raster
+    is identical to the one of AxesImage, apart from rare pixels at the
+    right edge of the image. RGBA-data, other transforms and matplotlib
+    versions without matplotlib.image._resample fall back to AxesImage.
+
+    Usage
+    -----
+    image = LutImage(ax, cmap=cmap, norm=Normalize(zLim[0], zLim[1]), interpolation='none')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    _lut = None
+    _lut_cmap = None
+
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        A = self._A
+        trans = self.get_transform()
+        alpha = self.get_alpha()
+        if (_resample is None or unsampled or A is None or A.ndim != 2 or not trans.is_affine
+                or np.ndim(alpha) > 0):
+            return super().make_image(renderer, magnification, unsampled)
+
+        ## the pixels of the image, as in AxesImage._make_image
+        x1, x2, y1, y2 = self.get_extent()
+        bbox = Bbox(np.array([[x1, y1], [x2, y2]]))
+        clip = ((self.get_clip_box() or self.axes.bbox) if self.get_clip_on()
+                else self.figure.bbox)
+        clipped_bbox = Bbox.intersection(TransformedBbox(bbox, trans), clip)
+        if clipped_bbox is None:
+            return None, 0, 0, None
+        extents = clipped_bbox.extents * magnification
+        out_bbox = Bbox.from_extents([np.floor(extents[0] + 0.5), np.ceil(extents[1] - 0.5 - 1e-8),
+                                      np.floor(extents[2] + 0.5 + 1e-8), np.ceil(extents[3] - 0.5)])
+        if out_bbox.width == 0 or out_bbox.height == 0:
+            return None, 0, 0, None
+        t0 = Affine2D().translate(0, -A.shape[0]).scale(1, -1) if self.origin == 'upper' else IdentityTransform()
+        t = (t0 + Affine2D().scale(bbox.width / A.shape[1], bbox.height / A.shape[0]).translate(bbox.x0, bbox.y0)
+             + trans + Affine2D().scale(magnification).translate(-out_bbox.x0, -out_bbox.y0))
+        matrix = t.get_matrix()
+        if matrix[0, 1] != 0 or matrix[1, 0] != 0:
+            return super().make_image(renderer, magnification, unsampled)
+
+        ## data value of every screen pixel, pixels outside of the data stay transparent
+        try:
+            cols = _sample_indices(self, A.shape[1], matrix, 0, int(out_bbox.width))
+            rows = _sample_indices(self, A.shape[0], matrix, 1, int(out_bbox.height))
+        except TypeError:
+            ## _resample with another signature
+            return super().make_image(renderer, magnification, unsampled)
+        inside = ((rows >= 0) & (rows < A.shape[0]))[:, None] & ((cols >= 0) & (cols < A.shape[1]))[None, :]
+        sampled = A[np.clip(rows, 0, A.shape[0] - 1)[:, None], np.clip(cols, 0, A.shape[1] - 1)[None, :]]
+
+        self.norm.autoscale_None(A)
+        if self._lut_cmap is not self.cmap:
+            self._lut = colormap_lut(self.cmap)
+            self._lut_cmap = self.cmap
+        output = lut_colorize(sampled, self.norm, self._lut)
+        output[~inside] = 0
+        if alpha is not None and alpha != 1:
+            output[..., 3] = (output[..., 3].astype(np.float32) * alpha)
+        return output, out_bbox.x0 / magnification, out_bbox.y0 / magnification, t
+
+
+#### decimation to the pixel grid
+
+## methods of decimate_to_pixels
+DECIMATION_METHODS = ('mean', 'max', 'nearest')
+
+
+def _pool_axis(x, m, axis, ufunc):
+    ## combine the cells of x along axis into m groups with ufunc, the cells of group k lie in
+    ## output pixel k
+    n = x.shape[axis]
+    starts = (np.arange(m) * n + m - 1) // m
+    if axis == x.ndim - 1:
+        return ufunc.reduceat(x, starts, axis=axis)
+    ## reduceat is slow along the other axes; the groups have f or f + 1 cells, which are combined by gathers
+    sizes = np.diff(np.append(starts, n))
+    f = sizes.min()
+    pooled = np.take(x, starts, axis=axis)
+    for j in range(1, f):
+        ufunc(pooled, np.take(x, starts + j, axis=axis), out=pooled)
+    longer = np.nonzero(sizes > f)[0]
+    if len(longer):
+        index = (slice(None),) * axis + (longer,)
+        pooled[index] = ufunc(pooled[index], np.take(x, starts[longer] + f, axis=axis))
+    return pooled
+
+
+def decimate_to_pixels(matrix, shape, method='mean'):
+    """
+    Description
+    -----------
+    Pool matrix to at most shape cells, i.e. the pixel grid of the axes,
+    before it is plotted. Along every axis with more cells than pixels, the
+    cells of each pixel are combined into one, axes with fewer cells are
+    kept. With 'mean' and 'max', masked and nan-values are ignored and a
+    pixel is masked, if more than half of its cells are; 'nearest' takes
+    the cell at the center of each pixel and is meant for categorical data,
+    e.g. target classes or quality masks.
+
+    Parameters
+    ----------
+    matrix: 2-d array or masked array
+        the image.
+    shape: tuple
+        (rows, columns) of the pixel grid.
+    method: str
+        'mean', 'max' or 'nearest'.
+
+    Returns
+    -------
+    matrix: 2-d masked array
+        the pooled image, with the same extent.
+
+    Usage
+    -----
+    ATT_BETA = decimate_to_pixels(ATT_BETA, (675, 1422), method='mean')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f'unknown decimation method {method}, expected one of {DECIMATION_METHODS}')
+    rows, cols = (min(n, max(int(m), 1)) for n, m in zip(matrix.shape, shape))
+    if (rows, cols) == matrix.shape:
+        return matrix
+
+    if method == 'nearest':
+        row_index = ((2 * np.arange(rows) + 1) * matrix.shape[0]) // (2 * rows)
+        col_index = ((2 * np.arange(cols) + 1) * matrix.shape[1]) // (2 * cols)
+        return np.ma.asarray(matrix)[row_index[:, None], col_index[None, :]]
+
+    data = np.ma.getdata(matrix)
+    valid = ~np.ma.getmaskarray(matrix)
+    if np.issubdtype(data.dtype, np.floating):
+        valid &= ~np.isnan(data)
+    ## the time axis is pooled first, it is the longer one
+    count = _pool_axis(_pool_axis(valid.astype(np.int32), cols, 1, np.add), rows, 0, np.add)
+    if method == 'mean':
+        pooled = _pool_axis(_pool_axis(np.where(valid, data, 0.), cols, 1, np.add), rows, 0, np.add)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pooled /= count
+    else:
+        pooled = _pool_axis(_pool_axis(np.where(valid, data, -np.inf), cols, 1, np.maximum), rows, 0, np.maximum)
+    size = np.outer(_pool_axis(np.ones(matrix.shape[0], dtype=np.int32), rows, 0, np.add),
+                    _pool_axis(np.ones(matrix.shape[1], dtype=np.int32), cols, 0, np.add))
+    return np.ma.masked_where(2 * count < size, pooled)
+
+
+class TimeHeightTemplate:
+    """
+    Description
+    -----------
+    Figure of a time-height quicklook, which is built once and reused for
+    every image with the same layout: the axes, tick locators, colorbar,
+    watermark and text artists are kept, only the image data, its extent,
+    the title and the texts are updated per image.
+
+    Parameters
+    ----------
+    layout: str
+        key of LAYOUTS.
+    vmin, vmax: float
+        color range of the image.
+    cmap: matplotlib.colors.Colormap
+        colormap, including the color of bad values.
+    flagPlotLastProfilesOnly: bool
+        major ticks every 2 hours instead of at 4, 8, ..., 24 UTC.
+    flagWatermarkOn: bool
+        add the license and the "Preliminary Results." watermark.
+    cbar_ticks: array
+        ticks of the colorbar, default np.linspace(vmin, vmax, 5).
+    cbar_ticklabels: list
+        labels of the colorbar ticks, e.g. the target classes.
+    fast_raster: bool
+        draw the image as LutImage.
+
+    Usage
+    -----
+    template = TimeHeightTemplate('standard', 0, 10, cmap, False, True)
+    template.render(matrix, extent, title, cbar_title, info_text, version_text, partnerLabel, saveFilename, dpi=figDPI)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, layout, vmin, vmax, cmap, flagPlotLastProfilesOnly, flagWatermarkOn,
+                 cbar_ticks=None, cbar_ticklabels=None, fast_raster=False):
+        style = LAYOUTS[layout]
+        self.fig = Figure(figsize=[12, 6])
+        FigureCanvasAgg(self.fig)
+        ## colors kept exactly in indexed png-files
+        self.palette = colormap_lut(cmap)
+        self.ax = self.fig.add_axes(style['ax'])
+        ## placeholder, which is replaced by the data of the first image
+        if fast_raster and _resample is None:
+            logging.warning('flagFastRaster is ignored, this matplotlib version has no matplotlib.image._resample')
+        if fast_raster and _resample is not None:
+            ## what imshow does, with a LutImage
+            self.image = LutImage(self.ax, cmap=cmap, norm=Normalize(vmin, vmax), interpolation='none')
+            self.image.set_data(np.ma.masked_all((1, 1)))
+            self.image.set_clip_path(self.ax.patch)
+            self.image.set_extent([0, 1, 0, 1])
+            self.ax.add_image(self.image)
+        else:
+            self.image = self.ax.imshow(
+                    np.ma.masked_all((1, 1)),
+                    cmap=cmap,
+                    vmin=vmin,
+                    vmax=vmax,
+                    interpolation='none',
+                    aspect='auto',
+                    extent=[0, 1, 0, 1],
+                    )
+        # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
+        self.ax.xaxis_date()
+
+        self.ax.set_xlabel('Time [UTC]', fontsize=15)
+        self.ax.set_ylabel('Height [km]', fontsize=15)
+
+        self.ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
+        if flagPlotLastProfilesOnly == True:
+            self.ax.xaxis.set_major_locator(HourLocator(interval=2))
+        else:
+            self.ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
+
+        self.ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
+
+        self.ax.tick_params(
+            axis='both', which='major', labelsize=style['labelsize'], right=True,
+            top=True, width=2, length=5)
+        self.ax.tick_params(
+            axis='both', which='minor', width=1.5, length=3.5,
+            right=True, top=True)
+
+        self.title = self.ax.set_title('', fontsize=15)
+
+        cb_ax = self.fig.add_axes(style['cb_ax'])
+        self.cbar_ticks = cbar_ticks
+        if cbar_ticks is None:
+            cbar_ticks = np.linspace(vmin, vmax, 5)
+        self.cbar = self.fig.colorbar(
+            self.image,
+            cax=cb_ax,
+            ticks=cbar_ticks,
+            orientation='vertical')
+        if cbar_ticklabels is not None:
+            self.cbar.ax.set_yticklabels(cbar_ticklabels)
+            self.cbar_title = None
+        else:
+            self.cbar_title = self.cbar.ax.set_title('', fontsize=10)
+        self.cbar.ax.tick_params(direction=style['cb_direction'], labelsize=style['cb_labelsize'], pad=5)
+
+        # add watermark
+        self.copyright = None
+        if flagWatermarkOn:
+            newax_license = self.fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
+            newax_license.imshow(assets.get_license_image(), alpha=0.8, aspect='equal')
+            newax_license.axis('off')
+
+            self.fig.text(0.72, 0.003, 'Preliminary\nResults.',
+                          fontweight='bold', fontsize=12, color='red',
+                          ha='left', va='bottom', alpha=0.8, zorder=10)
+
+            self.copyright = self.fig.text(
+                0.84, 0.003, '',
+                fontweight='bold', fontsize=7, color='black', ha='left',
+                va='bottom', alpha=1, zorder=10)
+
+        self.info_text = self.fig.text(0.05, 0.02, '', fontsize=12)
+        self.version_text = self.fig.text(0.2, 0.02, '', fontsize=12)
+
+    def set_limits(self, vmin, vmax):
+        """set the color limits of the image and, without fixed colorbar ticks, the 5 ticks of the colorbar."""
+        if self.image.norm.vmin == vmin and self.image.norm.vmax == vmax:
+            return
+        self.image.set_clim(vmin, vmax)
+        if self.cbar_ticks is None:
+            self.cbar.set_ticks(np.linspace(vmin, vmax, 5))
+
+    def render(self, matrix, extent, title, cbar_title, info_text, version_text, partnerLabel, saveFilename, dpi,
+               decimation=None):
+        """
+        Description
+        -----------
+        Draw matrix into the template and save the figure to saveFilename.
+
+        Parameters
+        ----------
+        matrix: 2-d array
+            the image, already transposed and flipped.
+        extent: list
+            [left, right, bottom, top] of the image, see readout.TimeGrid.extent.
+        title, cbar_title, info_text, version_text: str
+            title of the axes and of the colorbar (ignored with tick labels),
+            the texts at the lower left corner.
+        partnerLabel: str
+            label in the copyright of the watermark.
+        saveFilename: str
+            the image file.
+        dpi: int
+            resolution of the image.
+        decimation: str
+            pool matrix to the pixels of the axes before it is drawn, see
+            decimate_to_pixels; None draws the full matrix.
+
+        History
+        -------
+        2026-10-18. First edition
+        """
+        if decimation is not None:
+            ## the image fills the axes
+            shape = (self.ax.bbox.height * dpi / self.fig.dpi, self.ax.bbox.width * dpi / self.fig.dpi)
+            matrix = decimate_to_pixels(matrix, tuple(int(np.ceil(n)) for n in shape), method=decimation)
+        self.image.set_data(matrix)
+        ## the limits of the previous image must not widen the ones of this image
+        self.ax.ignore_existing_data_limits = True
+        self.image.set_extent(extent)
+        self.title.set_text(title)
+        if self.cbar_title is not None:
+            self.cbar_title.set_text(cbar_title)
+        if self.copyright is not None:
+            self.copyright.set_text(
+                u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
+                    datetime.now().strftime('%Y'), partnerLabel))
+        self.info_text.set_text(info_text)
+        self.version_text.set_text(version_text)
+        try:
+            readout.save_figure(self.fig, saveFilename, palette=self.palette, dpi=dpi)
+        finally:
+            ## the template must not keep the data of the nc-file alive
+            self.image.set_data(np.ma.masked_all((1, 1)))
+
+
+def get_time_height_template(layout, zLim, cmap, flagPlotLastProfilesOnly, fontname, flagWatermarkOn,
+                             cbar_ticks=None, cbar_ticklabels=None, fast_raster=False):
+    """
+    Description
+    -----------
+    The TimeHeightTemplate of this process for (layout, colormap,
+    flagPlotLastProfilesOnly), built on first use, with the color limits
+    zLim. zLim is not part of the key, since it often depends on the data
+    (e.g. of the SNR). The font is part of the key, since the texts keep
+    the font they were created with. At most
+    TEMPLATE_CACHE_SIZE templates are kept, the least recently used ones
+    are dropped.
+
+    Parameters
+    ----------
+    layout: str
+        key of LAYOUTS.
+    zLim: list
+        [vmin, vmax] of the image.
+    cmap: matplotlib.colors.Colormap
+        colormap, including the color of bad values.
+    flagPlotLastProfilesOnly, flagWatermarkOn: bool
+        see TimeHeightTemplate.
+    fontname: str
+        the sans-serif font of the figure.
+    cbar_ticks, cbar_ticklabels, fast_raster:
+        see TimeHeightTemplate.
+
+    Usage
+    -----
+    template = get_time_height_template('standard', zLim, cmap, config_dict['flagPlotLastProfilesOnly'], fontname, flagWatermarkOn)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    ## zLim is set for every figure, it often depends on the data (e.g. SNR)
+    key = (layout, _colormap_key(cmap), bool(flagPlotLastProfilesOnly),
+           fontname, bool(flagWatermarkOn),
+           None if cbar_ticks is None else tuple(float(t) for t in cbar_ticks),
+           None if cbar_ticklabels is None else tuple(cbar_ticklabels), bool(fast_raster))
+    template = _TEMPLATES.pop(key, None)
+    if template is None:
+        logging.debug(f'new figure template for {layout}')
+        with matplotlib.rc_context({'font.sans-serif': fontname, 'font.family': 'sans-serif'}):
+            template = TimeHeightTemplate(layout, zLim[0], zLim[1], cmap, flagPlotLastProfilesOnly, flagWatermarkOn,
+                                          cbar_ticks=cbar_ticks, cbar_ticklabels=cbar_ticklabels, fast_raster=fast_raster)
+    template.set_limits(zLim[0], zLim[1])
+    _TEMPLATES[key] = template
+    while len(_TEMPLATES) > TEMPLATE_CACHE_SIZE:
+        _TEMPLATES.popitem(last=False)
+    return template
+
+
+def clear_templates():
+    """drop all figure templates of this process."""
+    _TEMPLATES.clear()
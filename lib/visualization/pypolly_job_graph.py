@@ -0,0 +1,365 @@
+import heapq
+import math
+import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+
+class Job:
+    """
+    Description
+    -----------
+    One node of a JobGraph: func(ctx, *results of deps, **kwargs).
+    ctx is the context of the job or, if None, the one given to run().
+
+    Parameters
+    ----------
+    key: hashable
+        unique key of the job within the graph.
+    func: callable
+        module-level function (picklable), which runs the job.
+    deps: tuple
+        keys of the jobs, whose results are passed to func in this order.
+    kind: str
+        'load', 'derive' or 'figure'; only used by describe().
+    label: str
+        short description for describe() and log messages.
+    group: str
+        name of the retrieval the job belongs to.
+    kwargs: dict
+        keyword arguments of func.
+    ctx: object
+        context of the job, e.g. the device and date it belongs to.
+    inputs: tuple
+        files read by the job, see JobGraph.input_files.
+    release: callable
+        release(ctx, result) frees the result (e.g. a loaded dataset), when
+        its last consumer has finished. Such jobs count as datasets for
+        the max_datasets of JobGraph.run.
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    __slots__ = ('key', 'func', 'deps', 'kind', 'label', 'group', 'kwargs', 'ctx', 'inputs', 'release')
+
+    def __init__(self, key, func, deps=(), kind='figure', label='', group='', kwargs=None, ctx=None, inputs=(), release=None):
+        self.key = key
+        self.func = func
+        self.deps = tuple(deps)
+        self.kind = kind
+        self.label = label
+        self.group = group
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.ctx = ctx
+        self.inputs = tuple(inputs)
+        self.release = release
+
+
+class JobGraph:
+    """
+    Description
+    -----------
+    Directed acyclic graph of jobs. A job can only depend on jobs added
+    before it, so the insertion order is a valid execution order. Adding a
+    job with an existing key returns the existing job, i.e. a dataset is
+    loaded (or a quantity derived) once and fanned out to all consumers.
+
+    The results of the sinks (jobs without consumers, e.g. figures) are
+    returned by run(); intermediate results are only kept within the
+    process, which runs the work unit of the graph (see work_units), and
+    are dropped as soon as their last consumer has finished.
+
+    Usage
+    -----
+    graph = JobGraph()
+    load = graph.add(('load', nc_file), read_func, kind='load', label=nc_file)
+    graph.add(('figure', nc_file, 532), plot_func, deps=[load], wavelength=532)
+    print(graph.describe())
+    results = graph.run(ctx, jobs=8, max_datasets=2)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self):
+        self.jobs = OrderedDict()
+        self._consumers = {}
+
+    def __contains__(self, key):
+        return key in self.jobs
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __getitem__(self, key):
+        return self.jobs[key]
+
+    def add(self, key, func, deps=(), kind='figure', label='', group='', ctx=None, inputs=(), release=None, **kwargs):
+        if key in self.jobs:
+            return key
+        self._insert(Job(key, func, deps, kind, label or str(key), group, kwargs, ctx, inputs, release))
+        return key
+
+    def _insert(self, job):
+        for dep in job.deps:
+            if dep not in self.jobs:
+                raise KeyError(f'job {job.key} depends on unknown job {dep}')
+        self.jobs[job.key] = job
+        self._consumers[job.key] = []
+        for dep in job.deps:
+            self._consumers[dep].append(job.key)
+
+    def update(self, other):
+        """add the jobs of the JobGraph other, which are not in this one yet."""
+        for key, job in other.jobs.items():
+            if key not in self.jobs:
+                self._insert(job)
+
+    def consumers(self, key):
+        return list(self._consumers[key])
+
+    def ancestors(self, key):
+        """keys of all jobs, key depends on directly or indirectly."""
+        ancestors = set()
+        stack = list(self.jobs[key].deps)
+        while stack:
+            dep = stack.pop()
+            if dep not in ancestors:
+                ancestors.add(dep)
+                stack.extend(self.jobs[dep].deps)
+        return ancestors
+
+    def input_files(self, key):
+        """sorted files read by key and all jobs it depends on."""
+        files = set(self.jobs[key].inputs)
+        for dep in self.ancestors(key):
+            files.update(self.jobs[dep].inputs)
+        return sorted(str(file) for file in files)
+
+    def subgraph(self, keys):
+        """new JobGraph with the jobs keys and all jobs they depend on."""
+        needed = set(keys)
+        for key in keys:
+            needed.update(self.ancestors(key))
+        graph = JobGraph()
+        for key, job in self.jobs.items():
+            if key in needed:
+                graph._insert(job)
+        return graph
+
+    def sinks(self):
+        """keys of the jobs without consumers, in insertion order."""
+        return [key for key in self.jobs if not self._consumers[key]]
+
+    def components(self):
+        """connected components of the graph, each as list of keys in insertion order."""
+        parent = {key: key for key in self.jobs}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for key, job in self.jobs.items():
+            for dep in job.deps:
+                parent[find(dep)] = find(key)
+        components = OrderedDict()
+        for key in self.jobs:
+            components.setdefault(find(key), []).append(key)
+        return list(components.values())
+
+    def describe(self):
+        """the plan as text, one line per job in execution order."""
+        index = {key: n for n, key in enumerate(self.jobs)}
+        width = len(str(len(self.jobs)))
+        lines = []
+        for key, job in self.jobs.items():
+            deps = ' '.join(f'[{index[dep]:>{width}}]' for dep in job.deps)
+            line = f'[{index[key]:>{width}}] {job.kind:<6} {job.label}'
+            if deps:
+                line = f'{line}  <- {deps}'
+            lines.append(line)
+        counts = OrderedDict()
+        for job in self.jobs.values():
+            counts[job.kind] = counts.get(job.kind, 0) + 1
+        summary = ', '.join(f'{n} {kind}' for kind, n in counts.items())
+        lines.append(f'{len(self.jobs)} jobs ({summary}) in {len(self.components())} independent components')
+        return '\n'.join(lines)
+
+    def work_units(self, jobs):
+        """
+        the graph split into jobs lists for jobs processes: every connected
+        component is a unit, components with more than their share of the
+        sinks (e.g. all figures of one nc-file) are split into chunks of
+        sinks, each with the jobs it depends on. The load and derive jobs of
+        a split component therefore run once per unit, i.e. the file is read
+        once per process (and found in its nc-file cache for further units).
+        """
+        share = max(1, math.ceil(len(self.sinks()) / jobs))
+        units = []
+        for component in self.components():
+            sinks = [key for key in component if not self._consumers[key]]
+            if len(sinks) <= share:
+                units.append([self.jobs[key] for key in component])
+                continue
+            for start in range(0, len(sinks), share):
+                units.append(list(self.subgraph(sinks[start:start + share]).jobs.values()))
+        ## largest units first, to keep all workers busy until the end
+        units.sort(key=len, reverse=True)
+        return units
+
+    def run(self, ctx=None, jobs=1, max_datasets=None):
+        """
+        run all jobs and return {key: result} of the sinks in insertion order.
+
+        With jobs > 1 the work units (see work_units) are distributed over a
+        pool of processes. The figures of one nc-file run in parallel as
+        well, at the cost of reading the file once per process.
+
+        If a worker process dies (e.g. out of memory), the units, which had
+        not finished, are run again one by one, each in a new process, so
+        only the unit of the crashed process fails. Failed jobs are missing
+        in the result.
+
+        With max_datasets, the jobs of every process are reordered, so that
+        at most max_datasets results of jobs with a release function (e.g.
+        loaded nc-files) are held at a time, see _bounded_order.
+        """
+        units = self.work_units(jobs) if jobs > 1 else []
+        if len(units) <= 1:
+            results = _run_jobs(ctx, list(self.jobs.values()), max_datasets)
+        else:
+            results = {}
+            broken = []
+            with ProcessPoolExecutor(max_workers=min(jobs, len(units)), initializer=_init_worker, initargs=(ctx, max_datasets)) as executor:
+                futures = {executor.submit(_run_worker_jobs, unit): unit for unit in units}
+                for future in as_completed(futures):
+                    try:
+                        results.update(future.result())
+                    except BrokenProcessPool:
+                        broken.append(futures[future])
+                    except Exception as e:
+                        logging.exception("An error occurred")
+            if broken:
+                logging.warning(f'a worker process died, running {len(broken)} unfinished work unit(s) one by one')
+                for unit in broken:
+                    results.update(_run_isolated(ctx, unit, max_datasets))
+        return {key: results[key] for key in self.sinks() if key in results}
+
+
+def _bounded_order(jobs, max_datasets):
+    ## topological order, which starts a dataset job only if fewer than max_datasets
+    ## datasets are held, i.e. the consumers of a dataset run before the next one is
+    ## loaded; if only dataset jobs are ready (a job needs more datasets at once), the
+    ## limit is exceeded. Ready jobs are kept in two heaps by their position in jobs,
+    ## so the first suitable ready job is taken as in a scan of the pending jobs.
+    position = {job.key: n for n, job in enumerate(jobs)}
+    waiting = [0] * len(jobs)
+    consumers = [[] for job in jobs]
+    remaining = {}
+    for n, job in enumerate(jobs):
+        for dep in job.deps:
+            remaining[dep] = remaining.get(dep, 0) + 1
+            if dep in position:
+                waiting[n] += 1
+                consumers[position[dep]].append(n)
+    ready_datasets = []
+    ready_others = []
+
+    def make_ready(n):
+        heapq.heappush(ready_others if jobs[n].release is None else ready_datasets, n)
+
+    for n in range(len(jobs)):
+        if not waiting[n]:
+            make_ready(n)
+    held = set()
+    order = []
+    while ready_datasets or ready_others:
+        if ready_datasets and (not ready_others or (len(held) < max_datasets and ready_datasets[0] < ready_others[0])):
+            n = heapq.heappop(ready_datasets)
+        else:
+            n = heapq.heappop(ready_others)
+        job = jobs[n]
+        order.append(job)
+        if job.release is not None and remaining.get(job.key):
+            held.add(job.key)
+        for dep in job.deps:
+            remaining[dep] -= 1
+            if not remaining[dep]:
+                held.discard(dep)
+        for consumer in consumers[n]:
+            waiting[consumer] -= 1
+            if not waiting[consumer]:
+                make_ready(consumer)
+    return order
+
+
+def _run_jobs(ctx, jobs, max_datasets=None):
+    ## run jobs in the given (topological) order; dependants of failed jobs are skipped
+    ## and results are released after their last consumer
+    if max_datasets:
+        jobs = _bounded_order(jobs, max_datasets)
+    remaining = {}
+    for job in jobs:
+        for dep in job.deps:
+            remaining[dep] = remaining.get(dep, 0) + 1
+    by_key = {job.key: job for job in jobs}
+    results = {}
+    failed = set()
+    for job in jobs:
+        job_ctx = job.ctx if job.ctx is not None else ctx
+        failed_deps = [dep for dep in job.deps if dep in failed]
+        if failed_deps:
+            logging.warning(f'skipped {job.label}: {len(failed_deps)} input job(s) failed')
+            failed.add(job.key)
+        else:
+            try:
+                results[job.key] = job.func(job_ctx, *(results[dep] for dep in job.deps), **job.kwargs)
+            except Exception as e:
+                logging.exception("An error occurred")
+                failed.add(job.key)
+        for dep in job.deps:
+            remaining[dep] -= 1
+            if not remaining[dep] and dep in results:
+                _release(by_key[dep], results.pop(dep), ctx)
+    return results
+
+
+def _release(job, result, ctx):
+    ## the last consumer of job has finished
+    if job.release is None:
+        return
+    try:
+        job.release(job.ctx if job.ctx is not None else ctx, result)
+    except Exception as e:
+        logging.exception("An error occurred")
+
+
+## context and max_datasets of the worker processes of JobGraph.run
+_WORKER_CTX = None
+_WORKER_MAX_DATASETS = None
+
+
+def _init_worker(ctx, max_datasets=None):
+    global _WORKER_CTX, _WORKER_MAX_DATASETS
+    _WORKER_CTX = ctx
+    _WORKER_MAX_DATASETS = max_datasets
+
+
+def _run_worker_jobs(jobs):
+    return _run_jobs(_WORKER_CTX, jobs, _WORKER_MAX_DATASETS)
+
+
+def _run_isolated(ctx, jobs, max_datasets=None):
+    ## run jobs in a process of their own; if it dies, only these jobs fail
+    try:
+        with ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(ctx, max_datasets)) as executor:
+            return executor.submit(_run_worker_jobs, jobs).result()
+    except BrokenProcessPool:
+        logging.error(f'worker process died while running {", ".join(job.label for job in jobs if job.kind == "figure")}')
+        return {}
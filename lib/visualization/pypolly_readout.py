@@ -1,35 +1,413 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap, LogNorm
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
-from matplotlib.dates import DateFormatter, \
-                             DayLocator, HourLocator, MinuteLocator, date2num
+## heavy dependencies (matplotlib, pandas, netCDF4, sqlite3) are imported
+## in the functions using them, see lazy_import and pypolly_benchmark.py
+import io
 import os
 import re
 import sys
-import scipy.io as spio
+import time
+import functools
+import importlib.util
+from contextlib import contextmanager
 import numpy as np
 from datetime import datetime, timedelta, timezone
-import matplotlib
-from netCDF4 import Dataset
 import json
+import hashlib
+import shutil
+import tempfile
 from pathlib import Path
-from statistics import mode
-import pandas as pd
-import sqlite3
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from zipfile import ZipFile, ZIP_DEFLATED
+try:
+    import fcntl
+except ImportError:
+    ## no file locks on Windows
+    fcntl = None
 import logging
 logging.basicConfig(level=logging.WARNING)
 
-# load colormap
-dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(dirname)
-try:
-    from python_colormap import *
-except Exception as e:
-    raise ImportError('python_colormap module is necessary.')
 
-# generating figure without X server
-plt.switch_backend('Agg')
+def lazy_import(name):
+    """
+    Description
+    -----------
+    Import the module name lazily: the module is executed on the first
+    access of one of its attributes, e.g. the plotting modules only if a
+    figure is drawn.
+
+    Parameters
+    ----------
+    name: str
+        name of the module.
+
+    Usage
+    -----
+    display_3d = lazy_import('pypolly_display_3d_plots')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f'{name} module is necessary.')
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+#### profiling
+
+## stages of the profile of a figure job, see start_profile
+PROFILE_STAGES = ('discovery', 'read', 'gap_filling', 'derive', 'prepare', 'draw', 'savefig')
+
+## profile of the figure job running in this process, None if not profiling
+_PROFILE = None
+
+
+def start_profile(stage='prepare'):
+    """
+    Description
+    -----------
+    Start to record the time spent per stage (see PROFILE_STAGES) and the
+    written images, until stop_profile is called. Time of nested stages
+    (profile_stage, profiled) is only counted for the innermost stage.
+
+    Parameters
+    ----------
+    stage: str
+        the stage at the start.
+
+    Usage
+    -----
+    start_profile('prepare')
+    ...
+    profile_switch('draw')
+    ...
+    save_figure(fig, saveFilename, dpi=figDPI)
+    record = stop_profile()
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    global _PROFILE
+    now = time.perf_counter()
+    _PROFILE = {'stages': {}, 'images': {}, 'stack': [[stage, now, 0.0]], 'start': now, 'cpu_start': time.process_time()}
+
+
+def _close_stage(now):
+    ## close the innermost stage, its time is not counted for the enclosing one
+    stage, start, nested = _PROFILE['stack'].pop()
+    elapsed = now - start
+    _PROFILE['stages'][stage] = _PROFILE['stages'].get(stage, 0.0) + elapsed - nested
+    if _PROFILE['stack']:
+        _PROFILE['stack'][-1][2] += elapsed
+
+
+def stop_profile():
+    """stop profiling and return the record: wall_s, cpu_s, stages {stage: s} and images {file: {bytes, savefig_s}}."""
+    global _PROFILE
+    if _PROFILE is None:
+        return None
+    now = time.perf_counter()
+    while _PROFILE['stack']:
+        _close_stage(now)
+    record = {'wall_s': now - _PROFILE['start'],
+              'cpu_s': time.process_time() - _PROFILE['cpu_start'],
+              'stages': _PROFILE['stages'],
+              'images': _PROFILE['images']}
+    _PROFILE = None
+    return record
+
+
+def profile_switch(stage):
+    """continue the current (innermost) stage as stage, e.g. from 'prepare' to 'draw'."""
+    if _PROFILE is None:
+        return
+    now = time.perf_counter()
+    _close_stage(now)
+    _PROFILE['stack'].append([stage, now, 0.0])
+
+
+@contextmanager
+def profile_stage(stage):
+    """count the time of the with-block for stage."""
+    if _PROFILE is None:
+        yield
+        return
+    _PROFILE['stack'].append([stage, time.perf_counter(), 0.0])
+    try:
+        yield
+    finally:
+        if _PROFILE is not None:
+            _close_stage(time.perf_counter())
+
+
+def profiled(stage):
+    """decorator: count the time of every call of the function for stage."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _PROFILE is None:
+                return func(*args, **kwargs)
+            with profile_stage(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+#### image output
+
+## picasso config keys of the image output, see image_options
+IMAGE_OPTION_KEYS = ('pngCompressLevel', 'pngIndexed', 'webpLossless')
+
+## image options of the figure job running in this process
+_IMAGE_OPTIONS = {}
+
+## palette entries of indexed png-files left for the text and lines of a figure, see quantize_image
+PALETTE_RESERVE = 32
+
+
+@contextmanager
+def image_options(config_dict):
+    """
+    Description
+    -----------
+    Save the figures of the with-block with the image options of the
+    picasso config (missing keys keep the defaults of matplotlib):
+
+    pngCompressLevel: int
+        zlib compression level of png-files, 0 (fastest) to 9 (smallest).
+    pngIndexed: bool
+        save colormap-based plots as png-files with a palette of 256
+        colors, which keeps the colors of the colormap; plots with too
+        many colormap colors are saved as usual, see quantize_image. So
+        it has no effect with the default colormaps labview and chiljet,
+        only e.g. for the target classification.
+    webpLossless: bool
+        save webp-files (imgFormat "webp" in the polly config) lossless.
+
+    Parameters
+    ----------
+    config_dict: dict
+        picasso config.
+
+    Usage
+    -----
+    with image_options(config_dict):
+        pollyDisplayAttnBsc(...)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    global _IMAGE_OPTIONS
+    previous = _IMAGE_OPTIONS
+    _IMAGE_OPTIONS = {key: config_dict.get(key) for key in IMAGE_OPTION_KEYS if config_dict.get(key) is not None}
+    try:
+        yield _IMAGE_OPTIONS
+    finally:
+        _IMAGE_OPTIONS = previous
+
+
+def get_pil_kwargs(imgFormat, options):
+    """keyword arguments of PIL for saving an image of imgFormat with the image options (see image_options)."""
+    imgFormat = imgFormat.lower()
+    if imgFormat == 'png' and 'pngCompressLevel' in options:
+        return {'compress_level': int(options['pngCompressLevel'])}
+    if imgFormat == 'webp' and 'webpLossless' in options:
+        return {'lossless': bool(options['webpLossless'])}
+    return {}
+
+
+def quantize_image(rgba, colors=None):
+    """
+    Description
+    -----------
+    Image with a palette of at most 256 colors of an opaque RGBA-image, for
+    indexed png-files. If the image has up to 256 colors, it is kept
+    exactly. Otherwise the palette holds the given colors found in the
+    image, e.g. the ones of the colormap, which are kept exactly, and the
+    most frequent of the remaining colors; the other pixels, e.g. of
+    anti-aliased text, get the closest color of the palette (without
+    dithering). If the given colors leave fewer than PALETTE_RESERVE
+    entries, e.g. for colormaps of 256 colors, there is no such palette.
+
+    Parameters
+    ----------
+    rgba: (height, width, 4) uint8 array
+        the image, e.g. of fig.savefig(buf, format='rgba').
+    colors: (N, 3) or (N, 4) uint8 array, optional
+        colors to keep exactly, e.g. pypolly_figure_templates.colormap_lut(cmap).
+
+    Returns
+    -------
+    image: PIL.Image.Image or None
+        image in mode 'P', None if too many of the colors to keep are in
+        the image.
+
+    Usage
+    -----
+    image = quantize_image(rgba, colormap_lut(cmap))
+    if image is not None:
+        image.save(filename, format='png')
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    from PIL import Image
+    rgb = np.ascontiguousarray(rgba[..., :3])
+    height, width = rgb.shape[:2]
+    found = Image.fromarray(rgb, 'RGB').getcolors(height * width)
+    ## colors to keep first, then the others by frequency
+    present = {color for _, color in found}
+    palette = [] if colors is None else [color for color in dict.fromkeys(map(tuple, np.asarray(colors)[:, :3].tolist()))
+                                         if color in present]
+    if len(palette) > 256 - PALETTE_RESERVE and len(found) > 256:
+        return None
+    kept = set(palette)
+    palette += [color for _, color in sorted(found, reverse=True) if color not in kept][:256 - len(palette)]
+    palette = np.array(palette, dtype=np.uint32)
+
+    ## exact colors by their code, the others get the closest color of the palette
+    code = (rgb[..., 0].astype(np.uint32) << 16) | (rgb[..., 1].astype(np.uint32) << 8) | rgb[..., 2]
+    palette_code = (palette[:, 0] << 16) | (palette[:, 1] << 8) | palette[:, 2]
+    order = np.argsort(palette_code)
+    pos = np.minimum(np.searchsorted(palette_code[order], code), len(order) - 1)
+    index = order[pos]
+    missing = palette_code[index] != code
+    if missing.any():
+        others, inverse = np.unique(rgb[missing], axis=0, return_inverse=True)
+        distance = ((others[:, None, :].astype(np.int32) - palette[None, :, :].astype(np.int32))**2).sum(axis=-1)
+        index[missing] = distance.argmin(axis=1)[inverse.ravel()]
+    image = Image.fromarray(index.astype(np.uint8), 'P')
+    image.putpalette(palette.astype(np.uint8).tobytes())
+    return image
+
+
+def write_indexed_png(rgba, file, colors, **pil_kwargs):
+    """save rgba to file as png with a palette keeping colors (see quantize_image), or as RGBA if they do not fit; True if indexed."""
+    from PIL import Image
+    image = quantize_image(rgba, colors)
+    if image is None:
+        Image.fromarray(rgba, 'RGBA').save(file, format='png', **pil_kwargs)
+        return False
+    image.save(file, format='png', **pil_kwargs)
+    return True
+
+
+def _save_indexed_png(fig, filename, colors, dpi=None, **kwargs):
+    ## draw the figure into an RGBA-buffer and save it with a palette, or as RGBA if the colors do not fit
+    import matplotlib
+    from PIL.PngImagePlugin import PngInfo
+    if dpi is None or dpi == 'figure':
+        dpi = fig.dpi
+    buf = io.BytesIO()
+    fig.savefig(buf, format='rgba', dpi=dpi, **kwargs)
+    width = int(fig.get_figwidth() * dpi)
+    rgba = np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(-1, width, 4)
+    pnginfo = PngInfo()
+    pnginfo.add_text('Software', f'Matplotlib version{matplotlib.__version__}, https://matplotlib.org/')
+    write_indexed_png(rgba, filename, colors, dpi=(dpi, dpi), pnginfo=pnginfo, **get_pil_kwargs('png', _IMAGE_OPTIONS))
+
+
+def _savefig(fig, filename, palette, kwargs):
+    imgFormat = kwargs.get('format') or Path(filename).suffix[1:]
+    if (palette is not None and _IMAGE_OPTIONS.get('pngIndexed') and imgFormat.lower() == 'png'
+            and 'bbox_inches' not in kwargs):
+        _save_indexed_png(fig, filename, palette, **kwargs)
+        return
+    pil_kwargs = get_pil_kwargs(imgFormat, _IMAGE_OPTIONS)
+    if pil_kwargs:
+        kwargs = dict(kwargs, pil_kwargs=dict(pil_kwargs, **kwargs.get('pil_kwargs', {})))
+    fig.savefig(filename, **kwargs)
+
+
+def save_figure(fig, filename, palette=None, **kwargs):
+    """
+    Description
+    -----------
+    Save fig to filename with fig.savefig(filename, **kwargs) and the image
+    options of the figure job (see image_options). If profiling, the time
+    for saving and the size of the image are recorded and the profile
+    continues with stage 'prepare' for the next figure.
+
+    Parameters
+    ----------
+    fig: matplotlib.figure.Figure
+        the figure.
+    filename: str
+        the image file.
+    palette: (N, 4) uint8 array, optional
+        the colors of the colormap of a colormap-based figure, e.g.
+        pypolly_figure_templates.colormap_lut(cmap); the figure may be saved
+        as indexed png-file (pngIndexed) with these colors kept exactly.
+
+    Usage
+    -----
+    save_figure(fig, saveFilename, dpi=figDPI)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if _PROFILE is None:
+        _savefig(fig, filename, palette, kwargs)
+        return
+    start = time.perf_counter()
+    with profile_stage('savefig'):
+        _savefig(fig, filename, palette, kwargs)
+    _PROFILE['images'][str(filename)] = {'bytes': os.path.getsize(filename), 'savefig_s': time.perf_counter() - start}
+    profile_switch('prepare')
+
+
+#### memory
+
+def reset_peak_rss():
+    """reset the peak resident set size of this process (Linux), see get_peak_rss_mb."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def get_peak_rss_mb():
+    """
+    Description
+    -----------
+    Peak resident set size [MB] of this process since the last
+    reset_peak_rss(). Without /proc (not Linux) it is the peak since the
+    start of the process.
+
+    Usage
+    -----
+    reset_peak_rss()
+    plot(...)
+    peak_rss_mb = get_peak_rss_mb()
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    ## kB on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024**2 if sys.platform == 'darwin' else maxrss / 1024
 
 
 def input_folder(configfile):
@@ -75,6 +453,226 @@ def get_nc_filename(date, device, inputfolder, param=""):
         print(f'folder {inputfolder} does not exist!')
 
 
+def get_profile_length(time):
+    """
+    Description
+    -----------
+    Get the profile length [s] of a level1 file, as the most frequent time
+    difference between consecutive profiles (in most cases 30 seconds).
+
+    Parameters
+    ----------
+    time: array-like
+        time values in unixtime.
+
+    Usage
+    -----
+    profile_length = get_profile_length(time)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    diff_time = np.round(np.diff(np.asarray(time, dtype=float)))
+    values, counts = np.unique(diff_time, return_counts=True)
+    return int(values[np.argmax(counts)])
+
+
+def get_time_grid_index(time, date_00, profile_length):
+    """
+    Description
+    -----------
+    Get the row of each profile on the 24h grid starting at date_00 with
+    a spacing of profile_length.
+    Profiles of a continuous measurement period (no time-gap bigger than
+    2 x profile_length) are put to consecutive rows, the first profile of
+    each period is put to the row of its measurement time.
+
+    Parameters
+    ----------
+    time: array-like
+        time values in unixtime.
+    date_00: float
+        unixtime of 00:00 UTC of the plotted day.
+    profile_length: int
+        the profile length [s].
+
+    Usage
+    -----
+    row_index = get_time_grid_index(time, date_00, profile_length)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    time = np.asarray(time, dtype=float)
+    n_profiles = len(time)
+    profile_number = np.arange(n_profiles)
+
+    ## get gaps, if time-gap is bigger than 2 x profile_length
+    period_start = np.ones(n_profiles, dtype=bool)
+    period_start[1:] = np.diff(time) > 2*profile_length
+    period_first = np.flatnonzero(period_start)
+    period_id = np.cumsum(period_start) - 1
+
+    start_row = np.round((time[period_first] - date_00)/profile_length).astype(int)
+    row_index = start_row[period_id] + profile_number - period_first[period_id]
+
+    ## rows have to be increasing, even if two periods overlap
+    row_index = np.maximum.accumulate(row_index - profile_number) + profile_number
+    return row_index
+
+
+def _default_fill_value(matrix):
+    fill_value = getattr(matrix, 'fill_value', -999.0)
+    if fill_value == 1e+20:
+        fill_value = -999.0
+    return fill_value
+
+
+def regrid_time_matrices(time, matrices, fill_values=None, date_00=None, profile_length=None):
+    """
+    Description
+    -----------
+    Put the profiles of one or several co-registered (time x ...) matrices
+    to a fixed 24h time grid for the 24h plots. Rows without a measurement
+    (time gaps, start and end of the day) are set to the fill value, the
+    mask of masked matrices is kept for the measured rows. All matrices are handled with the same row index and each one is
+    allocated only once.
+
+    Parameters
+    ----------
+    time: array-like
+        time values in unixtime.
+    matrices: list
+        the matrices with time as first dimension, e.g. [ATT_BETA, SNR, quality_mask].
+    fill_values: list, optional
+        the value for empty rows of each matrix. None (or a None entry)
+        means the fill_value of the masked array, -999 if not set.
+    date_00: float, optional
+        unixtime of 00:00 UTC of the plotted day. default: day of time[0].
+    profile_length: int, optional
+        the profile length [s]. default: get_profile_length(time).
+
+    Usage
+    -----
+    ATT_BETA, SNR, quality_mask = regrid_time_matrices(time, [ATT_BETA, SNR, quality_mask], fill_values=[None, None, -1])
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if profile_length is None:
+        profile_length = get_profile_length(time)
+    if date_00 is None:
+        date_00 = datetime.fromtimestamp(int(time[0]), tz=timezone.utc).replace(hour=0, minute=0, second=0).timestamp()
+    if fill_values is None:
+        fill_values = [None] * len(matrices)
+
+    n_rows = int(np.round(24*60*60/profile_length))
+    row_index = get_time_grid_index(time, date_00, profile_length)
+    ## profiles outside of the plotted day are dropped
+    in_day = (row_index >= 0) & (row_index < n_rows)
+
+    return _scatter_to_grid(row_index[in_day], in_day, n_rows, matrices, fill_values)
+
+
+def _scatter_to_grid(row_index, in_day, n_rows, matrices, fill_values):
+    regridded = []
+    for matrix, fill_value in zip(matrices, fill_values):
+        if fill_value is None:
+            fill_value = _default_fill_value(matrix)
+        ## masked values (bad signal) keep their data and mask, to differentiate between bad signals and
+        ## measurement-gaps; the empty rows are not masked, they are marked by the fill_value
+        data = np.ma.getdata(matrix)
+        dtype = np.result_type(data.dtype, np.min_scalar_type(fill_value))
+        grid_matrix = np.full((n_rows,) + data.shape[1:], fill_value, dtype=dtype)
+        grid_matrix[row_index] = data[in_day]
+        mask = np.ma.getmask(matrix)
+        if mask is not np.ma.nomask:
+            grid_mask = np.zeros(grid_matrix.shape, dtype=bool)
+            grid_mask[row_index] = mask[in_day]
+            grid_matrix = np.ma.MaskedArray(grid_matrix, mask=grid_mask)
+        regridded.append(grid_matrix)
+
+    return regridded
+
+
+class TimeGrid:
+    """
+    Description
+    -----------
+    Timing information of one level1 nc-file for the time-height plots:
+    profile length, row of each profile on the 24h grid, x-limits and
+    the number of rows to trim, if only the period until the last profile
+    is plotted. It is computed once per nc-file and shared by all plots
+    of this file.
+
+    Parameters
+    ----------
+    time: array-like
+        time values in unixtime.
+    m_date: str
+        the measurement day 'YYYY-MM-DD' (nc_dict['m_date']).
+    flagPlotLastProfilesOnly: bool
+        plot only until the last available profile instead of 24h.
+
+    Usage
+    -----
+    time_grid = TimeGrid(nc_dict['time'], nc_dict['m_date'], config_dict['flagPlotLastProfilesOnly'])
+    ATT_BETA, quality_mask = time_grid.regrid([ATT_BETA, quality_mask], fill_values=[None, -1])
+    ATT_BETA = time_grid.trim(ATT_BETA)
+    extent = time_grid.extent(max_height)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, time, m_date, flagPlotLastProfilesOnly=False):
+        from matplotlib.dates import date2num
+        self.time = np.asarray(time, dtype=float)
+        self.m_date = m_date
+        self.flagPlotLastProfilesOnly = flagPlotLastProfilesOnly
+        self.profile_length = get_profile_length(self.time)
+
+        ## row index of each profile on the 24h grid, starting 00:00 UTC
+        self.date_00 = datetime.strptime(m_date, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp()
+        self.n_rows = int(np.round(24*60*60/self.profile_length))
+        row_index = get_time_grid_index(self.time, self.date_00, self.profile_length)
+        self.in_day = (row_index >= 0) & (row_index < self.n_rows)
+        self.row_index = row_index[self.in_day]
+
+        ## set x-lim to 24h or only to last available timestamp
+        mdate = datetime.strptime(m_date, '%Y-%m-%d').timestamp()
+        self.x_lims = date2num(set_x_lims(flagPlotLastProfilesOnly=flagPlotLastProfilesOnly,mdate=mdate,last_timestamp=self.time[-1]))
+
+        ## rows after the last available timestamp
+        if flagPlotLastProfilesOnly == True:
+            self.n_trim = get_trim_length(mdate=mdate,profile_length=self.profile_length,last_timestamp=self.time[-1])
+        else:
+            self.n_trim = 0
+
+    @profiled('gap_filling')
+    def regrid(self, matrices, fill_values=None):
+        """put matrices (time as first dimension) on the 24h grid, see regrid_time_matrices."""
+        if fill_values is None:
+            fill_values = [None] * len(matrices)
+        return _scatter_to_grid(self.row_index, self.in_day, self.n_rows, matrices, fill_values)
+
+    @profiled('gap_filling')
+    def trim(self, matrix):
+        """trimm matrix to last available timestamp if neccessary."""
+        if self.n_trim > 0:
+            return matrix[:-self.n_trim]
+        return matrix
+
+    def extent(self, max_height):
+        """plot-region for imshow."""
+        return [ self.x_lims[0], self.x_lims[-1], max_height[0], max_height[-1] ]
+
+
+@profiled('gap_filling')
 def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask):
     """
     Description
@@ -98,67 +696,14 @@ def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask):
     History
     -------
     2022-09-01. First edition by Andi
+    2026-10-18. Use regrid_time_matrices.
     """
-
-    ## get time-differences between profiles
-    diff_time = [ time[d+1]-time[d] for d in range(len(time)-1) ]
-
-    ## get profile_length (in most cases 30 seconds)
-    occurence_count = mode(diff_time) ## get most frequently element
-    profile_length = int(np.round(occurence_count))
-    
-    ## get gaps, if time-gap is bigger than 2 x profile_length
-    gap_finder = np.where(np.array(diff_time) > 2*profile_length)
-    fill_size = 0
-    fill_size_all = 0
-    fill_value = ATT_BETA.fill_value
-    if fill_value == 1e+20:
-        fill_value = -999.0
-
-    ## Set masked values (bad signal) to 0, to differntiate between bad signals and measurement-gaps
-    ATT_BETA = np.ma.masked_where(ATT_BETA.mask, ATT_BETA, 0)
-    
-    for gap in gap_finder[0]:
-        fill_size_all = fill_size_all + fill_size
-        gap = gap + fill_size_all
-        time_gap = diff_time[gap-fill_size_all]
-        profiles_num = int(np.round(time_gap/profile_length))
-        matrix_left_att = ATT_BETA[:gap+1]
-        matrix_right_att = ATT_BETA[gap:]
-        matrix_left_mask = quality_mask[:gap+1]
-        matrix_right_mask = quality_mask[gap:]
-        fill_size =  profiles_num
-        matrix_left_att = np.pad(matrix_left_att,((0,fill_size),(0,0)), 'constant', constant_values=fill_value)
-        matrix_left_mask = np.pad(matrix_left_mask,((0,fill_size),(0,0)), 'constant', constant_values=-1)
-        
-        ATT_BETA = np.append(matrix_left_att, matrix_right_att,axis=0)
-        quality_mask = np.append(matrix_left_mask, matrix_right_mask,axis=0)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.fromtimestamp(int(time[0])).strftime('%Y%m%d') # convert Unix-timestamp to datestring
-    date_00 = datetime.strptime(str(date_00), '%Y%m%d').replace(tzinfo=timezone.utc) # convert to datetime object of UTC-time 
-    date_00 = date_00.timestamp() # convert to unix-timestamp-object
-
-    ## check start unix-time
-    start_diff = abs(time[0]-date_00)
-    if start_diff < (profile_length * 2):
-        fill_size_start = 0
-    else:
-        fill_size_start = int(np.round(start_diff/profile_length))
-        ATT_BETA = np.pad(ATT_BETA,((fill_size_start,0),(0,0)), 'constant', constant_values=fill_value)
-        quality_mask = np.pad(quality_mask,((fill_size_start,0),(0,0)), 'constant', constant_values=-1)
-    ## check end unix-time
-    end_diff = abs(time[-1] - (date_00+24*60*60))
-    if end_diff < (profile_length * 2):
-        fill_size_end = 0
-    else:
-        fill_size_end =  int(np.round(end_diff/profile_length))
-        ATT_BETA = np.pad(ATT_BETA,((0,fill_size_end),(0,0)), 'constant', constant_values=fill_value)
-        quality_mask = np.pad(quality_mask,((0,fill_size_end),(0,0)), 'constant', constant_values=-1)
+    ATT_BETA, quality_mask = regrid_time_matrices(time, [ATT_BETA, quality_mask], fill_values=[None, -1])
 
     return ATT_BETA, quality_mask
 
 
+@profiled('gap_filling')
 def fill_time_gaps_of_single_matrix(time, matrix):
     """
     Description
@@ -178,58 +723,9 @@ def fill_time_gaps_of_single_matrix(time, matrix):
     History
     -------
     2022-09-01. First edition by Andi
+    2026-10-18. Use regrid_time_matrices.
     """
-
-    ## get time-differences between profiles
-    diff_time = [ time[d+1]-time[d] for d in range(len(time)-1) ]
-
-    ## get profile_length (in most cases 30 seconds)
-    occurence_count = mode(diff_time) ## get most frequently element
-    profile_length = int(np.round(occurence_count))
-    
-    ## get gaps, if time-gap is bigger than 2 x profile_length
-    gap_finder = np.where(np.array(diff_time) > 2*profile_length)
-    fill_size = 0
-    fill_size_all = 0
-    fill_value = matrix.fill_value
-    if fill_value == 1e+20:
-        fill_value = -999.0
-
-#    ## Set masked values (bad signal) to 0, to differntiate between bad signals and measurement-gaps
-#    ATT_BETA = np.ma.masked_where(ATT_BETA.mask, ATT_BETA, 0)
-    
-    for gap in gap_finder[0]:
-        fill_size_all = fill_size_all + fill_size
-        gap = gap + fill_size_all
-        time_gap = diff_time[gap-fill_size_all]
-        profiles_num = int(np.round(time_gap/profile_length))
-        matrix_left = matrix[:gap+1]
-        matrix_right = matrix[gap:]
-        fill_size =  profiles_num
-        matrix_left = np.pad(matrix_left,((0,fill_size),(0,0)), 'constant', constant_values=fill_value)
-        
-        matrix = np.append(matrix_left, matrix_right, axis=0)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.fromtimestamp(int(time[0])).strftime('%Y%m%d') # convert Unix-timestamp to datestring
-    date_00 = datetime.strptime(str(date_00), '%Y%m%d').replace(tzinfo=timezone.utc) # convert to datetime object of UTC-time 
-    date_00 = date_00.timestamp() # convert to unix-timestamp-object
-
-    ## check start unix-time
-    start_diff = abs(time[0]-date_00)
-    if start_diff < (profile_length * 2):
-        fill_size_start = 0
-    else:
-        fill_size_start = int(np.round(start_diff/profile_length))
-        matrix = np.pad(matrix, ((fill_size_start,0),(0,0)), 'constant', constant_values=fill_value)
-    ## check end unix-time
-    end_diff = abs(time[-1] - (date_00+24*60*60))
-    if end_diff < (profile_length * 2):
-        fill_size_end = 0
-    else:
-        fill_size_end =  int(np.round(end_diff/profile_length))
-        matrix = np.pad(matrix,((0,fill_size_end),(0,0)), 'constant', constant_values=fill_value)
-    
+    matrix, = regrid_time_matrices(time, [matrix])
 
     return matrix 
 
@@ -253,15 +749,22 @@ def set_x_lims(flagPlotLastProfilesOnly,mdate,last_timestamp)->list:
     return x_lims
 
 
+def get_trim_length(mdate,profile_length,last_timestamp):
+    ## number of time-slices after the last available timestamp
+    ## Convert Unix timestamp string to a datetime object
+    mtime_end = datetime.utcfromtimestamp(int(last_timestamp))
+    mtime_end = mtime_end.timestamp()
+    last_hours = (mdate+24*60*60 - mtime_end)/3600
+    n = int(3600/profile_length*last_hours) - 1 ## '-1' to be sure not to cut last profile
+    return max(n, 0)
+
+
 def trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly,matrix,mdate,profile_length,last_timestamp):
     ## trimm matrix to last available timestamp if neccessary
     if flagPlotLastProfilesOnly == True:
-        ## Convert Unix timestamp string to a datetime object
-        mtime_end = datetime.utcfromtimestamp(int(last_timestamp))
-        mtime_end = mtime_end.timestamp()
-        last_hours = (mdate+24*60*60 - mtime_end)/3600
-        n = int(3600/profile_length*last_hours) - 1 ## '-1' to be sure not to cut last profile
-        matrix = matrix[:-n] ## trimm last n=(3600s/profile_length*last_hours)
+        n = get_trim_length(mdate,profile_length,last_timestamp)
+        if n > 0:
+            matrix = matrix[:-n] ## trimm last n=(3600s/profile_length*last_hours)
                                  ## time-slices to correctly fit to imshow-plot
                                  ## profile_length = mshots/laser_rep_rate = mostly 30s
     else:
@@ -275,79 +778,606 @@ def read_config(configfile):
     f.close()
     return config_json#configfile_dict
 
-def read_excel_config_file(excel_file, timestamp, device):
-    pd.set_option('display.width', 1500)
-    pd.set_option('display.max_columns', None)
-    #excel_file_ds = pd.read_excel(f'{excel_file}', engine='openpyxl',usecols = 'A:Z')
-    excel_file_ds = pd.read_excel(f'{excel_file}', engine='openpyxl')
-    print(excel_file)
-    ## search for timerange for given timestamp
-    filtered_device = excel_file_ds.loc[(excel_file_ds['Instrument'] == device)]
-    filtered_device = filtered_device.copy() ## make a copy of the df to avoid the SettingWithCopyWarning
-    filtered_device['starttime'] = pd.to_datetime(filtered_device['Starttime of config'])
-    filtered_device['stoptime'] = pd.to_datetime(filtered_device['Stoptime of config'])
-    timestamp_dt = pd.to_datetime(f'{timestamp} 00:00:00')
-    matching_row = filtered_device[(filtered_device['starttime'] <= timestamp_dt) & (filtered_device['stoptime'] >= timestamp_dt)]
-    #print(matching_row['Config file'])
-    location = str(matching_row['Location'].to_string(index=False)).strip()  ## get rid of whitespaces
-    polly_local_config_file = str(matching_row['Config file'].to_string(index=False)).strip()  ## get rid of whitespaces
-    return polly_local_config_file, device, location
+class FrozenConfig(Mapping):
+    """
+    Description
+    -----------
+    Read-only view of a config dict. Nested dicts are FrozenConfig as well
+    and lists become tuples, so a resolved config can be shared between
+    all plots of a batch without being changed by one of them.
 
-def read_global_conf(polly_global_config):
-    print(polly_global_config)
-    f = open (polly_global_config, "r")
-    config_json = json.load(f)
-    f.close()
-    return config_json#globalconfig_dict
+    Parameters
+    ----------
+    data: dict
+        the config.
 
-def read_local_conf(polly_local_config):
-    print(polly_local_config)
-    f = open (polly_local_config, "r")
-    config_json = json.load(f)
-    f.close()
-    return config_json
+    Usage
+    -----
+    config_dict = FrozenConfig(json.load(f))
+    config_dict['figDPI']
 
+    History
+    -------
+    2026-10-18. First edition
+    """
 
-def read_nc_file(nc_filename,timestamp,device,location):
+    def __init__(self, data):
+        self._data = {key: _freeze(value) for key, value in data.items()}
 
-    nc_dict={}
-    if not os.path.exists(nc_filename):
-        print('{filename} does not exist.'.format(filename=nc_filename))
-        return
-    else:
-        pass
+    def __getitem__(self, key):
+        return self._data[key]
 
-    ## open nc-file as dataset
-    nc_file_ds = Dataset(nc_filename, "r")
-    
-    ## get global attributes from nc-file
-    global_attr = {}
-    for nc_attr in nc_file_ds.ncattrs():
-        att_value = nc_file_ds.getncattr(nc_attr)
-        global_attr[nc_attr] = att_value
+    def __iter__(self):
+        return iter(self._data)
 
-    var_ls = []
-    for var in nc_file_ds.variables:
-        var_ls.append(var)
+    def __len__(self):
+        return len(self._data)
 
-    ## get variable attributes from nc-file
-    for v_count,var_name in enumerate(var_ls):
-        for var_att in nc_file_ds.variables[var_name].ncattrs():
-            var_att_value = nc_file_ds.variables[var_name].getncattr(var_att)
-            nc_dict[f'{var_name}___{var_att}'] = var_att_value
+    def __repr__(self):
+        return f'FrozenConfig({self._data!r})'
 
+    def to_dict(self):
+        ## mutable deep copy
+        return {key: _thaw(value) for key, value in self._data.items()}
 
-    ## fill dict with variable-values
-    for v_count,var_name in enumerate(var_ls):
-        nc_dict[var_name] = nc_file_ds[var_name][:]
 
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return value if isinstance(value, FrozenConfig) else FrozenConfig(value)
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    ## fill dict with non-variable-value-params (e.g. global attributes)
 
-    #nc_dict['PollyVersion'] = global_attr['source']
-    #nc_dict['location'] = global_attr['location']
-    nc_dict['PollyVersion'] = device
-    nc_dict['location'] = location
+def _thaw(value):
+    if isinstance(value, FrozenConfig):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+## resolved configs of this process, keyed by the content hashes of the config files
+_RESOLVED_CONFIGS = {}
+
+
+def _read_json_with_hash(json_file):
+    content = Path(json_file).read_bytes()
+    return hashlib.sha1(content).hexdigest(), content
+
+
+def resolve_picasso_config(picasso_config_file):
+    """
+    Description
+    -----------
+    Read the picasso config as FrozenConfig. Configs with identical content
+    are parsed only once per process.
+
+    Parameters
+    ----------
+    picasso_config_file: str
+        the picasso config file.
+
+    Usage
+    -----
+    config_dict = resolve_picasso_config(picasso_config_file)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    print(picasso_config_file)
+    content_hash, content = _read_json_with_hash(picasso_config_file)
+    key = ('picasso', content_hash)
+    if key not in _RESOLVED_CONFIGS:
+        _RESOLVED_CONFIGS[key] = FrozenConfig(json.loads(content))
+    return _RESOLVED_CONFIGS[key]
+
+
+def resolve_polly_config(polly_global_config, polly_local_config):
+    """
+    Description
+    -----------
+    Merge the global and the local polly config into one FrozenConfig. Keys
+    of the global config are overwritten by the local config, keys only
+    present in the local config are ignored. The result is memoized by the
+    content hashes of both files, so identical configs of a batch are
+    parsed and merged only once.
+
+    Parameters
+    ----------
+    polly_global_config: str
+        the global polly config file.
+    polly_local_config: str
+        the local polly config file.
+
+    Usage
+    -----
+    polly_conf_dict = resolve_polly_config(config_dict['polly_global_config'],polly_local_config)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    print(polly_global_config)
+    print(polly_local_config)
+    global_hash, global_content = _read_json_with_hash(polly_global_config)
+    local_hash, local_content = _read_json_with_hash(polly_local_config)
+    key = ('polly', global_hash, local_hash)
+    if key not in _RESOLVED_CONFIGS:
+        globalconf_dict = json.loads(global_content)
+        localconf_dict = json.loads(local_content)
+        ## use local polly config settings, instead of global ones
+        polly_conf_dict = {key: localconf_dict.get(key, value) for key, value in globalconf_dict.items()}
+        _RESOLVED_CONFIGS[key] = FrozenConfig(polly_conf_dict)
+    return _RESOLVED_CONFIGS[key]
+
+
+## bump if the layout of the compiled config link index changes
+CONFIG_LINK_INDEX_VERSION = 1
+
+## compiled config link indexes of this process, keyed by the cache key
+_CONFIG_LINK_INDEXES = {}
+
+
+def _compile_config_link_index(excel_file):
+    import pandas as pd
+    ## (Instrument, start, stop) -> (Config file, Location) intervals, sorted by instrument and start
+    excel_file_ds = pd.read_excel(f'{excel_file}', engine='openpyxl')
+    index = {
+        'instrument': excel_file_ds['Instrument'].astype(str).to_numpy(dtype=str),
+        'start': pd.to_datetime(excel_file_ds['Starttime of config']).to_numpy(dtype='datetime64[s]'),
+        'stop': pd.to_datetime(excel_file_ds['Stoptime of config']).to_numpy(dtype='datetime64[s]'),
+        'config_file': excel_file_ds['Config file'].astype(str).str.strip().to_numpy(dtype=str),
+        'location': excel_file_ds['Location'].astype(str).str.strip().to_numpy(dtype=str),
+        'row': np.arange(len(excel_file_ds)),
+    }
+    order = np.lexsort((index['start'], index['instrument']))
+    return {key: value[order] for key, value in index.items()}
+
+
+def load_config_link_index(excel_file, cache_folder=None):
+    """
+    Description
+    -----------
+    Load the compiled interval index of the pollynet_config_link_file. The
+    index is kept in memory and, if cache_folder is given, as npz-file on
+    disk. Both are keyed by path and mtime of the xlsx-file, so the index
+    is rebuilt when the spreadsheet changes.
+
+    Parameters
+    ----------
+    excel_file: str
+        the pollynet_config_link_file.
+    cache_folder: str or Path, optional
+        folder for the compiled index, see get_cache_folder.
+
+    Usage
+    -----
+    index = load_config_link_index(excel_file,cache_folder=get_cache_folder(config_dict))
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    stat = os.stat(excel_file)
+    cache_key = f'{Path(excel_file).resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{CONFIG_LINK_INDEX_VERSION}'
+    if cache_key in _CONFIG_LINK_INDEXES:
+        return _CONFIG_LINK_INDEXES[cache_key]
+
+    index = None
+    if cache_folder is not None:
+        name = hashlib.sha1(str(Path(excel_file).resolve()).encode()).hexdigest()
+        cache_file = Path(cache_folder, f'config_link_{name}.npz')
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                if str(cached['cache_key']) == cache_key:
+                    index = {key: cached[key] for key in cached.files if key != 'cache_key'}
+        except (OSError, KeyError, ValueError):
+            pass
+
+    if index is None:
+        index = _compile_config_link_index(excel_file)
+        if cache_folder is not None:
+            try:
+                ## write to a temporary file first, so concurrent readers never see a partial file
+                with tempfile.NamedTemporaryFile(dir=cache_folder, suffix='.npz', delete=False) as tmp:
+                    np.savez(tmp, cache_key=np.array(cache_key), **index)
+                os.replace(tmp.name, cache_file)
+            except OSError:
+                logging.warning(f'could not write config link cache {cache_file}')
+
+    _CONFIG_LINK_INDEXES[cache_key] = index
+    return index
+
+
+def read_excel_config_file(excel_file, timestamp, device, cache_folder=None):
+    """
+    Description
+    -----------
+    Look up the polly config file and location of device at timestamp in the
+    pollynet_config_link_file, i.e. the row of the device whose config period
+    contains timestamp 00:00:00. If several rows match, the first one of the
+    sheet is taken; if none does, a ValueError is raised.
+
+    Parameters
+    ----------
+    excel_file: str
+        the pollynet_config_link_file.
+    timestamp: str
+        the date, YYYYMMDD.
+    device: str
+        polly device.
+    cache_folder: str or Path, optional
+        folder for the compiled index, see load_config_link_index.
+
+    Usage
+    -----
+    polly_local_config_file, device, location = read_excel_config_file(excel_file,timestamp,device,cache_folder=get_cache_folder(config_dict))
+
+    History
+    -------
+    2026-10-18. interval search in the compiled index instead of parsing the sheet
+    """
+    print(excel_file)
+    index = load_config_link_index(excel_file, cache_folder=cache_folder)
+    timestamp_dt = np.datetime64(datetime.strptime(timestamp, '%Y%m%d'), 's')
+
+    ## rows of the device, all configs starting before timestamp, then those not yet stopped
+    lo = np.searchsorted(index['instrument'], device, side='left')
+    hi = np.searchsorted(index['instrument'], device, side='right')
+    n_started = np.searchsorted(index['start'][lo:hi], timestamp_dt, side='right')
+    candidates = np.arange(lo, lo + n_started)
+    candidates = candidates[index['stop'][candidates] >= timestamp_dt]
+    if len(candidates) < 1:
+        raise ValueError(f'no polly config found for {device} at {timestamp} in {excel_file}')
+
+    match = candidates[np.argmin(index['row'][candidates])]
+    return str(index['config_file'][match]), device, str(index['location'][match])
+
+def read_global_conf(polly_global_config):
+    print(polly_global_config)
+    f = open (polly_global_config, "r")
+    config_json = json.load(f)
+    f.close()
+    return config_json#globalconfig_dict
+
+def read_local_conf(polly_local_config):
+    print(polly_local_config)
+    f = open (polly_local_config, "r")
+    config_json = json.load(f)
+    f.close()
+    return config_json
+
+
+class NcCache:
+    """
+    Description
+    -----------
+    Least-recently-used cache for the content of level1 nc-files, shared by
+    all read_nc_file calls of one run. Entries are keyed by
+    (path, mtime, variable, height slice), so a modified file is read again.
+    If the size of the cached arrays exceeds max_size_mb, the least recently
+    used entries are dropped.
+
+    Parameters
+    ----------
+    max_size_mb: float
+        memory budget of the cache in MB. 0 disables caching.
+
+    Usage
+    -----
+    nc_cache = NcCache(max_size_mb=1024)
+    nc_dict = read_nc_file(nc_filename,timestamp,device,location,cache=nc_cache)
+    print(nc_cache.report())
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, max_size_mb=1024):
+        self.max_bytes = int(max_size_mb * 1024**2)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if self.max_bytes <= 0:
+            return
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self.size += nbytes
+        while self.size > self.max_bytes:
+            _, (_, n) = self._entries.popitem(last=False)
+            self.size -= n
+
+    def evict(self, file_key):
+        ## drop all entries of a file, keyed by (path, mtime, ...)
+        for key in [key for key in self._entries if key[:len(file_key)] == file_key]:
+            self.size -= self._entries.pop(key)[1]
+
+    def report(self):
+        return (f'nc-file cache: {self.hits} hits, {self.misses} misses, '
+                f'{len(self._entries)} entries, {self.size/1024**2:.1f} of {self.max_bytes/1024**2:.0f} MB used')
+
+
+def _nbytes(value):
+    ## size of (nested) arrays held by value
+    if isinstance(value, np.ma.MaskedArray):
+        return value.data.nbytes + np.ma.getmaskarray(value).nbytes
+    elif isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    return 0
+
+
+def _read_nc_header(nc_file_ds):
+    ## global attributes, variable attributes and dimensions of an opened nc-file
+    header = {'global_attr': {}, 'var_attr': {}, 'dimensions': {}}
+    for nc_attr in nc_file_ds.ncattrs():
+        header['global_attr'][nc_attr] = nc_file_ds.getncattr(nc_attr)
+    for var_name, var in nc_file_ds.variables.items():
+        header['var_attr'][var_name] = {var_att: var.getncattr(var_att) for var_att in var.ncattrs()}
+        header['dimensions'][var_name] = var.dimensions
+    return header
+
+
+class LazyNcDict(MutableMapping):
+    """
+    Description
+    -----------
+    Dict-like view of a level1 nc-file. Variable values are read from the
+    file (or the NcCache) on first access and kept afterwards. The nc-file
+    is opened when the first value has to be read from disk and stays open
+    until all variables have been read or close() is called.
+
+    Parameters
+    ----------
+    nc_filename: str
+        the level1 nc-file.
+    var_names: list
+        the variables, which can be read on demand.
+    dimensions: dict
+        the dimension names of each variable.
+    height_max: float or None
+        if set, variables with height as last dimension are sliced to
+        heights below height_max [m].
+    cache: NcCache or None
+        cache shared between several LazyNcDicts.
+
+    Usage
+    -----
+    nc_dict = LazyNcDict(nc_filename, var_names, dimensions, height_max, cache)
+    ATT_BETA = nc_dict['attenuated_backscatter_532nm']
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, nc_filename, var_names, dimensions, height_max=None, cache=None, nc_file_ds=None):
+        self._data = {}
+        self._lazy = dict.fromkeys(var_names)
+        self._nc_filename = nc_filename
+        self._file_key = (str(Path(nc_filename).resolve()), os.path.getmtime(nc_filename))
+        self._dimensions = dimensions
+        self._height_max = height_max
+        self._n_height = None
+        self._cache = cache
+        self._nc_file_ds = nc_file_ds
+        self._derived = {}
+        if not self._lazy:
+            self.close()
+
+    def _dataset(self):
+        from netCDF4 import Dataset
+        if self._nc_file_ds is None:
+            self._nc_file_ds = Dataset(self._nc_filename, "r")
+        return self._nc_file_ds
+
+    @profiled('read')
+    def _fetch(self, var_name, n_height=None):
+        key = (*self._file_key, var_name, n_height)
+        if self._cache is not None:
+            value = self._cache.get(key)
+            if value is not None:
+                return value
+        var = self._dataset().variables[var_name]
+        if n_height is not None:
+            value = var[..., :n_height]
+        else:
+            value = var[:]
+        if self._cache is not None:
+            self._cache.put(key, value)
+        return value
+
+    def _height_slice(self, var_name):
+        dims = self._dimensions.get(var_name, ())
+        if self._height_max is None or len(dims) == 0 or dims[-1] != 'height' or 'height' not in self._dimensions:
+            return None
+        if self._n_height is None:
+            self._n_height = int(np.count_nonzero(self._fetch('height') < self._height_max))
+        return self._n_height
+
+    def __getitem__(self, key):
+        if key in self._data:
+            return self._data[key]
+        if key in self._lazy:
+            value = self._fetch(key, self._height_slice(key))
+            del self._lazy[key]
+            self._data[key] = value
+            if not self._lazy:
+                self.close()
+            return value
+        if key in self._derived:
+            func = self._derived[key]
+            values = func(self)
+            for name, value in values.items():
+                if self._derived.get(name) is func:
+                    del self._derived[name]
+                    self._data[name] = value
+            return self._data[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._lazy.pop(key, None)
+        self._derived.pop(key, None)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key in self._lazy:
+            del self._lazy[key]
+        elif key in self._derived:
+            del self._derived[key]
+        else:
+            del self._data[key]
+
+    def __contains__(self, key):
+        ## do not read the variable, only for checking its existence
+        return key in self._data or key in self._lazy or key in self._derived
+
+    def __iter__(self):
+        yield from list(self._data)
+        yield from list(self._lazy)
+        yield from list(self._derived)
+
+    def __len__(self):
+        return len(self._data) + len(self._lazy) + len(self._derived)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(loaded={list(self._data)}, not_loaded={list(self._lazy)}, derived={list(self._derived)})'
+
+    def register_derived(self, names, func):
+        """register variables calculated by func(self) on first access of one of names.
+
+        func returns a dict, which has to contain all names.
+        """
+        for name in names:
+            self._lazy.pop(name, None)
+            self._data.pop(name, None)
+            self._derived[name] = func
+
+    def loaded_variables(self):
+        """list of keys already held in memory."""
+        return list(self._data)
+
+    def load(self):
+        """read all remaining variables."""
+        for var_name in list(self._lazy):
+            self[var_name]
+        return self
+
+    def close(self):
+        """close the nc-file; variables not read so far are dropped."""
+        self._lazy.clear()
+        if self._nc_file_ds is not None:
+            self._nc_file_ds.close()
+            self._nc_file_ds = None
+
+    def release(self):
+        """close the nc-file and drop all values, also the ones of the file in the cache."""
+        self.close()
+        self._data.clear()
+        self._derived.clear()
+        if self._cache is not None:
+            self._cache.evict(self._file_key)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def read_nc_file(nc_filename,timestamp,device,location,variables=None,attrs_only=False,height_max=None,cache=None):
+    """
+    Description
+    -----------
+    Read a level1 nc-file into a dict-like object (LazyNcDict).
+    Variable values are only read from file, when they are accessed.
+
+    Parameters
+    ----------
+    nc_filename: str
+        the level1 nc-file.
+    variables: list, optional
+        only these variables (and their attributes) are made available.
+        default: all variables of the nc-file.
+    attrs_only: bool, optional
+        only read global and variable attributes, but no variable values.
+    height_max: float, optional
+        slice height-dependent variables (and height itself) to heights
+        below height_max [m], e.g. the upper yLim of the plot.
+    cache: NcCache, optional
+        if given, attributes and variables are taken from/put into the cache.
+
+    Usage
+    -----
+    nc_dict = read_nc_file(nc_filename,timestamp,device,location)
+    nc_dict = read_nc_file(nc_filename,timestamp,device,location,variables=['time','height','attenuated_backscatter_532nm'],height_max=yLim[1])
+
+    History
+    -------
+    2026-10-18. Lazy reading of variables; added variables, attrs_only, height_max and cache.
+    """
+    from netCDF4 import Dataset
+
+    if not os.path.exists(nc_filename):
+        print('{filename} does not exist.'.format(filename=nc_filename))
+        return
+    else:
+        pass
+
+    ## get global attributes, variable attributes and dimensions from nc-file
+    nc_file_ds = None
+    header_key = (str(Path(nc_filename).resolve()), os.path.getmtime(nc_filename), None, None)
+    header = cache.get(header_key) if cache is not None else None
+    if header is None:
+        ## open nc-file as dataset
+        nc_file_ds = Dataset(nc_filename, "r")
+        header = _read_nc_header(nc_file_ds)
+        if cache is not None:
+            cache.put(header_key, header)
+    global_attr = header['global_attr']
+
+    var_ls = []
+    for var in header['var_attr']:
+        if (variables is None) or (var in variables):
+            var_ls.append(var)
+
+    ## variable-values are read on first access
+    if attrs_only:
+        nc_dict = LazyNcDict(nc_filename, [], header['dimensions'], height_max, cache, nc_file_ds)
+    else:
+        nc_dict = LazyNcDict(nc_filename, var_ls, header['dimensions'], height_max, cache, nc_file_ds)
+
+    ## get variable attributes
+    for v_count,var_name in enumerate(var_ls):
+        for var_att, var_att_value in header['var_attr'][var_name].items():
+            nc_dict[f'{var_name}___{var_att}'] = var_att_value
+
+
+    ## fill dict with non-variable-value-params (e.g. global attributes)
+
+    #nc_dict['PollyVersion'] = global_attr['source']
+    #nc_dict['location'] = global_attr['location']
+    nc_dict['PollyVersion'] = device
+    nc_dict['location'] = location
     try:
         nc_dict['PicassoVersion'] = global_attr['version']
     except Exception as e:
@@ -360,7 +1390,6 @@ def read_nc_file(nc_filename,timestamp,device,location):
     nc_dict['m_date'] = f'{m_date[0]}-{m_date[1]}-{m_date[2]}'
 #    nc_dict['m_date'] = datetime.fromtimestamp(nc_file_ds['time'][0]).strftime("%Y-%m-%d")
 
-    nc_file_ds.close()
     return nc_dict
 
 
@@ -369,82 +1398,118 @@ def read_nc_file(nc_filename,timestamp,device,location):
 ####
 
 
+## Angstroem exponents of calc_ANGEXP: (name, variable at lambda1, variable at lambda2, lambda1, lambda2)
+## AE_beta_lambda1_lambda2(z) = - np.log(beta1(z)/beta2(z))/np.log(lambda1/lambda2) = np.log(beta1(z)/beta2(z))/np.log(lambda2/lambda1)
+## AE_part.ext_lambda1_lambda2(z) = AE_beta_lambda1_lambda2(z) + AE_LR_lambda1_lambda2(z) = np.log(extinction1(z)/extinction2(z)/np.log(lambda2/lambda1)
+## with AngstromExp for the Lidar Ratio LR: AE_LR_lambda1_lambda2(z) = - np.log(LR1(z)/LR2(z))/np.log(lambda1/lambda2)
+## lambda1 < lambda2
+ANGEXP_PAIRS = [
+    ('AE_beta_355_532_Klett', 'aerBsc_klett_355', 'aerBsc_klett_532', 355, 532),
+    ('AE_beta_532_1064_Klett', 'aerBsc_klett_532', 'aerBsc_klett_1064', 532, 1064),
+    ('AE_beta_355_532_Raman', 'aerBsc_raman_355', 'aerBsc_raman_532', 355, 532),
+    ('AE_beta_532_1064_Raman', 'aerBsc_raman_532', 'aerBsc_raman_1064', 532, 1064),
+    ('AE_LR_355_532_Raman', 'aerLR_raman_355', 'aerLR_raman_532', 355, 532),
+    ('AE_parExt_355_532_Raman', 'aerExt_raman_355', 'aerExt_raman_532', 355, 532),
+]
+
+## height bins of the moving average applied before calculating the Angstroem exponents
+ANGEXP_WINDOW_SIZE = 25
+
+
+def smooth_profiles(profiles, window_size):
+    """
+    Description
+    -----------
+    Moving average of stacked profiles, centered like
+    np.convolve(profile, np.ones(window_size)/window_size, 'same'), but only
+    over the valid bins in the window. Masked and NaN bins neither enter the
+    average nor get a value, so fill values are not smeared into neighbouring
+    bins and the profile edges are not pulled towards 0.
+
+    Parameters
+    ----------
+    profiles: array or masked array
+        profiles, shape (n_profiles, n_height).
+    window_size: int
+        width of the window in bins.
+
+    Usage
+    -----
+    smoothed = smooth_profiles(np.ma.stack([bsc355, bsc532]), 25)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    data = np.ma.getdata(profiles).astype(float)
+    valid = ~np.ma.getmaskarray(profiles) & np.isfinite(data)
+    data = np.where(valid, data, 0.)
+
+    n_height = data.shape[-1]
+    ## window of bin i: [i - window_size//2, i + (window_size-1)//2]
+    idx = np.arange(n_height)
+    lo = np.clip(idx - window_size // 2, 0, n_height)
+    hi = np.clip(idx + (window_size - 1) // 2 + 1, 0, n_height)
+    data_cumsum = np.concatenate([np.zeros(data.shape[:-1] + (1,)), np.cumsum(data, axis=-1)], axis=-1)
+    count_cumsum = np.concatenate([np.zeros(data.shape[:-1] + (1,)), np.cumsum(valid, axis=-1)], axis=-1)
+    window_sum = data_cumsum[..., hi] - data_cumsum[..., lo]
+    window_count = count_cumsum[..., hi] - count_cumsum[..., lo]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        smoothed = window_sum / window_count
+    return np.ma.masked_array(smoothed, mask=~valid | (window_count == 0))
+
+
+@profiled('derive')
+def _compute_ANGEXP(nc_dict, pairs, window_size=ANGEXP_WINDOW_SIZE):
+    ## all Angstroem exponents of pairs from one smoothing pass over the stacked input profiles
+    var_names = list(dict.fromkeys(name for pair in pairs for name in pair[1:3]))
+    smoothed = smooth_profiles(np.ma.stack([np.ma.ravel(nc_dict[name]) for name in var_names]), window_size)
+    row = {name: n for n, name in enumerate(var_names)}
+    num = smoothed[[row[pair[1]] for pair in pairs]]
+    den = smoothed[[row[pair[2]] for pair in pairs]]
+    log_lambda = np.log(np.array([pair[4] / pair[3] for pair in pairs]))[:, np.newaxis]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.ma.getdata(num) / np.ma.getdata(den)
+        invalid = np.ma.getmaskarray(num) | np.ma.getmaskarray(den) | ~(ratio > 0)
+        AE = np.log(np.where(invalid, 1., ratio)) / log_lambda
+    AE = np.ma.masked_array(AE, mask=invalid)
+
+    return {pair[0]: AE[n] for n, pair in enumerate(pairs)}
+
+
 def calc_ANGEXP(nc_dict):
-    ## AE_beta_lambda1_lambda2(z) = - np.log(beta1(z)/beta2(z))/np.log(lambda1/lambda2) = np.log(beta1(z)/beta2(z))/np.log(lambda2/lambda1)
-    ## AE_part.ext_lambda1_lambda2(z) = AE_beta_lambda1_lambda2(z) + AE_LR_lambda1_lambda2(z) = np.log(extinction1(z)/extinction2(z)/np.log(lambda2/lambda1)
-    ## with AngstromExp for the Lidar Ratio LR: AE_LR_lambda1_lambda2(z) = - np.log(LR1(z)/LR2(z))/np.log(lambda1/lambda2)
-    ## lambda1 < lambda2
-
-
-    def compute_valid_log(X,Y):
-        ## simple way
-        #ratio = X/Y
-        #ratio[ratio < 0] = np.nan
-        #log_ratio = np.log(ratio)
-
-        ## pythonic way
-        # Compute X / Y while avoiding division by zero
-        with np.errstate(divide='ignore', invalid='ignore'):
-            ratio = np.ma.divide(X, Y)
-
-        # Mask out invalid values in the ratio (e.g., non-positive values)
-        invalid_mask = (ratio <= 0) | ratio.mask
-        ratio = np.ma.masked_array(ratio, mask=invalid_mask)
-
-        # Compute the natural logarithm of the valid values
-        log_ratio = np.ma.log(ratio)
-        return log_ratio
-
-    ##using smoothing window function
-    def smoothed_data(data,window_size):
-        window = np.ones(int(window_size))/float(window_size)
-        smoothed_data = np.convolve(data,window,'same')
-        return smoothed_data
-
-    window_size = 25
-
-    log_klett_355_532 = compute_valid_log(smoothed_data(data=nc_dict['aerBsc_klett_355'],window_size=window_size),smoothed_data(data=nc_dict['aerBsc_klett_532'],window_size=window_size))
-    if 'aerBsc_klett_1064' in nc_dict.keys():
-        log_klett_532_1064 = compute_valid_log(smoothed_data(data=nc_dict['aerBsc_klett_532'],window_size=window_size),smoothed_data(data=nc_dict['aerBsc_klett_1064'],window_size=window_size))
-    log_raman_355_532 = compute_valid_log(smoothed_data(data=nc_dict['aerBsc_raman_355'],window_size=window_size),smoothed_data(data=nc_dict['aerBsc_raman_532'],window_size=window_size))
-    if 'aerBsc_raman_1064' in nc_dict.keys():
-        log_raman_532_1064 = compute_valid_log(smoothed_data(data=nc_dict['aerBsc_raman_532'],window_size=window_size),smoothed_data(data=nc_dict['aerBsc_raman_1064'],window_size=window_size))
-    log_LR_355_532 = compute_valid_log(smoothed_data(data=nc_dict['aerLR_raman_355'],window_size=window_size),smoothed_data(data=nc_dict['aerLR_raman_532'],window_size=window_size))
-    log_Ext_raman_355_532 = compute_valid_log(smoothed_data(data=nc_dict['aerExt_raman_355'],window_size=window_size),smoothed_data(data=nc_dict['aerExt_raman_532'],window_size=window_size))
-
-#    log_klett_355_532 = compute_valid_log(nc_dict['aerBsc_klett_355'],nc_dict['aerBsc_klett_532'])
-#    log_klett_532_1064 = compute_valid_log(nc_dict['aerBsc_klett_532'],nc_dict['aerBsc_klett_1064'])
-#    log_raman_355_532 = compute_valid_log(nc_dict['aerBsc_raman_355'],nc_dict['aerBsc_raman_532'])
-#    log_raman_532_1064 = compute_valid_log(nc_dict['aerBsc_raman_532'],nc_dict['aerBsc_raman_1064'])
-#    log_LR_355_532 = compute_valid_log(nc_dict['aerLR_raman_355'],nc_dict['aerLR_raman_532'])
-#    log_Ext_raman_355_532 = compute_valid_log(nc_dict['aerExt_raman_355'],nc_dict['aerExt_raman_532'])
-
-    AE_beta_355_532_Klett = log_klett_355_532/np.log(532/355)
-    if 'aerBsc_klett_1064' in nc_dict.keys():
-        AE_beta_532_1064_Klett = log_klett_532_1064/np.log(1064/532)
-    AE_beta_355_532_Raman = log_raman_355_532/np.log(532/355)
-    if 'aerBsc_raman_1064' in nc_dict.keys():
-        AE_beta_532_1064_Raman = log_raman_532_1064/np.log(1064/532)
-    AE_LR_355_532_Raman = log_LR_355_532/np.log(532/355)
-    #AE_parExt_355_532_Raman = AE_beta_355_532_Raman + AE_LR_355_532_Raman
-    AE_parExt_355_532_Raman = log_Ext_raman_355_532/np.log(532/355)
-
-
-    nc_dict['AE_beta_355_532_Klett'] = AE_beta_355_532_Klett
-    nc_dict['AE_beta_355_532_Raman'] = AE_beta_355_532_Raman
-    if 'aerBsc_klett_1064' in nc_dict.keys():
-        nc_dict['AE_beta_532_1064_Klett'] = AE_beta_532_1064_Klett
-    if 'aerBsc_raman_1064' in nc_dict.keys():
-        nc_dict['AE_beta_532_1064_Raman'] = AE_beta_532_1064_Raman
-    nc_dict['AE_LR_355_532_Raman'] = AE_LR_355_532_Raman
-    nc_dict['AE_parExt_355_532_Raman'] = AE_parExt_355_532_Raman
-
-#    nc_dict['AE_beta_355_532_Klett'] = smoothed_data(data=AE_beta_355_532_Klett,window_size=window_size)
-#    nc_dict['AE_beta_355_532_Raman'] = smoothed_data(data=AE_beta_355_532_Raman,window_size=window_size)
-#    nc_dict['AE_beta_532_1064_Klett'] = smoothed_data(data=AE_beta_532_1064_Klett,window_size=window_size)
-#    nc_dict['AE_beta_532_1064_Raman'] = smoothed_data(data=AE_beta_532_1064_Raman,window_size=window_size)
-#    nc_dict['AE_LR_355_532_Raman'] = smoothed_data(data=AE_LR_355_532_Raman,window_size=window_size)
-#    nc_dict['AE_parExt_355_532_Raman'] = smoothed_data(data=AE_parExt_355_532_Raman,window_size=window_size)
+    """
+    Description
+    -----------
+    Add the Angstroem exponents of ANGEXP_PAIRS to nc_dict, calculated from
+    the profiles smoothed with smooth_profiles. Pairs with a missing input
+    variable are skipped. For a LazyNcDict nothing is calculated here: the
+    exponents are registered as derived variables and calculated together
+    on first access of one of them.
+
+    Parameters
+    ----------
+    nc_dict: LazyNcDict or dict
+        the profile nc-file, see read_nc_file.
+
+    Usage
+    -----
+    nc_dict_profile = calc_ANGEXP(nc_dict_profile)
+
+    History
+    -------
+    2026-10-18. smooth all profiles in one masked pass; evaluate lazily
+    """
+    pairs = [pair for pair in ANGEXP_PAIRS if pair[1] in nc_dict and pair[2] in nc_dict]
+    if len(pairs) < 1:
+        return nc_dict
+
+    if isinstance(nc_dict, LazyNcDict):
+        nc_dict.register_derived([pair[0] for pair in pairs], lambda d: _compute_ANGEXP(d, pairs))
+    else:
+        nc_dict.update(_compute_ANGEXP(nc_dict, pairs))
     return nc_dict
 
 
@@ -499,57 +1564,351 @@ def write2donefilelist_dict(donefilelist_dict='',
 
     return donefilelist_dict
 
+## keys of a donefile entry, see write2donefilelist_dict
+DONEFILE_KEYS = ('lidar', 'location', 'starttime', 'stoptime', 'last_update', 'lambda', 'image', 'level', 'info',
+                 'nc_zip_file', 'nc_zip_file_size', 'active', 'GDAS', 'GDAS_timestamp', 'lidar_ratio',
+                 'software_version', 'product_type', 'product_starttime', 'product_stoptime')
+
+## formats of the donefile: 'text' is shared with the MATLAB chain, the others are written next to it
+DONEFILE_FORMATS = {'text': '', 'jsonl': '.jsonl', 'sqlite': '.sqlite'}
+
+
+def get_donefile(picassoconfigfile_dict):
+    """
+    Description
+    -----------
+    Path and format of the donefile. The format is set by doneListFormat in
+    the picasso config ('text' by default). The jsonl- and sqlite-files are
+    written next to doneListFile, which is also appended by the MATLAB chain.
+
+    Parameters
+    ----------
+    picassoconfigfile_dict: dict
+        picasso config.
+
+    Returns
+    -------
+    donefile: Path
+    donefile_format: str
+        'text', 'jsonl' or 'sqlite'.
+
+    Usage
+    -----
+    donefile, donefile_format = get_donefile(picassoconfigfile_dict)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    donefile_format = picassoconfigfile_dict.get('doneListFormat') or 'text'
+    if donefile_format not in DONEFILE_FORMATS:
+        raise ValueError(f'doneListFormat must be one of {", ".join(DONEFILE_FORMATS)}, not {donefile_format}')
+    donefile = Path(picassoconfigfile_dict['doneListFile'])
+    return donefile.with_name(donefile.name + DONEFILE_FORMATS[donefile_format]), donefile_format
+
+
+def _append_locked(file, data):
+    ## append data with one write under an exclusive lock, so concurrent writers never interleave
+    with open(file, 'ab') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _write_donefile_sqlite(db_path, entries):
+    ## one row per image, replaced by later runs; seq increases with every write for incremental reading
+    import sqlite3
+    columns = ', '.join(f'"{key}" TEXT' for key in DONEFILE_KEYS if key != 'image')
+    conn = sqlite3.connect(db_path, timeout=60)
+    try:
+        with conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS donefile (seq INTEGER PRIMARY KEY AUTOINCREMENT, image TEXT UNIQUE NOT NULL, {columns})')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_donefile_lidar_product_starttime ON donefile (lidar, product_type, starttime)')
+            placeholders = ', '.join('?' * len(DONEFILE_KEYS))
+            names = ', '.join(f'"{key}"' for key in DONEFILE_KEYS)
+            conn.executemany(f'INSERT OR REPLACE INTO donefile ({names}) VALUES ({placeholders})',
+                             [tuple(str(entry.get(key, '')) for key in DONEFILE_KEYS) for entry in entries])
+    finally:
+        conn.close()
+
+
 def write2donefile(picassoconfigfile_dict,donefilelist_dict):
+    """
+    Description
+    -----------
+    Write the entries of donefilelist_dict to the donefile, each entry
+    exactly once and all of them at once: the text- and jsonl-formats are
+    appended with a single locked write, the sqlite-format in one
+    transaction with one row per image (indexed by lidar, product_type and
+    starttime).
+
+    Parameters
+    ----------
+    picassoconfigfile_dict: dict
+        picasso config, see get_donefile.
+    donefilelist_dict: dict
+        {filename: entry}, see write2donefilelist_dict.
+
+    Usage
+    -----
+    write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
 
-    donefile = picassoconfigfile_dict['doneListFile']
+    History
+    -------
+    2026-10-18. single atomic write; jsonl- and sqlite-format
+    """
+    if not donefilelist_dict:
+        return None
+    donefile, donefile_format = get_donefile(picassoconfigfile_dict)
+    entries = list(donefilelist_dict.values())
+
+    if donefile_format == 'sqlite':
+        _write_donefile_sqlite(donefile, entries)
+    elif donefile_format == 'jsonl':
+        _append_locked(donefile, ''.join(json.dumps({key: str(value) for key, value in entry.items()}) + '\n' for entry in entries).encode())
+    else:
+        lines = []
+        for entry in entries:
+            for keyname in entry:
+                lines.append(f'{keyname}={entry[keyname]}\n')
+            lines.append(f'------\n')
+        _append_locked(donefile, ''.join(lines).encode())
 
-    with open(donefile, 'a') as file:
-        for key in donefilelist_dict.keys():
-            for keyname in donefilelist_dict[key]:
-                file.write(f'{keyname}={donefilelist_dict[key][keyname]}\n')
-            file.write(f'------\n')
-    
     return None
 
 
-def get_LC_from_sql_db(db_path,table_name,wavelength,method,telescope):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+PLOT_MANIFEST_VERSION = 1
 
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    cursor.execute(f"PRAGMA table_info({table_name});")
 
-    query = f"""
-              SELECT * 
-              FROM {table_name}
-              WHERE wavelength = ? AND cali_method LIKE ? AND telescope LIKE ?
-              """
-    df = pd.read_sql_query(query, conn, params=(wavelength,f'%{method}%',f'%{telescope}%'))
-    df['cali_start_time'] = pd.to_datetime(df['cali_start_time'])
-    conn.close()
+class PlotManifest:
+    """
+    Description
+    -----------
+    Record of the figures plotted into one output folder: for every figure
+    the signature of its inputs (level1-files, configs, code) and the
+    written image files. A figure is up to date, if its signature did not
+    change and all its image files still exist.
 
-    return df
+    Parameters
+    ----------
+    manifest_file: str or Path
+        json-file of the manifest, see get_plot_manifest_file.
 
-def get_depol_from_sql_db(db_path,table_name,wavelength):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    Usage
+    -----
+    manifest = PlotManifest(get_plot_manifest_file(outputfolder,get_cache_folder(config_dict)))
+    if not manifest.is_up_to_date(figure_id, signature):
+        ...plot...
+        manifest.record(figure_id, signature, donefilelist_dict.keys())
+    manifest.save()
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    def __init__(self, manifest_file):
+        self.manifest_file = Path(manifest_file)
+        self.figures = {}
+        try:
+            with open(self.manifest_file, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == PLOT_MANIFEST_VERSION:
+                self.figures = manifest['figures']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def is_up_to_date(self, figure_id, signature):
+        entry = self.figures.get(figure_id)
+        if entry is None or entry['signature'] != signature:
+            return False
+        return all(Path(image).is_file() for image in entry['images'])
+
+    def record(self, figure_id, signature, images):
+        self.figures[figure_id] = {'signature': signature, 'images': [str(image) for image in images]}
+
+    def save(self):
+        try:
+            ## write to a temporary file first, so concurrent readers never see a partial file
+            with tempfile.NamedTemporaryFile('w', dir=self.manifest_file.parent, suffix='.json', delete=False) as tmp:
+                json.dump({'version': PLOT_MANIFEST_VERSION, 'figures': self.figures}, tmp, indent=1, sort_keys=True)
+            os.replace(tmp.name, self.manifest_file)
+        except OSError:
+            logging.warning(f'could not write plot manifest {self.manifest_file}')
+
+
+def get_plot_manifest_file(outputfolder, cache_folder):
+    ## one manifest per output folder, kept in the cache folder instead of next to the images
+    name = hashlib.sha1(str(Path(outputfolder).resolve()).encode()).hexdigest()
+    return Path(cache_folder, f'plot_manifest_{name}.json')
+
+
+## one connection per calibration DB and process, see get_calibration_db_connection
+_CALIBRATION_DB_CONNECTIONS = {}
+
+## indexes for the queries of query_LC_from_sql_db and query_depol_from_sql_db
+_CALIBRATION_DB_INDEXES = {
+    'lidar_calibration_constant': 'CREATE INDEX IF NOT EXISTS lc_wavelength_time_index ON lidar_calibration_constant(wavelength, cali_start_time);',
+    'depol_calibration_constant': 'CREATE INDEX IF NOT EXISTS depol_wavelength_time_index ON depol_calibration_constant(wavelength, cali_start_time);',
+}
+
+
+def get_calibration_db_connection(db_path):
+    """
+    Description
+    -----------
+    Return the sqlite connection to the calibration DB. The connection is
+    opened once per DB and reused by all queries. When it is opened, the
+    indexes on (wavelength, cali_start_time) are created if missing.
+
+    Parameters
+    ----------
+    db_path: str
+        path of the calibration DB.
+
+    Usage
+    -----
+    conn = get_calibration_db_connection(db_path)
 
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    cursor.execute(f"PRAGMA table_info({table_name});")
+    History
+    -------
+    2026-10-18. First edition
+    """
+    import sqlite3
+    db_path = str(Path(db_path).resolve())
+    conn = _CALIBRATION_DB_CONNECTIONS.get(db_path)
+    if conn is not None:
+        return conn
+
+    if not Path(db_path).exists():
+        ## sqlite would silently create an empty DB
+        raise FileNotFoundError(f'calibration DB {db_path} not found')
+
+    conn = sqlite3.connect(db_path)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")}
+    for table_name, index_sql in _CALIBRATION_DB_INDEXES.items():
+        if table_name not in tables:
+            continue
+        try:
+            conn.execute(index_sql)
+            conn.commit()
+        except sqlite3.OperationalError:
+            ## read-only or locked DB, the query works without index, only slower
+            logging.warning(f'could not create index on {table_name} in {db_path}')
+    _CALIBRATION_DB_CONNECTIONS[db_path] = conn
+    return conn
+
+
+def close_calibration_db_connections():
+    for conn in _CALIBRATION_DB_CONNECTIONS.values():
+        conn.close()
+    _CALIBRATION_DB_CONNECTIONS.clear()
+
+
+def _query_calibration_db(db_path,table_name,wavelengths,start_time=None,end_time=None,conditions=(),params=()):
+    import pandas as pd
+    ## rows of all wavelengths in one query, split into one DataFrame per wavelength
+    wavelengths = [str(wavelength) for wavelength in wavelengths]
+    where = [f"wavelength IN ({','.join('?'*len(wavelengths))})"]
+    query_params = list(wavelengths)
+    if start_time is not None:
+        where.append('cali_start_time >= ?')
+        query_params.append(pd.Timestamp(start_time).strftime('%Y-%m-%d %H:%M:%S'))
+    if end_time is not None:
+        where.append('cali_start_time <= ?')
+        query_params.append(pd.Timestamp(end_time).strftime('%Y-%m-%d %H:%M:%S'))
+    where.extend(conditions)
+    query_params.extend(params)
 
     query = f"""
-              SELECT * 
+              SELECT *
               FROM {table_name}
-              WHERE wavelength = {wavelength}
+              WHERE {' AND '.join(where)}
+              ORDER BY id
               """
-    df = pd.read_sql_query(query, conn)
+    df = pd.read_sql_query(query, get_calibration_db_connection(db_path), params=query_params)
     df['cali_start_time'] = pd.to_datetime(df['cali_start_time'])
-    conn.close()
 
-    return df
+    return {wavelength: df[df['wavelength'] == wavelength].reset_index(drop=True) for wavelength in wavelengths}
+
+
+def query_LC_from_sql_db(db_path,wavelengths,method,telescope,start_time=None,end_time=None,table_name='lidar_calibration_constant'):
+    """
+    Description
+    -----------
+    Read the lidar constants of several wavelengths with one query. The
+    time window is applied in SQL, on cali_start_time (both ends included).
+
+    Parameters
+    ----------
+    db_path: str
+        path of the calibration DB.
+    wavelengths: list
+        wavelengths, e.g. ['355','532','1064'].
+    method: str
+        part of the calibration method, e.g. 'Klett'.
+    telescope: str
+        part of the telescope name, e.g. 'far'.
+    start_time, end_time: datetime, optional
+        time window of the calibrations.
+
+    Usage
+    -----
+    LC = query_LC_from_sql_db(db_path,['355','532','1064'],'Klett','far',start_time=mdate-timedelta(days=180),end_time=mdate)
+    LC355 = LC['355']
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    return _query_calibration_db(db_path,table_name,wavelengths,start_time,end_time,
+                                 conditions=('cali_method LIKE ?','telescope LIKE ?'),
+                                 params=(f'%{method}%',f'%{telescope}%'))
+
+
+def query_depol_from_sql_db(db_path,wavelengths,start_time=None,end_time=None,table_name='depol_calibration_constant'):
+    """
+    Description
+    -----------
+    Read the depolarization calibration constants of several wavelengths
+    with one query. The time window is applied in SQL, on cali_start_time
+    (both ends included).
+
+    Parameters
+    ----------
+    db_path: str
+        path of the calibration DB.
+    wavelengths: list
+        wavelengths, e.g. ['355','532','1064'].
+    start_time, end_time: datetime, optional
+        time window of the calibrations.
+
+    Usage
+    -----
+    ETA = query_depol_from_sql_db(db_path,['355','532','1064'],start_time=mdate-timedelta(days=180),end_time=mdate)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    return _query_calibration_db(db_path,table_name,wavelengths,start_time,end_time)
+
+
+def get_LC_from_sql_db(db_path,table_name,wavelength,method,telescope):
+    return query_LC_from_sql_db(db_path,[wavelength],method,telescope,table_name=table_name)[str(wavelength)]
+
+def get_depol_from_sql_db(db_path,table_name,wavelength):
+    return query_depol_from_sql_db(db_path,[wavelength],table_name=table_name)[str(wavelength)]
 
 
 def read_from_logbookFile(logbookFile_path):
+    import pandas as pd
 
     if Path(str(logbookFile_path)).exists() == True:
         df = pd.read_csv(logbookFile_path, sep=';', header=0, index_col=None)
@@ -563,124 +1922,310 @@ def read_from_logbookFile(logbookFile_path):
 
 
 
-def get_pollyxt_logbook_files(timestamp,device,raw_folder,output_path):
-    '''
-        This function locates multiple pollyxt logbook-zip files from one day measurements,
-        unzipps the files to output_path
-        and  merge them to one file
-    '''
+def get_pollyxt_logbook_zip_files(timestamp,device,raw_folder):
+    """
+    Description
+    -----------
+    Locate the laserlogbook-zip files of one day in the level0 folder.
+
+    Parameters
+    ----------
+    timestamp: str
+        the date, YYYYMMDD.
+    device: str
+        polly device.
+    raw_folder: str
+        the level0 folder.
+
+    Usage
+    -----
+    zip_files = get_pollyxt_logbook_zip_files(date,device,base_dir)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
     YYYY=timestamp[0:4]
     MM=timestamp[4:6]
+    DD=timestamp[6:8]
     input_path = Path(raw_folder,device,"data_zip",f"{YYYY}{MM}")
-
-    path_exist = Path(input_path)
     print(input_path)
-    
-    if path_exist.exists() == True:
-        
-        ## set the searchpattern for the zipped-nc-files:
-        YYYY=timestamp[0:4]
-        MM=timestamp[4:6]
-        DD=timestamp[6:8]
-        
-        zip_searchpattern = str(YYYY)+'_'+str(MM)+'_'+str(DD)+'*_*laserlogbook*.zip'
-        
-        polly_laserlog_files       = Path(r'{}'.format(input_path)).glob('{}'.format(zip_searchpattern))
-        polly_laserlog_zip_files_list0 = [x for x in polly_laserlog_files if x.is_file()]
-        
-        
-        ## convert type path to type string
-        polly_laserlog_zip_files_list = []
-        for file in polly_laserlog_zip_files_list0:
-            polly_laserlog_zip_files_list.append(str(file))
-        
-        if len(polly_laserlog_zip_files_list) < 1:
-            print('no laserlogbook-files found!')
-            destination_file = None
-            return destination_file
-
-        polly_laserlog_files_list = []
-        to_unzip_list = []
-        for zip_file in polly_laserlog_zip_files_list:
-            unzipped_logtxt = Path(zip_file).name
-            unzipped_logtxt = Path(unzipped_logtxt).stem
-            unzipped_logtxt = Path(output_path,unzipped_logtxt)
-            polly_laserlog_files_list.append(unzipped_logtxt)
-            path = Path(unzipped_logtxt)
-
-            to_unzip_list.append(zip_file)
-
-        
-        ## unzipping
-        if len(to_unzip_list) > 0:
-            for zip_file in to_unzip_list:
-                with ZipFile(zip_file, 'r') as zip_ref:
-                    print("unzipping "+zip_file)
-                    zip_ref.extractall(output_path)
-    
-        ## sort lists
-        polly_laserlog_files_list.sort()
-
-        print("\n"+str(len(polly_laserlog_files_list))+" laserlogfiles found:\n")
-        print(polly_laserlog_files_list)
-        print("\n")
-
-        ## concat the txt files
-        result_file = Path(output_path,"result.txt")
-        with open(result_file, "wb") as outfile:
-            for logf in polly_laserlog_files_list:
-                with open(logf, "rb") as infile:
-                    outfile.write(infile.read())
-                ## delete every single logbook-file from unzipped-folder
-                os.remove(logf)
-
-        laserlog_filename = polly_laserlog_files_list[0]
-        laserlog_filename = Path(laserlog_filename).name
-        laserlog_filename_left = re.split(r'_[0-9][0-9]_[0-9][0-9]_[0-9][0-9]\.nc',laserlog_filename)[0]
-        laserlog_filename = f'{laserlog_filename_left}_00_00_01.nc.laserlogbook.txt'
-        destination_file = Path(output_path,laserlog_filename)
-        
-        # Open the source file in binary mode and read its content
-        with open(result_file, 'rb') as source:
-            # Open the destination file in binary mode and write the content
-            with open(destination_file, 'wb') as destination:
-                destination.write(source.read())
 
-        os.remove(result_file)
-    else:
+    if not input_path.exists():
         print("\nNo laserlogbook was found in {}. Correct path?\n".format(input_path))
-        destination_file = '' 
-    
+        return []
+
+    zip_searchpattern = f'{YYYY}_{MM}_{DD}*_*laserlogbook*.zip'
+    ## sorted by name, i.e. by start time of the measurement
+    zip_files = sorted(str(x) for x in input_path.glob(zip_searchpattern) if x.is_file())
+    if len(zip_files) < 1:
+        print('no laserlogbook-files found!')
+
+    return zip_files
+
+
+def iter_pollyxt_logbook_zip_members(zip_files):
+    """
+    Description
+    -----------
+    Iterate the members of the laserlogbook-zip files in order, as opened
+    file objects, without extracting them to disk.
+
+    Parameters
+    ----------
+    zip_files: list
+        laserlogbook-zip files, see get_pollyxt_logbook_zip_files.
+
+    Usage
+    -----
+    for member in iter_pollyxt_logbook_zip_members(zip_files):
+        data = member.read()
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    for zip_file in zip_files:
+        with ZipFile(zip_file, 'r') as zip_ref:
+            for member_name in sorted(zip_ref.namelist()):
+                if member_name.endswith('/'):
+                    continue
+                with zip_ref.open(member_name) as member:
+                    yield member
+
+
+def get_pollyxt_logbook_files(timestamp,device,raw_folder,output_path):
+    '''
+        This function locates multiple pollyxt logbook-zip files from one day measurements
+        and streams their members into one merged file in output_path
+    '''
+    zip_files = get_pollyxt_logbook_zip_files(timestamp,device,raw_folder)
+    if len(zip_files) < 1:
+        return None
+
+    print("\n"+str(len(zip_files))+" laserlogfiles found:\n")
+    print(zip_files)
+    print("\n")
+
+    laserlog_filename = Path(zip_files[0]).stem
+    laserlog_filename_left = re.split(r'_[0-9][0-9]_[0-9][0-9]_[0-9][0-9]\.nc',laserlog_filename)[0]
+    laserlog_filename = f'{laserlog_filename_left}_00_00_01.nc.laserlogbook.txt'
+    destination_file = Path(output_path,laserlog_filename)
+
+    with open(destination_file, 'wb') as destination:
+        for member in iter_pollyxt_logbook_zip_members(zip_files):
+            shutil.copyfileobj(member, destination, 1024*1024)
+
+    ## the merged file gets the mtime of the newest zip-file, so a
+    ## re-plot of unchanged data can reuse the parsed laserlogbook cache
+    zip_mtime = max(os.stat(zip_file).st_mtime for zip_file in zip_files)
+    os.utime(destination_file, (zip_mtime, zip_mtime))
+
     return destination_file
 
-def read_pollyxt_logbook_file(laserlogbookfile):
-
-    parameters_ls = ['ENERGY_VALUE_1','TEMPERATURE','ExtPyro','Temp1064','Temp1','Temp2','OutsideRH','OutsideT','roof','rain','shutter']
-    parameter_dict = {key: [] for key in parameters_ls}
-    parameter_dict['TIMESTAMP'] = []
-
-    if Path(str(laserlogbookfile)).exists() == True:
-
-        date_pattern = r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'
-        number_pattern = r'-?\d+\.\d+|-?\d+'
-        timestamp_ls = []
-        energy_ls = []
-        with open(laserlogbookfile) as laserlog:
-            for line in laserlog:
-                timestamp = re.findall(date_pattern,line)
-                parameter_dict['TIMESTAMP'].append(timestamp[0])
-                for param in parameters_ls:
-                    if param in line:
-                        value = re.split(f'{param}.',line)[1]
-                        match = re.search(number_pattern, value)
-                        value = match.group()
-                        parameter_dict[param].append(float(value))
-                    else:
-                        parameter_dict[param].append(np.nan)
-    else:
+
+LASERLOGBOOK_PARAMETERS = ['ENERGY_VALUE_1','TEMPERATURE','ExtPyro','Temp1064','Temp1','Temp2','OutsideRH','OutsideT','roof','rain','shutter']
+
+## bump if the parser output changes, so old cache files are not used anymore
+LASERLOGBOOK_PARSER_VERSION = 1
+
+## one match per line (empty if the line has no timestamp), data has to end with a newline
+_LASERLOGBOOK_DATE_PATTERN = re.compile(rb'(?m)^(?:[^\n]*?(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}))?[^\n]*\n')
+## first number behind the parameter name (and one separator character).
+## (?!\d) prevents e.g. 'Temp1' from matching inside 'Temp1064'
+_LASERLOGBOOK_PARAM_PATTERNS = {
+    param: re.compile(re.escape(param.encode()) + rb'(?!\d).[^\n]*?(-?\d+\.\d+|-?\d+)')
+    for param in LASERLOGBOOK_PARAMETERS
+}
+
+
+def get_cache_folder(config_dict=None):
+    """
+    Description
+    -----------
+    Folder for on-disk caches of the visualization, taken from 'cache_folder'
+    of the picasso config. Falls back to pypolly_cache in the system temp
+    folder. The folder is created if it does not exist.
+
+    Parameters
+    ----------
+    config_dict: dict, optional
+        picasso config.
+
+    Usage
+    -----
+    cache_folder = get_cache_folder(config_dict)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    cache_folder = (config_dict or {}).get('cache_folder', '')
+    if not cache_folder:
+        cache_folder = Path(tempfile.gettempdir(), 'pypolly_cache')
+    cache_folder = Path(cache_folder)
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    return cache_folder
+
+
+def _first_match_per_line(pattern, data, line_starts):
+    ## line number and matched number of the first match of pattern in every line
+    matches = list(pattern.finditer(data))
+    if not matches:
+        return np.array([], dtype=np.int64), np.array([], dtype=float)
+    starts = np.array([match.start() for match in matches], dtype=np.int64)
+    values = np.array([match.group(1) for match in matches])
+    lines, first = np.unique(np.searchsorted(line_starts, starts, side='right') - 1, return_index=True)
+    return lines, values[first].astype(float)
+
+
+def parse_pollyxt_logbook(data):
+    """
+    Description
+    -----------
+    Parse the content of a laserlogbook-file. Every parameter is extracted
+    with one compiled pattern over the whole file instead of line by line.
+    Lines without timestamp are skipped.
+
+    Parameters
+    ----------
+    data: bytes
+        content of the laserlogbook-file.
+
+    Usage
+    -----
+    df = parse_pollyxt_logbook(Path(laserlogbookfile).read_bytes())
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    import pandas as pd
+    if not data.endswith(b'\n'):
+        data = data + b'\n'
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord('\n'))
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
+    timestamps = np.array(_LASERLOGBOOK_DATE_PATTERN.findall(data), dtype='S19')
+    has_timestamp = timestamps != b''
+
+    parameter_dict = {}
+    for param, pattern in _LASERLOGBOOK_PARAM_PATTERNS.items():
+        column = np.full(len(line_starts), np.nan)
+        lines, values = _first_match_per_line(pattern, data, line_starts)
+        column[lines] = values
+        parameter_dict[param] = column[has_timestamp]
+    parameter_dict['TIMESTAMP'] = pd.to_datetime(pd.Series(timestamps[has_timestamp].astype(str), dtype=object),
+                                                 format='%Y-%m-%d %H:%M:%S')
+
+    return pd.DataFrame(parameter_dict)
+
+
+def _laserlogbook_cache_key(files):
+    keys = []
+    for file in files:
+        stat = os.stat(file)
+        keys.append(f'{Path(file).resolve()}|{stat.st_mtime_ns}|{stat.st_size}')
+    return ';'.join(keys) + f'|{LASERLOGBOOK_PARSER_VERSION}'
+
+
+def _laserlogbook_cache_file(files, cache_folder):
+    name = hashlib.sha1(';'.join(str(Path(file).resolve()) for file in files).encode()).hexdigest()
+    return Path(cache_folder, f'laserlogbook_{name}.npz')
+
+
+def _read_pollyxt_logbook_cached(files, read_data, cache_folder):
+    import pandas as pd
+    ## parse read_data(), cached as npz-file keyed by path, mtime and size of files
+    if cache_folder is None:
+        return parse_pollyxt_logbook(read_data())
+
+    cache_key = _laserlogbook_cache_key(files)
+    cache_file = _laserlogbook_cache_file(files, cache_folder)
+    try:
+        with np.load(cache_file, allow_pickle=False) as cached:
+            if str(cached['cache_key']) == cache_key:
+                df = pd.DataFrame({key: cached[key] for key in LASERLOGBOOK_PARAMETERS})
+                df['TIMESTAMP'] = pd.to_datetime(cached['TIMESTAMP'])
+                return df
+    except (OSError, KeyError, ValueError):
         pass
 
-    df = pd.DataFrame(parameter_dict)
-    df['TIMESTAMP'] = pd.to_datetime(df['TIMESTAMP'], format='%Y-%m-%d %H:%M:%S')
+    df = parse_pollyxt_logbook(read_data())
+
+    columns = {key: df[key].to_numpy() for key in LASERLOGBOOK_PARAMETERS}
+    columns['TIMESTAMP'] = df['TIMESTAMP'].to_numpy()
+    try:
+        ## write to a temporary file first, so concurrent readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=cache_folder, suffix='.npz', delete=False) as tmp:
+            np.savez(tmp, cache_key=np.array(cache_key), **columns)
+        os.replace(tmp.name, cache_file)
+    except OSError:
+        logging.warning(f'could not write laserlogbook cache {cache_file}')
 
     return df
+
+
+def read_pollyxt_logbook_file(laserlogbookfile, cache_folder=None):
+    """
+    Description
+    -----------
+    Read a laserlogbook-file into a DataFrame with one column per
+    housekeeping parameter and the TIMESTAMP. If cache_folder is given, the
+    parsed columns are stored there as npz-file, keyed by path, mtime and size
+    of the laserlogbook-file, and reused as long as the file is unchanged.
+
+    Parameters
+    ----------
+    laserlogbookfile: str or Path
+        the laserlogbook-file.
+    cache_folder: str or Path, optional
+        folder for the cached columns, see get_cache_folder.
+
+    Usage
+    -----
+    laserlogbook_df = read_pollyxt_logbook_file(laserlogbook,cache_folder=get_cache_folder(config_dict))
+
+    History
+    -------
+    2026-10-18. parse the whole file with compiled patterns; add on-disk cache
+    """
+
+    if not laserlogbookfile or not Path(str(laserlogbookfile)).exists():
+        return parse_pollyxt_logbook(b'')
+
+    return _read_pollyxt_logbook_cached([laserlogbookfile], Path(laserlogbookfile).read_bytes, cache_folder)
+
+
+def read_pollyxt_logbook_zip_files(zip_files, cache_folder=None):
+    """
+    Description
+    -----------
+    Read the laserlogbook of one day straight from the zip-members, without
+    writing a merged laserlogbook-file. Returns the same DataFrame as
+    read_pollyxt_logbook_file. The cache is keyed by path, mtime and size of
+    all zip-files.
+
+    Parameters
+    ----------
+    zip_files: list
+        laserlogbook-zip files, see get_pollyxt_logbook_zip_files.
+    cache_folder: str or Path, optional
+        folder for the cached columns, see get_cache_folder.
+
+    Usage
+    -----
+    zip_files = get_pollyxt_logbook_zip_files(date,device,base_dir)
+    laserlogbook_df = read_pollyxt_logbook_zip_files(zip_files,cache_folder=get_cache_folder(config_dict))
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    if len(zip_files) < 1:
+        return parse_pollyxt_logbook(b'')
+
+    def read_data():
+        return b''.join(member.read() for member in iter_pollyxt_logbook_zip_members(zip_files))
+
+    return _read_pollyxt_logbook_cached(zip_files, read_data, cache_folder)
@@ -0,0 +1,366 @@
+import os
+import io
+import sys
+import json
+import time
+import socket
+import logging
+import argparse
+import tempfile
+import threading
+import itertools
+import contextlib
+import socketserver
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logging.basicConfig(level=logging.WARNING)
+
+## socket of the render server, if not given by --socket
+DEFAULT_SOCKET = os.environ.get('PYPOLLY_RENDER_SOCKET') or \
+    str(Path(tempfile.gettempdir(), f'pypolly_render_{os.getuid()}.sock'))
+
+## fields of a render job (without 'argv') and the options of pypolly_display_all.py they are passed as
+JOB_OPTIONS = {'date': '--date', 'start_date': '--start-date', 'end_date': '--end-date', 'device': '--device',
+               'retrieval': '--retrieval', 'outdir': '--outdir', 'base_dir': '--base_dir',
+               'picasso_config_file': '--picasso_config_file', 'polly_config_file': '--polly_config_file',
+               'donefilelist': '--donefilelist', 'cache_size': '--cache_size'}
+JOB_FLAGS = {'force': '--force', 'profile': '--profile'}
+
+
+def job_to_argv(job):
+    """
+    Description
+    -----------
+    Command line of pypolly_display_all.py for a render job, which is either
+    given as 'argv' or by the fields of JOB_OPTIONS and JOB_FLAGS.
+
+    Parameters
+    ----------
+    job: dict
+        e.g. {'date': '20240506', 'device': 'arielle', 'retrieval': ['RCS'],
+        'picasso_config_file': '...', 'outdir': '...'}
+
+    Usage
+    -----
+    argv = job_to_argv(job)
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    if 'argv' in job:
+        return [str(arg) for arg in job['argv']]
+    argv = []
+    for field, option in JOB_OPTIONS.items():
+        value = job.get(field)
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        argv.append(option)
+        argv.extend(str(value) for value in values)
+    for field, flag in JOB_FLAGS.items():
+        if job.get(field):
+            argv.append(flag)
+    return argv
+
+
+#### worker processes
+
+def _init_worker(picasso_config_file=None):
+    ## load everything a render job needs once per worker: plotting modules, static assets and configs
+    import pypolly_display_all as display_all
+    import pypolly_readout as readout
+    ## attribute access executes the lazy plotting modules (matplotlib, colormaps)
+    display_all.display_3d.plt
+    display_all.display_profiles.plt
+    if picasso_config_file is None:
+        return
+    try:
+        import pypolly_assets as assets
+        config_dict = readout.resolve_picasso_config(picasso_config_file)
+        assets.preload(config_dict['fontname'])
+        if Path(config_dict['pollynet_config_link_file']).is_file():
+            readout.load_config_link_index(config_dict['pollynet_config_link_file'], cache_folder=readout.get_cache_folder(config_dict))
+    except Exception as e:
+        logging.warning(f'warm-up with {picasso_config_file} failed: {e}')
+
+
+def _render(argv, cwd=None):
+    ## one render job in a worker process; relative paths are relative to the client
+    import pypolly_display_all as display_all
+    t0 = time.perf_counter()
+    if cwd is not None:
+        os.chdir(cwd)
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            args, dates = display_all.parse_args(argv)
+    except SystemExit:
+        return {'status': 'invalid', 'error': stderr.getvalue().strip()}
+    ## the worker pool of the server is the parallelism
+    args.jobs = 1
+    try:
+        summary = display_all.plot_quicklooks(args, dates)
+    except Exception as e:
+        logging.exception("An error occurred")
+        return {'status': 'error', 'error': f'{type(e).__name__}: {e}', 'elapsed_s': time.perf_counter() - t0}
+    status = 'failed' if summary['failed'] else 'done'
+    return dict(status=status, elapsed_s=time.perf_counter() - t0, **summary)
+
+
+#### server
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Description
+    -----------
+    Long-lived local render service on a Unix socket. Every connection sends
+    one request as a JSON line and receives one JSON line as response:
+
+    {"op": "render", "argv": [...], "cwd": "..."} or {"op": "render", "date": ..., "device": ..., ...}
+        plot the quicklooks (see job_to_argv) and respond with the status
+        ('done', 'failed', 'invalid', 'error' or 'rejected'), the job_id,
+        the labels of failed figures and the donefile entries.
+    {"op": "ping"}
+        number of workers and of running and queued jobs.
+    {"op": "shutdown"}
+        stop the server after the running jobs.
+
+    The jobs run in a pool of worker processes, which keep matplotlib, the
+    colormaps, fonts, resolved configs and the nc-file cache warm between
+    jobs. At most workers + max_queue jobs are accepted at a time, further
+    ones are rejected. If a worker dies, the pool is replaced and the
+    interrupted jobs are run once more, each in a process of its own.
+
+    Parameters
+    ----------
+    socket_path: str
+        path of the Unix socket.
+    workers: int
+        number of worker processes.
+    max_queue: int
+        number of jobs waiting for a worker.
+    picasso_config_file: str
+        picasso config to warm up the workers with (fonts, config link file).
+
+    Usage
+    -----
+    with RenderServer(socket_path, workers=2) as server:
+        server.serve_forever()
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers=2, max_queue=16, picasso_config_file=None):
+        _remove_stale_socket(socket_path)
+        super().__init__(socket_path, _RenderRequestHandler)
+        self.socket_path = socket_path
+        self.workers = workers
+        self.picasso_config_file = picasso_config_file
+        self.executor = self._new_executor()
+        self.slots = threading.BoundedSemaphore(workers + max_queue)
+        self.job_ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.active_jobs = 0
+
+    def _new_executor(self, workers=None):
+        return ProcessPoolExecutor(max_workers=workers or self.workers, initializer=_init_worker, initargs=(self.picasso_config_file,))
+
+    def _replace_executor(self, broken):
+        ## a worker died (e.g. out of memory), so the pool is broken for all further jobs
+        with self.lock:
+            if self.executor is broken:
+                logging.warning('a worker process died, starting a new pool of workers')
+                self.executor = self._new_executor()
+                broken.shutdown(wait=False)
+
+    def _submit(self, request):
+        ## run the job; if the pool breaks, the job is run once more in a process of its own,
+        ## so only the job, which kills its worker, fails and not the ones running beside it
+        argv = job_to_argv(request)
+        executor = self.executor
+        try:
+            return executor.submit(_render, argv, request.get('cwd')).result()
+        except BrokenProcessPool:
+            self._replace_executor(executor)
+        try:
+            with self._new_executor(workers=1) as executor:
+                return executor.submit(_render, argv, request.get('cwd')).result()
+        except BrokenProcessPool:
+            return {'status': 'error', 'error': 'the worker process died'}
+
+    def render(self, request):
+        job_id = next(self.job_ids)
+        if not self.slots.acquire(blocking=False):
+            return {'status': 'rejected', 'job_id': job_id, 'error': 'queue is full'}
+        with self.lock:
+            self.active_jobs += 1
+        try:
+            response = self._submit(request)
+        except Exception as e:
+            logging.exception("An error occurred")
+            response = {'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+        finally:
+            with self.lock:
+                self.active_jobs -= 1
+            self.slots.release()
+        response['job_id'] = job_id
+        return response
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.socket_path)
+
+
+class _RenderRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as e:
+            self._respond({'status': 'invalid', 'error': f'no JSON request: {e}'})
+            return
+        op = request.get('op', 'render')
+        if op == 'render':
+            self._respond(self.server.render(request))
+        elif op == 'ping':
+            self._respond({'status': 'ok', 'workers': self.server.workers, 'jobs': self.server.active_jobs})
+        elif op == 'shutdown':
+            self._respond({'status': 'ok'})
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            self._respond({'status': 'invalid', 'error': f'unknown op {op}'})
+
+    def _respond(self, response):
+        self.wfile.write((json.dumps(response) + '\n').encode())
+
+
+def _remove_stale_socket(socket_path):
+    ## a socket file without a server behind it is left over from a crashed server
+    if not os.path.exists(socket_path):
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+    except ConnectionRefusedError:
+        os.remove(socket_path)
+    else:
+        raise RuntimeError(f'a render server is already running on {socket_path}')
+
+
+#### client
+
+def request_server(request, socket_path=DEFAULT_SOCKET, timeout=None):
+    """
+    Description
+    -----------
+    Send one request to the render server and return its response.
+
+    Parameters
+    ----------
+    request: dict
+        see RenderServer.
+    socket_path: str
+        socket of the server.
+    timeout: float
+        seconds to wait for the response, None waits until the job is done.
+
+    Usage
+    -----
+    response = request_server({'op': 'render', 'argv': argv, 'cwd': os.getcwd()})
+
+    History
+    -------
+    2026-10-18. First edition
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + '\n').encode())
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError(f'no response from the render server on {socket_path}')
+    return json.loads(line)
+
+
+def get_arg_parser():
+    my_parser = argparse.ArgumentParser(description='Local render server for the quicklooks of pypolly_display_all.py and its client.')
+    my_parser.add_argument('--socket', dest='socket_path',
+                           type=str,
+                           default=DEFAULT_SOCKET,
+                           help=f'the Unix socket of the server. Default is $PYPOLLY_RENDER_SOCKET or {DEFAULT_SOCKET}.')
+    subparsers = my_parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='run the render server.')
+    serve_parser.add_argument('--workers', dest='workers',
+                              type=int,
+                              default=2,
+                              help='number of worker processes. Default is 2.')
+    serve_parser.add_argument('--max_queue', dest='max_queue',
+                              type=int,
+                              default=16,
+                              help='number of jobs waiting for a worker, further jobs are rejected. Default is 16.')
+    serve_parser.add_argument('--picasso_config_file', dest='picasso_config_file',
+                              type=str,
+                              help='picasso config to warm up the workers with (fonts, config link file).')
+
+    render_parser = subparsers.add_parser('render', help='send a render job, all further arguments are the ones of pypolly_display_all.py; prints the response as JSON.')
+    render_parser.add_argument('--fallback', dest='fallback',
+                               action='store_true',
+                               help='plot in this process, if no server is running.')
+
+    subparsers.add_parser('ping', help='check, whether the server is running.')
+    subparsers.add_parser('shutdown', help='stop the server.')
+    return my_parser
+
+
+def main(argv=None):
+    my_parser = get_arg_parser()
+    ## the arguments of pypolly_display_all.py are passed through to the render job
+    args, job_argv = my_parser.parse_known_args(argv)
+    if job_argv and args.command != 'render':
+        my_parser.error(f'unrecognized arguments: {" ".join(job_argv)}')
+
+    if args.command == 'serve':
+        with RenderServer(args.socket_path, workers=args.workers, max_queue=args.max_queue,
+                          picasso_config_file=args.picasso_config_file) as server:
+            print(f'render server listening on {args.socket_path} with {args.workers} workers')
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        return 0
+
+    if args.command == 'render':
+        try:
+            response = request_server({'op': 'render', 'argv': job_argv, 'cwd': os.getcwd()}, socket_path=args.socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not args.fallback:
+                print(f'no render server running on {args.socket_path}', file=sys.stderr)
+                return 2
+            import pypolly_display_all as display_all
+            summary = display_all.plot_quicklooks(*display_all.parse_args(job_argv))
+            response = dict(status='failed' if summary['failed'] else 'done', **summary)
+        print(json.dumps(response))
+        return 0 if response['status'] == 'done' else 1
+
+    try:
+        response = request_server({'op': args.command}, socket_path=args.socket_path, timeout=10)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f'no render server running on {args.socket_path}', file=sys.stderr)
+        return 2
+    print(json.dumps(response))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())